@@ -0,0 +1,30 @@
+"""Add covering index on shipment items for point-in-time inventory
+
+Revision ID: 0b6e2d7f4a93
+Revises: f1a7c3e95b28
+Create Date: 2026-10-16 14:47:12.905518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6e2d7f4a93'
+down_revision: Union[str, None] = 'f1a7c3e95b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_shipment_items_shipment_product_quality', 'shipment_items',
+        ['shipment_id', 'product_name', 'quality'], unique=False,
+        postgresql_include=['quantity']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_shipment_items_shipment_product_quality', table_name='shipment_items')
@@ -0,0 +1,36 @@
+"""Index shipments by (center, shipment_datetime)
+
+Revision ID: 5d81f0b7c2e4
+Revises: 0b6e2d7f4a93
+Create Date: 2026-10-16 16:12:38.402177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d81f0b7c2e4'
+down_revision: Union[str, None] = '0b6e2d7f4a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성합니다 (트랜잭션 밖에서 실행).
+    with op.get_context().autocommit_block():
+        op.create_index('ix_shipments_departure_center_datetime', 'shipments', ['departure_center_id', 'shipment_datetime'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_shipments_arrival_center_datetime', 'shipments', ['arrival_center_id', 'shipment_datetime'], unique=False, postgresql_concurrently=True)
+        # 복합 인덱스의 선두 컬럼이므로 단일 컬럼 인덱스는 더 이상 필요 없습니다.
+        op.drop_index('ix_shipments_departure_center_id', table_name='shipments', postgresql_concurrently=True)
+        op.drop_index('ix_shipments_arrival_center_id', table_name='shipments', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_shipments_arrival_center_id', 'shipments', ['arrival_center_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_shipments_departure_center_id', 'shipments', ['departure_center_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_shipments_arrival_center_datetime', table_name='shipments', postgresql_concurrently=True)
+        op.drop_index('ix_shipments_departure_center_datetime', table_name='shipments', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""Index shipments and contracts by (company, datetime, id) for keyset pagination
+
+Revision ID: 9c4e2a7b1d60
+Revises: 5d81f0b7c2e4
+Create Date: 2026-10-16 18:47:05.913264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2a7b1d60'
+down_revision: Union[str, None] = '5d81f0b7c2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성합니다 (트랜잭션 밖에서 실행).
+    # 키셋 페이지네이션의 ORDER BY (시각 NULLS FIRST, id)와 같은 순서로 만들어 정렬 없이 인덱스 순서로 읽습니다.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_shipments_supplier_company_datetime_id', 'shipments', ['supplier_company_id', 'shipment_datetime', 'id'], unique=False, postgresql_ops={'shipment_datetime': 'NULLS FIRST'}, postgresql_concurrently=True)
+        op.create_index('ix_shipments_receiver_company_datetime_id', 'shipments', ['receiver_company_id', 'shipment_datetime', 'id'], unique=False, postgresql_ops={'shipment_datetime': 'NULLS FIRST'}, postgresql_concurrently=True)
+        op.create_index('ix_contracts_supplier_company_datetime_id', 'contracts', ['supplier_company_id', 'contract_datetime', 'id'], unique=False, postgresql_ops={'contract_datetime': 'NULLS FIRST'}, postgresql_concurrently=True)
+        op.create_index('ix_contracts_receiver_company_datetime_id', 'contracts', ['receiver_company_id', 'contract_datetime', 'id'], unique=False, postgresql_ops={'contract_datetime': 'NULLS FIRST'}, postgresql_concurrently=True)
+        # 복합 인덱스의 선두 컬럼이므로 단일 컬럼 인덱스는 더 이상 필요 없습니다.
+        op.drop_index('ix_shipments_supplier_company_id', table_name='shipments', postgresql_concurrently=True)
+        op.drop_index('ix_shipments_receiver_company_id', table_name='shipments', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_shipments_receiver_company_id', 'shipments', ['receiver_company_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_shipments_supplier_company_id', 'shipments', ['supplier_company_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_contracts_receiver_company_datetime_id', table_name='contracts', postgresql_concurrently=True)
+        op.drop_index('ix_contracts_supplier_company_datetime_id', table_name='contracts', postgresql_concurrently=True)
+        op.drop_index('ix_shipments_receiver_company_datetime_id', table_name='shipments', postgresql_concurrently=True)
+        op.drop_index('ix_shipments_supplier_company_datetime_id', table_name='shipments', postgresql_concurrently=True)
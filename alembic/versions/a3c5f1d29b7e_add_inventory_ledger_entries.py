@@ -0,0 +1,62 @@
+"""Add inventory ledger entries
+
+Revision ID: a3c5f1d29b7e
+Revises: 0ddb501eb5bf
+Create Date: 2026-10-16 09:12:44.218310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5f1d29b7e'
+down_revision: Union[str, None] = '0ddb501eb5bf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('inventory_ledger_entries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('company_id', sa.UUID(), nullable=False),
+    sa.Column('center_id', sa.UUID(), nullable=False),
+    sa.Column('product_name', sa.String(), nullable=False),
+    sa.Column('quality', postgresql.ENUM('A', 'B', 'C', name='productquality', create_type=False), nullable=False),
+    sa.Column('movement_date', sa.Date(), nullable=False),
+    sa.Column('quantity_delta', sa.Integer(), nullable=False),
+    sa.Column('unit_price', sa.Float(), nullable=False),
+    sa.Column('shipment_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['centers.id'], ),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_inventory_ledger_entries_shipment_id'), 'inventory_ledger_entries', ['shipment_id'], unique=False)
+    op.create_index('ix_inventory_ledger_entries_center_product_date', 'inventory_ledger_entries', ['center_id', 'product_name', 'quality', 'movement_date'], unique=False)
+
+    # 기존 출하 데이터로 원장을 채웁니다 (출발 센터 −, 도착 센터 +).
+    op.execute("""
+        INSERT INTO inventory_ledger_entries
+            (id, company_id, center_id, product_name, quality, movement_date, quantity_delta, unit_price, shipment_id)
+        SELECT gen_random_uuid(), s.supplier_company_id, s.departure_center_id, i.product_name, i.quality,
+               CAST(s.shipment_datetime AS DATE), -i.quantity, i.unit_price, s.id
+        FROM shipments s JOIN shipment_items i ON i.shipment_id = s.id
+        WHERE s.departure_center_id IS NOT NULL AND s.supplier_company_id IS NOT NULL
+          AND s.shipment_datetime IS NOT NULL
+        UNION ALL
+        SELECT gen_random_uuid(), s.receiver_company_id, s.arrival_center_id, i.product_name, i.quality,
+               CAST(s.shipment_datetime AS DATE), i.quantity, i.unit_price, s.id
+        FROM shipments s JOIN shipment_items i ON i.shipment_id = s.id
+        WHERE s.arrival_center_id IS NOT NULL AND s.receiver_company_id IS NOT NULL
+          AND s.shipment_datetime IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_inventory_ledger_entries_center_product_date', table_name='inventory_ledger_entries')
+    op.drop_index(op.f('ix_inventory_ledger_entries_shipment_id'), table_name='inventory_ledger_entries')
+    op.drop_table('inventory_ledger_entries')
@@ -0,0 +1,45 @@
+"""Add daily inventory balances summary table
+
+Revision ID: c7d2e8a41f06
+Revises: a3c5f1d29b7e
+Create Date: 2026-10-16 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e8a41f06'
+down_revision: Union[str, None] = 'a3c5f1d29b7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_inventory_balances',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('company_id', sa.UUID(), nullable=False),
+    sa.Column('center_id', sa.UUID(), nullable=False),
+    sa.Column('balance_date', sa.Date(), nullable=False),
+    sa.Column('product_name', sa.String(), nullable=False),
+    sa.Column('quality', postgresql.ENUM('A', 'B', 'C', name='productquality', create_type=False), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('unit_price', sa.Float(), nullable=False),
+    sa.Column('total_price', sa.Float(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['centers.id'], ),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_daily_inventory_balances_company_date', 'daily_inventory_balances', ['company_id', 'balance_date'], unique=False)
+    op.create_index('ux_daily_inventory_balances_center_date_product', 'daily_inventory_balances', ['center_id', 'balance_date', 'product_name', 'quality'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_daily_inventory_balances_center_date_product', table_name='daily_inventory_balances')
+    op.drop_index('ix_daily_inventory_balances_company_date', table_name='daily_inventory_balances')
+    op.drop_table('daily_inventory_balances')
@@ -0,0 +1,39 @@
+"""Track per-center coverage of the daily inventory balances summary
+
+Revision ID: d8f3b61c2a47
+Revises: 9c4e2a7b1d60
+Create Date: 2026-10-17 10:21:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3b61c2a47'
+down_revision: Union[str, None] = '9c4e2a7b1d60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_inventory_balance_coverage',
+    sa.Column('center_id', sa.UUID(), nullable=False),
+    sa.Column('company_id', sa.UUID(), nullable=False),
+    sa.Column('valid_from', sa.Date(), nullable=False),
+    sa.Column('valid_through', sa.Date(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['centers.id'], ),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('center_id')
+    )
+    op.create_index(op.f('ix_daily_inventory_balance_coverage_company_id'), 'daily_inventory_balance_coverage', ['company_id'], unique=False)
+    # 기존 요약 행은 유효 범위가 기록되어 있지 않으므로 비우고 다음 refresh에서 다시 계산합니다.
+    op.execute('DELETE FROM daily_inventory_balances')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_daily_inventory_balance_coverage_company_id'), table_name='daily_inventory_balance_coverage')
+    op.drop_table('daily_inventory_balance_coverage')
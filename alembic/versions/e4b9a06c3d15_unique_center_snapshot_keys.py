@@ -0,0 +1,65 @@
+"""Unique keys on center inventory snapshots and items
+
+Revision ID: e4b9a06c3d15
+Revises: c7d2e8a41f06
+Create Date: 2026-10-16 13:21:05.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9a06c3d15'
+down_revision: Union[str, None] = 'c7d2e8a41f06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 중복 스냅샷 정리: (회사, 센터, 날짜)마다 finalized 우선, 최근 수정본 하나만 남깁니다.
+    op.execute("""
+        CREATE TEMPORARY TABLE duplicate_center_snapshots AS
+        SELECT id FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY company_id, center_id, snapshot_date
+                ORDER BY finalized DESC, updated_at DESC, id
+            ) AS rn
+            FROM center_inventory_snapshots
+        ) ranked
+        WHERE rn > 1
+    """)
+    op.execute("""
+        DELETE FROM center_snapshot_items
+        WHERE center_inventory_snapshot_id IN (SELECT id FROM duplicate_center_snapshots)
+    """)
+    op.execute("""
+        DELETE FROM center_inventory_snapshots
+        WHERE id IN (SELECT id FROM duplicate_center_snapshots)
+    """)
+    op.execute("DROP TABLE duplicate_center_snapshots")
+
+    # 중복 아이템 정리: (스냅샷, 상품명, 품질)마다 최근 수정본 하나만 남깁니다.
+    op.execute("""
+        DELETE FROM center_snapshot_items
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY center_inventory_snapshot_id, product_name, quality
+                    ORDER BY updated_at DESC, id
+                ) AS rn
+                FROM center_snapshot_items
+            ) ranked
+            WHERE rn > 1
+        )
+    """)
+
+    op.create_index('ux_center_inventory_snapshots_company_center_date', 'center_inventory_snapshots', ['company_id', 'center_id', 'snapshot_date'], unique=True)
+    op.create_index('ux_center_snapshot_items_snapshot_product', 'center_snapshot_items', ['center_inventory_snapshot_id', 'product_name', 'quality'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_center_snapshot_items_snapshot_product', table_name='center_snapshot_items')
+    op.drop_index('ux_center_inventory_snapshots_company_center_date', table_name='center_inventory_snapshots')
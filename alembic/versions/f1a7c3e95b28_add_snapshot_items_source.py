@@ -0,0 +1,43 @@
+"""Add items source pointer for compacted center snapshots
+
+Revision ID: f1a7c3e95b28
+Revises: e4b9a06c3d15
+Create Date: 2026-10-16 14:02:51.672310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c3e95b28'
+down_revision: Union[str, None] = 'e4b9a06c3d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('center_inventory_snapshots', sa.Column('items_snapshot_id', sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        'center_inventory_snapshots_items_snapshot_id_fkey',
+        'center_inventory_snapshots', 'center_inventory_snapshots',
+        ['items_snapshot_id'], ['id']
+    )
+    op.create_index(op.f('ix_center_inventory_snapshots_items_snapshot_id'), 'center_inventory_snapshots', ['items_snapshot_id'], unique=False)
+
+
+def downgrade() -> None:
+    # 압축된 스냅샷의 아이템을 원래 스냅샷으로 복원한 뒤 컬럼을 제거합니다.
+    op.execute("""
+        INSERT INTO center_snapshot_items
+            (id, center_inventory_snapshot_id, product_name, quantity, quality, unit_price, total_price)
+        SELECT gen_random_uuid(), s.id, i.product_name, i.quantity, i.quality, i.unit_price, i.total_price
+        FROM center_inventory_snapshots s
+        JOIN center_snapshot_items i ON i.center_inventory_snapshot_id = s.items_snapshot_id
+        WHERE s.items_snapshot_id IS NOT NULL
+    """)
+    op.drop_index(op.f('ix_center_inventory_snapshots_items_snapshot_id'), table_name='center_inventory_snapshots')
+    op.drop_constraint('center_inventory_snapshots_items_snapshot_id_fkey', 'center_inventory_snapshots', type_='foreignkey')
+    op.drop_column('center_inventory_snapshots', 'items_snapshot_id')
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
 from app.database.session import get_db
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile
 from app.profile.models import Profile
 from . import crud, schemas
 
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/centers", tags=["centers"])
 @router.post("/", response_model=schemas.CenterResponse)
 def create_center(
     center_create: schemas.CenterCreate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -58,7 +58,7 @@ def get_center(
 def update_center(
     center_id: UUID,
     center_update: schemas.CenterUpdate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -3,9 +3,10 @@ from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 from app.profile.schemas import ProfileResponse
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile
 from app.database.session import get_db
 from app.profile.models import Profile
+from app.core.auth.cache import invalidate_company, invalidate_profile
 from . import schemas, crud
 from app.company.center.crud import create_center, remove_center
 from app.company.center.schemas import CenterCreate, CenterResponse
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/companies", tags=["companies"])
 @router.post("/create", response_model=schemas.CompanyResponse)
 def create_company(
     company: schemas.CompanyCreate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -43,7 +44,7 @@ def search_companies(
 
 @router.get("/me", response_model=schemas.CompanyResponse)
 def get_my_company(
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -77,7 +78,7 @@ def get_company(
 def update_company(
     company_id: UUID,
     company_update: schemas.CompanyUpdate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -105,13 +106,15 @@ def update_company(
             detail="해당 회사에 대한 수정 권한이 없습니다"
         )
     
-    return crud.update_company(db, company_id, company_update)
+    updated_company = crud.update_company(db, company_id, company_update)
+    invalidate_company(company_id)
+    return updated_company
 
 @router.put("/{company_id}/owner", response_model=schemas.CompanyResponse)
 def update_company_owner(
     company_id: UUID,
     owner_update: schemas.CompanyOwnerUpdate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -129,13 +132,15 @@ def update_company_owner(
             detail="해당 회사에 대한 소유권 변경 권한이 없습니다"
         )
     
-    return crud.update_company_owner(db, company_id, owner_update.new_owner_id)
+    updated_company = crud.update_company_owner(db, company_id, owner_update.new_owner_id)
+    invalidate_company(company_id)
+    return updated_company
 
 @router.post("/{company_id}/users", response_model=ProfileResponse)
 def add_company_user(
     company_id: UUID,
     user_add: schemas.CompanyUserAdd,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -165,12 +170,14 @@ def add_company_user(
             detail="회사 타입과 사용자 프로필 타입이 일치하지 않습니다"
         )
 
-    return crud.add_company_user(db, company_id, user_add.profile_id, user_add.role)
+    added_profile = crud.add_company_user(db, company_id, user_add.profile_id, user_add.role)
+    invalidate_profile(user_add.profile_id)
+    return added_profile
 
 @router.get("/{company_id}/users", response_model=List[ProfileResponse])
 def get_company_users(
     company_id: UUID,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -194,7 +201,7 @@ def get_company_users(
 def remove_company_user(
     company_id: UUID,
     user_id: UUID,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -212,13 +219,15 @@ def remove_company_user(
             detail="해당 회사에 대한 사용자 제거 권한이 없습니다"
         )
     
-    return crud.remove_company_user(db, company_id, user_id)
+    removed_profile = crud.remove_company_user(db, company_id, user_id)
+    invalidate_profile(user_id)
+    return removed_profile
 
 @router.post("/{company_id}/centers", response_model=CenterResponse)
 def add_company_center(
     company_id: UUID,
     center_add: CenterCreate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile
 from app.database.session import get_db
 from app.profile.models import Profile
 from app.company.common import crud as common_crud
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/companies/retail", tags=["retail"])
 def create_retail_company_detail(
     company_id: UUID,
     detail: schemas.RetailCompanyDetailCreate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -38,7 +38,7 @@ def create_retail_company_detail(
 def update_retail_company_detail(
     company_id: UUID,
     detail_update: schemas.RetailCompanyDetailUpdate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -1,29 +1,55 @@
 from datetime import date
-from typing import List
-from fastapi import APIRouter, Depends, Query
+from typing import Iterable, List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.company.inventory_snapshot.schemas import (
     DailyInventorySnapshot,
     UpdateDailyInventorySnapshotRequest,
-    CenterInventorySnapshot
+    CenterInventorySnapshot,
+    PointInTimeInventory
 )
 from app.company.inventory_snapshot.crud import (
     get_daily_company_inventory_snapshot,
     get_daily_company_inventory_snapshots_by_date_range,
+    rebuild_company_inventory_snapshots,
+    refresh_daily_inventory_balances,
+    get_daily_company_inventory_balance,
+    get_point_in_time_inventory_async,
     get_daily_center_inventory_snapshot,
     create_daily_center_inventory_snapshot,
     update_daily_inventory_snapshot,
-    finalize_center_inventory_snapshot
+    finalize_center_inventory_snapshot,
+    finalize_company_inventory_snapshots
 )
-from app.database import get_db
-from app.core.auth.dependencies import get_current_user
-from app.profile.dependencies import get_current_profile
+from app.company.inventory_snapshot.materialization import materialization_queue
+from app.database import get_db, get_async_db
+from app.transactions.common.models import ProductQuality
+from app.core.auth.dependencies import get_current_user, get_current_user_async
+from app.profile.dependencies import get_authenticated_profile
 from app.profile.models import Profile
 from uuid import UUID
 
 router = APIRouter(prefix="/inventory-snapshots", tags=["inventory-snapshots"])
 
 
+def _stream_json_array(snapshots: Iterable[DailyInventorySnapshot]):
+    """스냅샷 목록을 하루치씩 직렬화해 JSON 배열로 내보냅니다."""
+    yield "["
+    for index, snapshot in enumerate(snapshots):
+        if index:
+            yield ","
+        yield snapshot.model_dump_json()
+    yield "]"
+
+
+def _schedule_materialization(background_tasks: BackgroundTasks) -> None:
+    """조회 중 계산만 한 스냅샷이 있으면 응답 후 저장하도록 예약합니다."""
+    if materialization_queue.pending():
+        background_tasks.add_task(materialization_queue.drain)
+
+
 @router.post("/center/{center_id}/finalize/{target_date}", response_model=CenterInventorySnapshot)
 def finalize_center_inventory(
     center_id: UUID,
@@ -43,33 +69,43 @@ def finalize_center_inventory(
 
 
 
+@router.post("/company/{company_id}/finalize", response_model=List[DailyInventorySnapshot])
+def finalize_company_inventory(
+    company_id: UUID,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    특정 기간의 회사 전체 센터 스냅샷을 한 번에 finalized 상태로 변경합니다.
+    """
+    return finalize_company_inventory_snapshots(db, start_date, end_date, company_id)
+
+
 @router.get("/company/{company_id}/date/{target_date}", response_model=DailyInventorySnapshot)
 def get_company_inventory_snapshot(
     company_id: UUID,
     target_date: date,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """
     특정 날짜의 회사 전체 인벤토리 스냅샷을 조회합니다.
+    누락된 스냅샷의 재생 계산이 CPU를 쓰므로 이벤트 루프가 아닌 스레드 풀에서 실행되도록 동기 라우트로 둡니다.
     """
-    print(f"=== API 호출: company_id={company_id}, target_date={target_date} ===")
-    
-    try:
-        result = get_daily_company_inventory_snapshot(db, target_date, company_id)
-        print(f"결과: centers 개수={len(result.centers) if result else 0}")
-        
-        if not result or not result.centers:
-            from fastapi import HTTPException, status
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="회사 인벤토리 스냅샷을 찾을 수 없습니다.")
-        return result
-    except Exception as e:
-        print(f"에러 발생: {e}")
-        raise
+    result = get_daily_company_inventory_snapshot(db, target_date, company_id)
+    _schedule_materialization(background_tasks)
+    if not result or not result.centers:
+        from fastapi import HTTPException, status
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="회사 인벤토리 스냅샷을 찾을 수 없습니다.")
+    return result
 
 @router.get("/company/{company_id}/date-range", response_model=List[DailyInventorySnapshot])
 def get_company_inventory_snapshots_by_date_range(
     company_id: UUID,
+    background_tasks: BackgroundTasks,
     start_date: date = Query(...),
     end_date: date = Query(...),
     db: Session = Depends(get_db),
@@ -77,35 +113,100 @@ def get_company_inventory_snapshots_by_date_range(
 ):
     """
     특정 기간의 회사 전체 인벤토리 스냅샷 목록을 조회합니다.
+    조회는 기간 전체를 한 번에 처리하고(스레드 풀에서 실행), 응답은 하루치씩 스트리밍합니다.
+    """
+    result = get_daily_company_inventory_snapshots_by_date_range(db, start_date, end_date, company_id)
+    _schedule_materialization(background_tasks)
+    return StreamingResponse(
+        _stream_json_array(result), media_type="application/json", background=background_tasks
+    )
+
+@router.post("/company/{company_id}/rebuild", response_model=List[DailyInventorySnapshot])
+def rebuild_company_inventory(
+    company_id: UUID,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    특정 기간의 회사 전체 센터 스냅샷을 출하 데이터로부터 다시 생성합니다.
+    finalized 스냅샷은 유지됩니다.
     """
+    rebuild_company_inventory_snapshots(db, start_date, end_date, company_id)
     result = get_daily_company_inventory_snapshots_by_date_range(db, start_date, end_date, company_id)
-    return result or []
+    return StreamingResponse(_stream_json_array(result), media_type="application/json")
+
+@router.post("/company/{company_id}/summary/refresh")
+def refresh_company_inventory_summary(
+    company_id: UUID,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    일별 재고 요약이 특정 기간을 덮도록 재고 원장으로부터 필요한 날짜만 계산합니다.
+    """
+    refreshed_rows = refresh_daily_inventory_balances(db, start_date, end_date, company_id)
+    return {"refreshed_rows": refreshed_rows}
+
+@router.get("/company/{company_id}/summary/{target_date}", response_model=DailyInventorySnapshot)
+def get_company_inventory_summary(
+    company_id: UUID,
+    target_date: date,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    일별 재고 요약에서 특정 날짜의 회사 전체 재고를 조회합니다. 스냅샷을 생성하지 않습니다.
+    요약이 없는 센터는 원장으로 계산하므로 스레드 풀에서 실행되도록 동기 라우트로 둡니다.
+    """
+    return get_daily_company_inventory_balance(db, target_date, company_id)
 
 @router.get("/center/{center_id}/date/{target_date}", response_model=CenterInventorySnapshot)
 def get_center_inventory_snapshot(
     center_id: UUID,
     target_date: date,
+    background_tasks: BackgroundTasks,
     company_id: UUID = Query(...),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """
     특정 날짜의 센터 인벤토리 스냅샷을 조회합니다.
+    재생 계산이 이벤트 루프를 막지 않도록 스레드 풀에서 실행되는 동기 라우트로 둡니다.
     """
     result = get_daily_center_inventory_snapshot(db, target_date, company_id, center_id)
+    _schedule_materialization(background_tasks)
     if not result:
         from fastapi import HTTPException, status
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="센터 인벤토리 스냅샷을 찾을 수 없습니다.")
     return result
 
+@router.get("/center/{center_id}/point-in-time/{target_date}", response_model=PointInTimeInventory)
+async def get_center_point_in_time_inventory(
+    center_id: UUID,
+    target_date: date,
+    company_id: UUID = Query(...),
+    product_name: Optional[str] = Query(None),
+    quality: Optional[ProductQuality] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
+):
+    """
+    스냅샷을 만들지 않고 출하 이력만으로 특정 날짜 종료 시점의 센터 재고를 조회합니다.
+    product_name, quality로 특정 상품만 조회할 수 있습니다.
+    """
+    return await get_point_in_time_inventory_async(db, target_date, company_id, center_id, product_name, quality)
+
 @router.post("/center/{center_id}/date/{target_date}", response_model=CenterInventorySnapshot)
 def create_center_inventory_snapshot(
     center_id: UUID,
     target_date: date,
     company_id: UUID = Query(...),
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     특정 날짜의 센터 인벤토리 스냅샷을 생성합니다.
@@ -123,8 +224,7 @@ def update_company_inventory_snapshot(
     target_date: date,
     update_request: UpdateDailyInventorySnapshotRequest,
     db: Session = Depends(get_db),
-    current_user = Depends(get_current_user),
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     contract_id: UUID = Query(None)
 ):
     """
@@ -0,0 +1,93 @@
+"""
+finalized 스냅샷 응답의 프로세스 내 LRU 캐시.
+
+finalized 스냅샷은 바뀌지 않으므로 (center_id, 날짜)별 직렬화된 응답을 보관해 두고 DB 조회 없이 돌려줍니다.
+스냅샷이 수정되거나 finalized가 해제되면 해당 키를 무효화해야 합니다.
+무효화는 즉시 한 번, 트랜잭션 커밋 후 한 번 더 합니다. 커밋 전에 다른 요청이 이전 finalized 스냅샷을
+다시 캐시에 넣어도 커밋 후 무효화가 지우므로, 오래된 응답이 남지 않습니다.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.company.inventory_snapshot.models import CenterInventorySnapshot as CenterInventorySnapshotModel
+from app.company.inventory_snapshot.schemas import CenterInventorySnapshot
+
+
+class FinalizedSnapshotCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+
+    def get(self, center_id: UUID, snapshot_date: date) -> Optional[CenterInventorySnapshot]:
+        key = (center_id, snapshot_date)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            self._entries.move_to_end(key)
+        return CenterInventorySnapshot.model_validate_json(payload)
+
+    def put(self, center_id: UUID, snapshot_date: date, snapshot: CenterInventorySnapshot) -> None:
+        if self.maxsize <= 0:
+            return
+        key = (center_id, snapshot_date)
+        payload = snapshot.model_dump_json()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, center_id: UUID, snapshot_date: date) -> None:
+        with self._lock:
+            self._entries.pop((center_id, snapshot_date), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+finalized_snapshot_cache = FinalizedSnapshotCache(settings.FINALIZED_SNAPSHOT_CACHE_SIZE)
+
+
+_PENDING_INVALIDATIONS = "finalized_snapshot_cache_invalidations"
+
+
+def invalidate_after_commit(db: Session, center_id: UUID, snapshot_date: date) -> None:
+    """캐시에서 바로 제거하고, db의 트랜잭션이 커밋된 뒤 한 번 더 제거하도록 예약합니다."""
+    finalized_snapshot_cache.invalidate(center_id, snapshot_date)
+    db.info.setdefault(_PENDING_INVALIDATIONS, set()).add((center_id, snapshot_date))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_snapshots(session):
+    for center_id, snapshot_date in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        finalized_snapshot_cache.invalidate(center_id, snapshot_date)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session, previous_transaction):
+    if not session.in_transaction():
+        session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+@event.listens_for(CenterInventorySnapshotModel, "after_update")
+def _invalidate_updated_snapshot(mapper, connection, target):
+    """ORM으로 스냅샷이 수정(finalized 해제 포함)되면 캐시에서 제거하고, 커밋 후 다시 제거합니다."""
+    db = object_session(target)
+    if db is None:
+        finalized_snapshot_cache.invalidate(target.center_id, target.snapshot_date)
+        return
+    invalidate_after_commit(db, target.center_id, target.snapshot_date)
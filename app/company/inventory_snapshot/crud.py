@@ -1,53 +1,40 @@
-from datetime import date, timedelta
+import hashlib
+import threading
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, time, timedelta
 from typing import List, Tuple, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, cast, Date, and_, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, or_, case, insert, update, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from app.company.inventory_snapshot.schemas import (
     DailyInventorySnapshot, CenterInventorySnapshot, InventorySnapshotItem,
+    PointInTimeInventory, PointInTimeInventoryItem,
     UpdateDailyInventorySnapshotRequest, InitialCenterInventoryRequest
 )
 from app.company.inventory_snapshot.models import CenterInventorySnapshot as CenterInventorySnapshotModel
 from app.company.inventory_snapshot.models import CenterInventorySnapshotItem as CenterInventorySnapshotItemModel
+from app.company.inventory_snapshot.models import (
+    InventoryLedgerEntry, DailyInventoryBalance, DailyInventoryBalanceCoverage
+)
 from app.transactions.shipment.models import Shipment, ShipmentItem
+from app.transactions.common.models import ProductQuality
 from app.company.center.models import Center
+from app.company.inventory_snapshot import kernel as inventory_kernel
+from app.company.inventory_snapshot.materialization import materialization_queue
+from app.company.inventory_snapshot.cache import finalized_snapshot_cache, invalidate_after_commit
 from uuid import UUID
 import uuid
 
-def get_daily_company_inventory_snapshot(
-    db: Session,
-    target_date: date,
-    company_id: UUID
-) -> DailyInventorySnapshot:
-    # 해당 날짜의 모든 센터 스냅샷 조회
-    center_snapshots = db.query(CenterInventorySnapshotModel).filter(
-        CenterInventorySnapshotModel.snapshot_date == target_date,
-        CenterInventorySnapshotModel.company_id == company_id
-    ).all()
-
-    # 스냅샷이 없으면 자동으로 생성
-    if not center_snapshots:
-        # 회사의 모든 센터 조회
-        centers = db.query(Center).filter(Center.company_id == company_id).all()
-        
-        # 각 센터에 대해 스냅샷 생성
-        for center in centers:
-            create_daily_center_inventory_snapshot(db, target_date, company_id, center.id, None)
-        
-        # 다시 조회
-        center_snapshots = db.query(CenterInventorySnapshotModel).filter(
-            CenterInventorySnapshotModel.snapshot_date == target_date,
-            CenterInventorySnapshotModel.company_id == company_id
-        ).all()
-
-    # 센터별 아이템 조회
-    center_snapshot_dict = {}
-    for snapshot in center_snapshots:
-        items = db.query(CenterInventorySnapshotItemModel).filter(
-            CenterInventorySnapshotItemModel.center_inventory_snapshot_id == snapshot.id
-        ).all()
-
-        # 아이템 정보 변환
-        snapshot_items = [
+def _build_center_snapshot(snapshot: CenterInventorySnapshotModel, items) -> CenterInventorySnapshot:
+    """스냅샷 모델과 아이템 목록을 응답 스키마로 변환합니다."""
+    return CenterInventorySnapshot(
+        center_id=snapshot.center_id,
+        center_name=snapshot.center.name,
+        total_quantity=snapshot.total_quantity,
+        total_price=snapshot.total_price,
+        items=[
             InventorySnapshotItem(
                 product_name=item.product_name,
                 quality=item.quality,
@@ -56,20 +43,40 @@ def get_daily_company_inventory_snapshot(
                 total_price=item.total_price
             ) for item in items
         ]
+    )
 
-        # 센터 정보 변환
-        center_snapshot_dict[snapshot.center_id] = CenterInventorySnapshot(
-            center_id=snapshot.center_id,
-            center_name=snapshot.center.name,  # relationship을 통해 center 정보 접근
-            total_quantity=snapshot.total_quantity,
-            total_price=snapshot.total_price,
-            items=snapshot_items
+def _load_company_snapshots(
+    db: Session,
+    company_id: UUID,
+    start_date: date,
+    end_date: date
+) -> List[CenterInventorySnapshotModel]:
+    """
+    회사의 [start_date, end_date] 구간 센터 스냅샷을 센터 이름(join)과 아이템(selectin)까지
+    최대 두 번의 쿼리로 조회합니다.
+    """
+    return db.query(CenterInventorySnapshotModel).options(
+        joinedload(CenterInventorySnapshotModel.center),
+        selectinload(CenterInventorySnapshotModel.items),
+        selectinload(CenterInventorySnapshotModel.items_source).selectinload(CenterInventorySnapshotModel.items)
+    ).filter(
+        and_(
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.snapshot_date >= start_date,
+            CenterInventorySnapshotModel.snapshot_date <= end_date
         )
+    ).order_by(CenterInventorySnapshotModel.snapshot_date).all()
 
-    return DailyInventorySnapshot(
-        snapshot_date=target_date,
-        centers=list(center_snapshot_dict.values())
-    )
+def get_daily_company_inventory_snapshot(
+    db: Session,
+    target_date: date,
+    company_id: UUID
+) -> DailyInventorySnapshot:
+    """
+    특정 날짜의 회사 스냅샷을 조회합니다. 저장되지 않은 센터는 쓰기 없이 계산해서 반환하고,
+    저장은 materialization 큐에 맡깁니다.
+    """
+    return get_daily_company_inventory_snapshots_by_date_range(db, target_date, target_date, company_id)[0]
 
 def get_daily_company_inventory_snapshots_by_date_range(
     db: Session,
@@ -77,15 +84,67 @@ def get_daily_company_inventory_snapshots_by_date_range(
     end_date: date,
     company_id: UUID
 ) -> List[DailyInventorySnapshot]:
-    snapshots = []
-    current_date = start_date
-    
-    while current_date <= end_date:
-        snapshot = get_daily_company_inventory_snapshot(db, current_date, company_id)
-        snapshots.append(snapshot)
-        current_date = current_date.replace(day=current_date.day + 1)
-    
-    return snapshots
+    """
+    [start_date, end_date] 구간의 회사 스냅샷을 한 번에 조회합니다.
+    누락된 (센터, 날짜)가 있는 센터는 센터별로 한 번의 재생으로 계산하고(쓰기 없음),
+    계산한 (센터, 날짜)는 materialization 큐에 등록합니다. 일별 요약이 덮는 (센터, 날짜)는 요약에서 응답합니다.
+    """
+    if start_date > end_date:
+        return []
+
+    day_count = (end_date - start_date).days + 1
+    snapshot_dates = [start_date + timedelta(days=offset) for offset in range(day_count)]
+    company_centers = db.query(Center).filter(Center.company_id == company_id).all()
+
+    # 모든 (센터, 날짜)가 finalized 캐시에 있으면 스냅샷 테이블을 읽지 않음
+    cached = {
+        (center.id, snapshot_date): finalized_snapshot_cache.get(center.id, snapshot_date)
+        for center in company_centers
+        for snapshot_date in snapshot_dates
+    }
+    if company_centers and all(cached.values()):
+        return [
+            DailyInventorySnapshot(
+                snapshot_date=snapshot_date,
+                centers=[cached[(center.id, snapshot_date)] for center in company_centers]
+            )
+            for snapshot_date in snapshot_dates
+        ]
+
+    center_snapshots = _load_company_snapshots(db, company_id, start_date, end_date)
+
+    snapshots_by_date = defaultdict(list)
+    snapshot_counts = defaultdict(int)
+    for snapshot in center_snapshots:
+        center_snapshot = _build_center_snapshot(snapshot, snapshot.resolved_items)
+        if snapshot.finalized:
+            finalized_snapshot_cache.put(snapshot.center_id, snapshot.snapshot_date, center_snapshot)
+        snapshots_by_date[snapshot.snapshot_date].append(center_snapshot)
+        snapshot_counts[snapshot.center_id] += 1
+
+    # 저장된 스냅샷이 없는 (센터, 날짜)는 일별 요약이 덮고 있으면 요약에서 응답
+    centers = [center for center in company_centers if snapshot_counts[center.id] < day_count]
+    balance_snapshots = _load_daily_balance_snapshots(db, start_date, end_date, company_id, centers)
+    for (center_id, snapshot_date), center_snapshot in balance_snapshots.items():
+        if any(existing.center_id == center_id for existing in snapshots_by_date[snapshot_date]):
+            continue
+        snapshots_by_date[snapshot_date].append(center_snapshot)
+        snapshot_counts[center_id] += 1
+
+    # 그래도 누락된 날짜가 있는 센터만 센터별로 한 번씩 계산
+    centers = [center for center in centers if snapshot_counts[center.id] < day_count]
+    for center in centers:
+        computed = compute_center_inventory_snapshots(db, start_date, end_date, company_id, center)
+        for snapshot_date, center_snapshot in computed.items():
+            if any(existing.center_id == center.id for existing in snapshots_by_date[snapshot_date]):
+                continue
+            snapshots_by_date[snapshot_date].append(center_snapshot)
+            materialization_queue.enqueue(company_id, center.id, snapshot_date)
+
+    return [
+        DailyInventorySnapshot(snapshot_date=snapshot_date, centers=snapshots_by_date[snapshot_date])
+        for snapshot_date in snapshot_dates
+    ]
 
 def get_daily_center_inventory_snapshot(
     db: Session,
@@ -93,35 +152,84 @@ def get_daily_center_inventory_snapshot(
     company_id: UUID,
     center_id: UUID
 ) -> Optional[CenterInventorySnapshot]:
-    snapshot = db.query(CenterInventorySnapshotModel).filter(
+    """
+    특정 날짜의 센터 스냅샷을 조회합니다. 저장된 스냅샷이 없으면 일별 요약에서, 요약도 없으면 쓰기 없이 계산해서
+    반환하고 저장은 materialization 큐에 맡깁니다. finalized 스냅샷은 캐시에서 바로 반환합니다.
+    """
+    cached = finalized_snapshot_cache.get(center_id, target_date)
+    if cached:
+        return cached
+
+    snapshot = db.query(CenterInventorySnapshotModel).options(
+        joinedload(CenterInventorySnapshotModel.center),
+        selectinload(CenterInventorySnapshotModel.items),
+        selectinload(CenterInventorySnapshotModel.items_source).selectinload(CenterInventorySnapshotModel.items)
+    ).filter(
         CenterInventorySnapshotModel.snapshot_date == target_date,
         CenterInventorySnapshotModel.company_id == company_id,
         CenterInventorySnapshotModel.center_id == center_id
     ).first()
-    if not snapshot:
-        return create_daily_center_inventory_snapshot(db, target_date, company_id, center_id)
+    if snapshot:
+        center_snapshot = _build_center_snapshot(snapshot, snapshot.resolved_items)
+        if snapshot.finalized:
+            finalized_snapshot_cache.put(center_id, target_date, center_snapshot)
+        return center_snapshot
 
-    # 아이템 변환
-    items = db.query(CenterInventorySnapshotItemModel).filter(
-        CenterInventorySnapshotItemModel.center_inventory_snapshot_id == snapshot.id
-    ).all()
-    snapshot_items = [
-        InventorySnapshotItem(
-            product_name=item.product_name,
-            quality=item.quality,
-            quantity=item.quantity,
-            unit_price=item.unit_price,
-            total_price=item.total_price
-        ) for item in items
-    ]
+    center = db.query(Center).filter(Center.id == center_id).first()
+    if not center:
+        return None
 
-    return CenterInventorySnapshot(
-        center_id=snapshot.center_id,
-        center_name=snapshot.center.name,
-        total_quantity=snapshot.total_quantity,
-        total_price=snapshot.total_price,
-        items=snapshot_items
+    balance_snapshot = _load_daily_balance_snapshots(db, target_date, target_date, company_id, [center]).get(
+        (center_id, target_date)
     )
+    if balance_snapshot:
+        return balance_snapshot
+
+    computed = compute_center_inventory_snapshots(db, target_date, target_date, company_id, center)
+    materialization_queue.enqueue(company_id, center_id, target_date)
+    return computed[target_date]
+
+# PostgreSQL이 아닌 환경(SQLite 테스트 등)에서 쓰는 프로세스 내 센터 잠금
+_local_center_locks = defaultdict(threading.RLock)
+_local_center_locks_guard = threading.Lock()
+
+def center_lock_key(company_id: UUID, center_id: UUID) -> int:
+    """(회사, 센터) 쌍을 PostgreSQL advisory lock 키(부호 있는 64비트 정수)로 변환합니다."""
+    digest = hashlib.blake2b(f"{company_id}:{center_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+@contextmanager
+def center_snapshot_lock(db: Session, company_id: UUID, center_id: UUID):
+    """
+    (회사, 센터) 단위로 스냅샷 재생을 직렬화합니다.
+    PostgreSQL에서는 트랜잭션 범위 advisory lock(pg_advisory_xact_lock)을 잡으며 커밋/롤백 시 풀립니다.
+    그 외 DB에서는 프로세스 내 잠금을 사용합니다.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(center_lock_key(company_id, center_id))))
+        yield
+        return
+
+    with _local_center_locks_guard:
+        lock = _local_center_locks[(company_id, center_id)]
+    with lock:
+        yield
+
+def _count_center_snapshots(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_id: UUID
+) -> int:
+    return db.query(func.count(CenterInventorySnapshotModel.id)).filter(
+        and_(
+            CenterInventorySnapshotModel.center_id == center_id,
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.snapshot_date >= start_date,
+            CenterInventorySnapshotModel.snapshot_date <= end_date
+        )
+    ).scalar()
 
 def create_daily_center_inventory_snapshot(
     db: Session,
@@ -129,308 +237,618 @@ def create_daily_center_inventory_snapshot(
     company_id: UUID,
     center_id: UUID,
     creator_id: UUID = None,
-    contract_id: UUID = None
+    contract_id: UUID = None,
+    from_date: Optional[date] = None
 ) -> CenterInventorySnapshot:
     """
-    가장 최근 finalized된 스냅샷부터 매일 생성하거나, finalized가 없으면 가장 오래된 shipment부터 매일 생성합니다.
+    target_date 이전의 가장 최근 finalized 스냅샷을 체크포인트로 삼아 그 이후만 매일 생성하고,
+    finalized가 없으면 가장 오래된 shipment(또는 from_date 중 이른 날)부터 매일 생성합니다.
     shipment가 없으면 기본 스냅샷을 생성합니다.
     """
-    print(f"=== create_daily_center_inventory_snapshot 호출: center_id={center_id}, target_date={target_date} ===")
-    
-    # 가장 최근 finalized된 스냅샷 조회
+    center = db.query(Center).filter(Center.id == center_id).first()
+    if not center:
+        return None
+
+    # 같은 센터의 재생은 한 번에 하나만: 먼저 시작한 재생이 끝나면 그 결과를 재사용
+    with center_snapshot_lock(db, company_id, center_id):
+        required_start = min(from_date or target_date, target_date)
+        required_days = (target_date - required_start).days + 1
+        if _count_center_snapshots(db, required_start, target_date, company_id, center_id) == required_days:
+            # 다른 요청이 이미 만든 스냅샷 재사용 (advisory lock 해제를 위해 트랜잭션 종료)
+            db.commit()
+        else:
+            _replay_center_snapshots_until(db, target_date, company_id, center_id, from_date)
+
+    # target_date의 스냅샷 조회
+    target_snapshot = db.query(CenterInventorySnapshotModel).filter(
+        and_(
+            CenterInventorySnapshotModel.snapshot_date == target_date,
+            CenterInventorySnapshotModel.center_id == center_id,
+            CenterInventorySnapshotModel.company_id == company_id
+        )
+    ).first()
+    if not target_snapshot:
+        return None
+
+    items = db.query(CenterInventorySnapshotItemModel).filter(
+        CenterInventorySnapshotItemModel.center_inventory_snapshot_id == (target_snapshot.items_snapshot_id or target_snapshot.id)
+    ).all()
+    return _build_center_snapshot(target_snapshot, items)
+
+def _replay_center_snapshots_until(
+    db: Session,
+    target_date: date,
+    company_id: UUID,
+    center_id: UUID,
+    from_date: Optional[date] = None
+) -> None:
+    """
+    target_date 이전의 가장 최근 finalized 스냅샷을 체크포인트로 삼아 그 이후만 매일 생성하고,
+    finalized가 없으면 가장 오래된 shipment(또는 from_date 중 이른 날)부터 매일 생성합니다.
+    """
+    # target_date 이전의 가장 최근 finalized 스냅샷 조회
     latest_finalized_snapshot = db.query(CenterInventorySnapshotModel).filter(
         and_(
             CenterInventorySnapshotModel.center_id == center_id,
             CenterInventorySnapshotModel.company_id == company_id,
-            CenterInventorySnapshotModel.finalized == True
+            CenterInventorySnapshotModel.finalized == True,
+            CenterInventorySnapshotModel.snapshot_date <= target_date
         )
     ).order_by(CenterInventorySnapshotModel.snapshot_date.desc()).first()
-    
-    print(f"최근 finalized 스냅샷: {latest_finalized_snapshot.snapshot_date if latest_finalized_snapshot else 'None'}")
-    
+
     if latest_finalized_snapshot:
-        # finalized된 스냅샷이 있으면 그 이후부터 매일 생성
-        start_date = latest_finalized_snapshot.snapshot_date + timedelta(days=1)
-        print(f"finalized 스냅샷 이후부터 생성: {start_date} ~ {target_date}")
-        create_daily_snapshots_from_finalized(db, start_date, target_date, company_id, center_id)
-        
-        # target_date의 스냅샷 조회
-        target_snapshot = db.query(CenterInventorySnapshotModel).filter(
-            and_(
-                CenterInventorySnapshotModel.snapshot_date == target_date,
-                CenterInventorySnapshotModel.center_id == center_id,
-                CenterInventorySnapshotModel.company_id == company_id
-            )
-        ).first()
-        
-        print(f"target_date 스냅샷 조회 결과: {target_snapshot is not None}")
-        
-        if target_snapshot:
-            # 아이템 변환
-            items = db.query(CenterInventorySnapshotItemModel).filter(
-                CenterInventorySnapshotItemModel.center_inventory_snapshot_id == target_snapshot.id
-            ).all()
-            snapshot_items = [
-                InventorySnapshotItem(
-                    product_name=item.product_name,
-                    quality=item.quality,
-                    quantity=item.quantity,
-                    unit_price=item.unit_price,
-                    total_price=item.total_price
-                ) for item in items
-            ]
-            
-            return CenterInventorySnapshot(
-                center_id=center_id,
-                center_name=target_snapshot.center.name,
-                total_quantity=target_snapshot.total_quantity,
-                total_price=target_snapshot.total_price,
-                items=snapshot_items
-            )
+        # finalized된 스냅샷 이후부터 생성
+        create_daily_snapshots_from_finalized(
+            db, latest_finalized_snapshot.snapshot_date + timedelta(days=1), target_date, company_id, center_id
+        )
     else:
-        # finalized된 스냅샷이 없으면 가장 오래된 shipment부터 매일 생성
-        print("finalized 스냅샷이 없어서 shipment부터 생성")
-        oldest_shipment = db.query(Shipment).filter(
+        # finalized된 스냅샷이 없으면 가장 오래된 shipment부터 생성 (없으면 target_date 하루만)
+        oldest_shipment_date = _get_oldest_center_shipment_date(db, company_id, center_id)
+        start_date = min(from_date or target_date, target_date)
+        if oldest_shipment_date and oldest_shipment_date < start_date:
+            start_date = oldest_shipment_date
+        create_daily_snapshots_from_shipments(db, start_date, target_date, company_id, center_id)
+
+def create_daily_snapshots_from_finalized(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_id: UUID
+):
+    """
+    start_date 전날의 finalized 스냅샷을 체크포인트로 삼아 [start_date, end_date] 구간을 생성합니다.
+    체크포인트의 아이템이 시작 잔고가 되고, 체크포인트 이후의 출하만 재생하므로
+    비용은 센터 전체 이력이 아니라 마지막 finalize 이후의 기간에 비례합니다.
+    """
+    create_daily_snapshots_from_shipments(db, start_date, end_date, company_id, center_id)
+
+def _load_center_shipment_deltas(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_id: UUID
+) -> dict:
+    """
+    [start_date, end_date] 구간에서 센터에 영향을 주는 모든 출하 아이템을 한 번의 쿼리로 조회해
+    날짜 -> 방향(출하 -1 / 입하 +1) -> (상품명, 품질) -> [수량 합계, 단가 합계, 건수] 형태로 묶습니다.
+    """
+    outbound = and_(
+        Shipment.departure_center_id == center_id,
+        Shipment.supplier_company_id == company_id
+    )
+    inbound = and_(
+        Shipment.arrival_center_id == center_id,
+        Shipment.receiver_company_id == company_id
+    )
+    rows = db.query(
+        Shipment.shipment_datetime,
+        case((outbound, True), else_=False).label('is_outbound'),
+        case((inbound, True), else_=False).label('is_inbound'),
+        ShipmentItem.product_name,
+        ShipmentItem.quality,
+        ShipmentItem.quantity,
+        ShipmentItem.unit_price
+    ).join(Shipment, ShipmentItem.shipment_id == Shipment.id).filter(
+        and_(
+            or_(outbound, inbound),
+            Shipment.shipment_datetime >= datetime.combine(start_date, time.min),
+            Shipment.shipment_datetime < datetime.combine(end_date + timedelta(days=1), time.min)
+        )
+    ).all()
+
+    deltas = defaultdict(lambda: {-1: {}, 1: {}})
+    for row in rows:
+        day_deltas = deltas[row.shipment_datetime.date()]
+        key = (row.product_name, row.quality)
+        for multiplier, matched in ((-1, row.is_outbound), (1, row.is_inbound)):
+            if not matched:
+                continue
+            acc = day_deltas[multiplier].setdefault(key, [0, 0.0, 0])
+            acc[0] += row.quantity
+            acc[1] += row.unit_price
+            acc[2] += 1
+    return deltas
+
+def _apply_day_deltas(balances: dict, day_deltas: dict) -> None:
+    """
+    하루치 델타를 잔고 {(상품명, 품질): [수량, 단가, 총액]}에 출하(−) → 입하(+) 순서로 반영합니다.
+    새 품목의 단가는 그날 해당 방향의 평균 단가입니다.
+    """
+    for multiplier in (-1, 1):
+        for key, (quantity, unit_price_sum, count) in day_deltas.get(multiplier, {}).items():
+            qty_delta = quantity * multiplier
+            balance = balances.get(key)
+            if balance:
+                balance[0] += qty_delta
+                balance[2] = balance[0] * balance[1]
+            else:
+                avg_unit_price = unit_price_sum / count
+                balances[key] = [qty_delta, avg_unit_price, qty_delta * avg_unit_price]
+
+def _get_oldest_center_shipment_date(db: Session, company_id: UUID, center_id: UUID) -> Optional[date]:
+    """센터에 영향을 준 가장 오래된 출하 일자를 조회합니다."""
+    oldest_shipment_datetime = db.query(func.min(Shipment.shipment_datetime)).filter(
+        or_(
             and_(
-                or_(
-                    Shipment.supplier_company_id == company_id,
-                    Shipment.receiver_company_id == company_id
-                ),
-                or_(
-                    Shipment.departure_center_id == center_id,
-                    Shipment.arrival_center_id == center_id
-                )
+                Shipment.departure_center_id == center_id,
+                Shipment.supplier_company_id == company_id
+            ),
+            and_(
+                Shipment.arrival_center_id == center_id,
+                Shipment.receiver_company_id == company_id
             )
-        ).order_by(Shipment.shipment_datetime.asc()).first()
-        
-        print(f"가장 오래된 shipment: {oldest_shipment.shipment_datetime if oldest_shipment else 'None'}")
-        
-        if oldest_shipment:
-            start_date = oldest_shipment.shipment_datetime.date()
-            print(f"shipment부터 생성: {start_date} ~ {target_date}")
-            create_daily_snapshots_from_shipments(db, start_date, target_date, company_id, center_id)
-            
-            # target_date의 스냅샷 조회
-            target_snapshot = db.query(CenterInventorySnapshotModel).filter(
-                and_(
-                    CenterInventorySnapshotModel.snapshot_date == target_date,
-                    CenterInventorySnapshotModel.center_id == center_id,
-                    CenterInventorySnapshotModel.company_id == company_id
-                )
-            ).first()
-            
-            print(f"target_date 스냅샷 조회 결과: {target_snapshot is not None}")
-            
-            if target_snapshot:
-                # 아이템 변환
-                items = db.query(CenterInventorySnapshotItemModel).filter(
-                    CenterInventorySnapshotItemModel.center_inventory_snapshot_id == target_snapshot.id
-                ).all()
-                snapshot_items = [
-                    InventorySnapshotItem(
-                        product_name=item.product_name,
-                        quality=item.quality,
-                        quantity=item.quantity,
-                        unit_price=item.unit_price,
-                        total_price=item.total_price
-                    ) for item in items
-                ]
-                
-                return CenterInventorySnapshot(
-                    center_id=center_id,
-                    center_name=target_snapshot.center.name,
-                    total_quantity=target_snapshot.total_quantity,
-                    total_price=target_snapshot.total_price,
-                    items=snapshot_items
-                )
-        else:
-            # shipment가 없으면 기본 스냅샷 생성
-            print("shipment가 없어서 기본 스냅샷 생성")
-            center = db.query(Center).filter(Center.id == center_id).first()
-            if not center:
-                print("센터를 찾을 수 없음")
-                return None
-            
-            # 해당 날짜의 스냅샷이 이미 있는지 확인
-            existing_snapshot = db.query(CenterInventorySnapshotModel).filter(
-                and_(
-                    CenterInventorySnapshotModel.snapshot_date == target_date,
-                    CenterInventorySnapshotModel.center_id == center_id,
-                    CenterInventorySnapshotModel.company_id == company_id
-                )
-            ).first()
-            
-            if not existing_snapshot:
-                # 새로운 기본 스냅샷 생성
-                center_snapshot = CenterInventorySnapshotModel(
-                    snapshot_date=target_date,
-                    company_id=company_id,
-                    center_id=center_id,
-                    total_quantity=0,
-                    total_price=0,
-                    finalized=False
-                )
-                db.add(center_snapshot)
-                db.commit()
-                db.refresh(center_snapshot)
-                print(f"기본 스냅샷 생성 완료: {center_snapshot.id}")
-                
-                return CenterInventorySnapshot(
-                    center_id=center_id,
-                    center_name=center.name,
-                    total_quantity=0,
-                    total_price=0,
-                    items=[]
-                )
-            else:
-                # 기존 스냅샷 반환
-                items = db.query(CenterInventorySnapshotItemModel).filter(
-                    CenterInventorySnapshotItemModel.center_inventory_snapshot_id == existing_snapshot.id
-                ).all()
-                snapshot_items = [
-                    InventorySnapshotItem(
-                        product_name=item.product_name,
-                        quality=item.quality,
-                        quantity=item.quantity,
-                        unit_price=item.unit_price,
-                        total_price=item.total_price
-                    ) for item in items
-                ]
-                
-                return CenterInventorySnapshot(
-                    center_id=center_id,
-                    center_name=existing_snapshot.center.name,
-                    total_quantity=existing_snapshot.total_quantity,
-                    total_price=existing_snapshot.total_price,
-                    items=snapshot_items
-                )
-    
-    print("스냅샷 생성 실패 - None 반환")
-    return None
+        )
+    ).scalar()
+    return oldest_shipment_datetime.date() if oldest_shipment_datetime else None
 
-def create_daily_snapshots_from_shipments(
+def _upsert_statement(db: Session, model):
+    """DB 종류에 맞는 INSERT ... ON CONFLICT 문을 만듭니다."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+def upsert_center_snapshots(db: Session, snapshot_rows: List[dict], item_rows: List[dict]) -> None:
+    """
+    스냅샷과 아이템을 INSERT ... ON CONFLICT DO UPDATE로 일괄 기록합니다. 존재 여부를 먼저 조회하지 않습니다.
+    (company_id, center_id, snapshot_date)가 이미 있으면 총합만 갱신하고, 아이템은 기존 스냅샷 id로 옮겨 기록합니다.
+    finalized 스냅샷은 덮어쓰지 않으며 그 아이템도 기록하지 않습니다. 커밋은 호출하는 쪽에서 합니다.
+    """
+    if not snapshot_rows:
+        return
+
+    stmt = _upsert_statement(db, CenterInventorySnapshotModel)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['company_id', 'center_id', 'snapshot_date'],
+        set_={
+            'total_quantity': stmt.excluded.total_quantity,
+            'total_price': stmt.excluded.total_price,
+            'updated_at': func.now()
+        },
+        where=CenterInventorySnapshotModel.finalized == False
+    ).returning(
+        CenterInventorySnapshotModel.id,
+        CenterInventorySnapshotModel.center_id,
+        CenterInventorySnapshotModel.snapshot_date
+    )
+    stored_ids = {
+        (row.center_id, row.snapshot_date): row.id
+        for row in db.execute(stmt, snapshot_rows)
+    }
+    snapshot_ids = {
+        row['id']: stored_ids[(row['center_id'], row['snapshot_date'])]
+        for row in snapshot_rows
+        if (row['center_id'], row['snapshot_date']) in stored_ids
+    }
+
+    item_rows = [
+        {**row, 'center_inventory_snapshot_id': snapshot_ids[row['center_inventory_snapshot_id']]}
+        for row in item_rows
+        if row['center_inventory_snapshot_id'] in snapshot_ids
+    ]
+    if not item_rows:
+        return
+
+    stmt = _upsert_statement(db, CenterInventorySnapshotItemModel)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['center_inventory_snapshot_id', 'product_name', 'quality'],
+        set_={
+            'quantity': stmt.excluded.quantity,
+            'unit_price': stmt.excluded.unit_price,
+            'total_price': stmt.excluded.total_price,
+            'updated_at': func.now()
+        }
+    )
+    db.execute(stmt, item_rows)
+
+def _load_center_snapshots_with_items(
     db: Session,
     start_date: date,
     end_date: date,
     company_id: UUID,
     center_id: UUID
+) -> dict:
+    """[start_date, end_date] 구간의 센터 스냅샷을 아이템과 함께 조회해 날짜별 dict로 반환합니다."""
+    existing_snapshots = db.query(CenterInventorySnapshotModel).options(
+        selectinload(CenterInventorySnapshotModel.items),
+        selectinload(CenterInventorySnapshotModel.items_source).selectinload(CenterInventorySnapshotModel.items)
+    ).filter(
+        and_(
+            CenterInventorySnapshotModel.center_id == center_id,
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.snapshot_date >= start_date,
+            CenterInventorySnapshotModel.snapshot_date <= end_date
+        )
+    ).all()
+    return {snapshot.snapshot_date: snapshot for snapshot in existing_snapshots}
+
+def _replay_daily_balances(
+    start_date: date,
+    end_date: date,
+    existing_by_date: dict,
+    deltas: dict,
+    opening_balances: Optional[dict] = None
 ):
     """
-    가장 오래된 shipment부터 매일치 스냅샷을 생성합니다.
+    start_date 전날부터 end_date까지 일별 잔고를 누적하며 [start_date, end_date]의 각 날짜마다
+    (날짜, 잔고, 기존 스냅샷 또는 None)을 돌려줍니다.
+    opening_balances는 start_date 전날의 잔고이며, 전날 스냅샷이 있으면 그 아이템이 우선합니다.
+    기존 스냅샷이 있는 날은 그 아이템으로 잔고를 다시 맞추고 그날의 출하는 반영하지 않습니다.
+    잔고는 {(상품명, 품질): [수량, 단가, 총액]}이며 다음 날짜로 넘어가면 갱신되므로 복사해서 사용해야 합니다.
     """
-    current_date = start_date
-    
+    balances = opening_balances if opening_balances is not None else {}
+    current_date = start_date - timedelta(days=1)
     while current_date <= end_date:
-        # 해당 날짜의 스냅샷이 이미 있는지 확인
-        existing_snapshot = db.query(CenterInventorySnapshotModel).filter(
-            and_(
-                CenterInventorySnapshotModel.snapshot_date == current_date,
-                CenterInventorySnapshotModel.center_id == center_id,
-                CenterInventorySnapshotModel.company_id == company_id
-            )
-        ).first()
-        
-        if not existing_snapshot:
-            # 새로운 스냅샷 생성 (not finalized)
-            center_snapshot = CenterInventorySnapshotModel(
-                snapshot_date=current_date,
-                company_id=company_id,
-                center_id=center_id,
-                total_quantity=0,
-                total_price=0,
-                finalized=False
+        existing_snapshot = existing_by_date.get(current_date)
+        if existing_snapshot:
+            balances = {
+                (item.product_name, item.quality): [item.quantity, item.unit_price, item.total_price]
+                for item in existing_snapshot.resolved_items
+            }
+        elif current_date >= start_date:
+            _apply_day_deltas(balances, deltas.get(current_date, {}))
+
+        if current_date >= start_date:
+            yield current_date, balances, existing_snapshot
+        current_date += timedelta(days=1)
+
+def create_daily_snapshots_from_shipments(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_id: UUID,
+    commit: bool = True
+):
+    """
+    [start_date, end_date] 구간의 비어 있는 날짜에 대해 매일치 스냅샷을 생성합니다.
+    구간의 출하 데이터와 기존 스냅샷을 한 번에 조회한 뒤 메모리에서 일별 잔고를 누적하고,
+    누락된 스냅샷과 아이템을 하나의 트랜잭션에서 bulk insert 합니다.
+    commit=False이면 커밋하지 않습니다(여러 센터를 잠근 채 한 트랜잭션으로 처리하는 호출용).
+    """
+    if start_date > end_date:
+        return
+
+    # 전날(시작 잔고)부터 종료일까지의 기존 스냅샷을 아이템과 함께 일괄 조회
+    existing_by_date = _load_center_snapshots_with_items(
+        db, start_date - timedelta(days=1), end_date, company_id, center_id
+    )
+    # 전날 스냅샷이 없으면 시작 잔고를 finalized 기준점과 원장 합계로 구함 (구간 이전의 이력을 버리지 않음)
+    opening_balances = None
+    if start_date - timedelta(days=1) not in existing_by_date:
+        opening_balances = _opening_center_balances(db, start_date, company_id, center_id)
+    deltas = _load_center_shipment_deltas(db, start_date, end_date, company_id, center_id)
+
+    snapshot_rows = []
+    item_rows = []
+    for current_date, balances, existing_snapshot in _replay_daily_balances(
+        start_date, end_date, existing_by_date, deltas, opening_balances
+    ):
+        # 이미 있는 스냅샷은 그대로 둠
+        if existing_snapshot:
+            continue
+
+        snapshot_id = uuid.uuid4()
+        snapshot_rows.append({
+            'id': snapshot_id,
+            'snapshot_date': current_date,
+            'company_id': company_id,
+            'center_id': center_id,
+            'total_quantity': sum(balance[0] for balance in balances.values()),
+            'total_price': sum(balance[2] for balance in balances.values()),
+            'finalized': False
+        })
+        item_rows.extend(
+            {
+                'id': uuid.uuid4(),
+                'center_inventory_snapshot_id': snapshot_id,
+                'product_name': product_name,
+                'quality': quality,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'total_price': total_price
+            }
+            for (product_name, quality), (quantity, unit_price, total_price) in balances.items()
+        )
+
+    upsert_center_snapshots(db, snapshot_rows, item_rows)
+    if commit:
+        db.commit()
+
+def _load_center_ledger_deltas(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_id: UUID
+) -> dict:
+    """
+    [start_date, end_date] 구간의 원장 변동을 _load_center_shipment_deltas와 같은 형태
+    (날짜 -> 방향 -> (상품명, 품질) -> [수량 합계, 단가 합계, 건수])로 묶습니다.
+    """
+    rows = db.query(
+        InventoryLedgerEntry.movement_date,
+        InventoryLedgerEntry.product_name,
+        InventoryLedgerEntry.quality,
+        InventoryLedgerEntry.quantity_delta,
+        InventoryLedgerEntry.unit_price
+    ).filter(
+        and_(
+            InventoryLedgerEntry.center_id == center_id,
+            InventoryLedgerEntry.company_id == company_id,
+            InventoryLedgerEntry.movement_date >= start_date,
+            InventoryLedgerEntry.movement_date <= end_date
+        )
+    ).all()
+
+    deltas = defaultdict(lambda: {-1: {}, 1: {}})
+    for row in rows:
+        multiplier = -1 if row.quantity_delta < 0 else 1
+        acc = deltas[row.movement_date][multiplier].setdefault((row.product_name, row.quality), [0, 0.0, 0])
+        acc[0] += abs(row.quantity_delta)
+        acc[1] += row.unit_price
+        acc[2] += 1
+    return deltas
+
+def _opening_center_balances(db: Session, before_date: date, company_id: UUID, center_id: UUID) -> dict:
+    """
+    before_date 전날 종료 시점의 센터 잔고 {(상품명, 품질): [수량, 단가, 총액]}를 계산합니다.
+    before_date 이전의 가장 최근 finalized 스냅샷을 기준점으로 삼고, 그 이후의 원장 변동을 누적 합계 한 번으로 더합니다.
+    기준점이 없으면 원장 전체의 누적 합계입니다. 출하를 하루씩 재생하지 않으므로 쿼리 수는 이력 길이와 무관합니다.
+    기준점 이후에 새로 생긴 품목의 단가는 _apply_day_deltas와 같은 규칙(get_center_inventory_balance 참고)이므로,
+    저장된 스냅샷을 재생한 결과와 같습니다.
+    """
+    anchor = db.query(CenterInventorySnapshotModel).options(
+        selectinload(CenterInventorySnapshotModel.items),
+        selectinload(CenterInventorySnapshotModel.items_source).selectinload(CenterInventorySnapshotModel.items)
+    ).filter(
+        and_(
+            CenterInventorySnapshotModel.center_id == center_id,
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.finalized == True,
+            CenterInventorySnapshotModel.snapshot_date < before_date
+        )
+    ).order_by(CenterInventorySnapshotModel.snapshot_date.desc()).first()
+
+    balances = {}
+    if anchor:
+        balances = {
+            (item.product_name, item.quality): [item.quantity, item.unit_price, item.total_price]
+            for item in anchor.resolved_items
+        }
+    for row in get_center_inventory_balance(
+        db, before_date - timedelta(days=1), company_id, center_id,
+        after_date=anchor.snapshot_date if anchor else None
+    ):
+        balance = balances.get((row.product_name, row.quality))
+        if balance:
+            balance[0] += row.quantity
+            balance[2] = balance[0] * balance[1]
+        else:
+            balances[(row.product_name, row.quality)] = [row.quantity, row.unit_price, row.quantity * row.unit_price]
+    return balances
+
+def compute_center_inventory_snapshots(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center: Center
+) -> dict:
+    """
+    [start_date, end_date] 구간의 센터 스냅샷을 쓰기 없이 계산해 날짜별 dict로 반환합니다.
+    시작 잔고는 start_date 이전의 가장 최근 finalized 스냅샷에 그 이후 원장 변동의 합계를 더한 값이고,
+    구간 안은 원장의 일별 변동으로 계산합니다. 구간 안에 이미 저장된 스냅샷은 그대로 사용합니다.
+    """
+    existing_by_date = _load_center_snapshots_with_items(db, start_date, end_date, company_id, center.id)
+    opening_balances = _opening_center_balances(db, start_date, company_id, center.id)
+    deltas = _load_center_ledger_deltas(db, start_date, end_date, company_id, center.id)
+
+    computed = {}
+    for current_date, balances, existing_snapshot in _replay_daily_balances(
+        start_date, end_date, existing_by_date, deltas, opening_balances
+    ):
+        if existing_snapshot:
+            computed[current_date] = _build_center_snapshot(existing_snapshot, existing_snapshot.resolved_items)
+            continue
+        computed[current_date] = CenterInventorySnapshot(
+            center_id=center.id,
+            center_name=center.name,
+            total_quantity=sum(balance[0] for balance in balances.values()),
+            total_price=sum(balance[2] for balance in balances.values()),
+            items=[
+                InventorySnapshotItem(
+                    product_name=product_name,
+                    quality=quality,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    total_price=total_price
+                )
+                for (product_name, quality), (quantity, unit_price, total_price) in balances.items()
+            ]
+        )
+    return computed
+
+def rebuild_company_inventory_snapshots(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID
+) -> None:
+    """
+    회사 전체 센터의 [start_date, end_date] 스냅샷을 출하 데이터로부터 다시 생성합니다.
+    finalized가 아닌 기존 스냅샷은 지우고, finalized 스냅샷은 그대로 둔 채 잔고 기준점으로 사용합니다.
+    NumPy가 있으면 컬럼형 커널로 전 센터를 한 번에 계산하고, 없으면 센터별로 재생합니다.
+    """
+    if start_date > end_date:
+        return
+
+    center_ids = [center_id for (center_id,) in db.query(Center.id).filter(Center.company_id == company_id).all()]
+    if not center_ids:
+        return
+
+    # 교착 상태를 피하기 위해 항상 같은 순서로 센터 잠금을 잡음
+    # (PostgreSQL 잠금은 트랜잭션 범위이므로, 재생성 전체가 하나의 트랜잭션으로 끝날 때 함께 풀림)
+    with ExitStack() as locks:
+        for center_id in sorted(center_ids, key=str):
+            locks.enter_context(center_snapshot_lock(db, company_id, center_id))
+        _rebuild_company_inventory_snapshots(db, start_date, end_date, company_id, center_ids)
+
+def _rebuild_company_inventory_snapshots(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_ids: List[UUID]
+) -> None:
+    stale_snapshots = db.query(CenterInventorySnapshotModel.id).filter(
+        and_(
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.center_id.in_(center_ids),
+            CenterInventorySnapshotModel.snapshot_date >= start_date,
+            CenterInventorySnapshotModel.snapshot_date <= end_date,
+            CenterInventorySnapshotModel.finalized == False
+        )
+    )
+    db.query(CenterInventorySnapshotItemModel).filter(
+        CenterInventorySnapshotItemModel.center_inventory_snapshot_id.in_(stale_snapshots.scalar_subquery())
+    ).delete(synchronize_session=False)
+    db.query(CenterInventorySnapshotModel).filter(
+        CenterInventorySnapshotModel.id.in_(stale_snapshots.scalar_subquery())
+    ).delete(synchronize_session=False)
+
+    if not inventory_kernel.is_available():
+        # 중간 커밋은 PostgreSQL의 트랜잭션 범위 advisory lock을 모두 풀어 버리므로 마지막에 한 번만 커밋
+        for center_id in center_ids:
+            create_daily_snapshots_from_shipments(db, start_date, end_date, company_id, center_id, commit=False)
+        db.commit()
+        return
+
+    day_count = (end_date - start_date).days + 1
+    center_index = {center_id: index for index, center_id in enumerate(center_ids)}
+    key_index = {}
+
+    # 남아 있는 스냅샷(시작 잔고 + 구간 내 finalized)을 기준점으로 사용
+    anchor_snapshots = db.query(CenterInventorySnapshotModel).options(
+        selectinload(CenterInventorySnapshotModel.items),
+        selectinload(CenterInventorySnapshotModel.items_source).selectinload(CenterInventorySnapshotModel.items)
+    ).filter(
+        and_(
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.center_id.in_(center_ids),
+            CenterInventorySnapshotModel.snapshot_date >= start_date - timedelta(days=1),
+            CenterInventorySnapshotModel.snapshot_date <= end_date
+        )
+    ).all()
+    anchors = {}
+    for snapshot in anchor_snapshots:
+        anchors[((snapshot.snapshot_date - start_date).days, center_index[snapshot.center_id])] = [
+            (
+                key_index.setdefault((item.product_name, item.quality), len(key_index)),
+                item.quantity,
+                item.unit_price
             )
-            db.add(center_snapshot)
-            db.flush()
-            
-            # 전날 스냅샷 조회하여 아이템 복사
-            previous_date = current_date - timedelta(days=1)
-            previous_snapshot = db.query(CenterInventorySnapshotModel).filter(
-                and_(
-                    CenterInventorySnapshotModel.snapshot_date == previous_date,
-                    CenterInventorySnapshotModel.center_id == center_id,
-                    CenterInventorySnapshotModel.company_id == company_id
-                )
-            ).first()
-            
-            if previous_snapshot:
-                # 전날 아이템 복사
-                for item in previous_snapshot.items:
-                    new_item = CenterInventorySnapshotItemModel(
-                        id=uuid.uuid4(),
-                        center_inventory_snapshot_id=center_snapshot.id,
-                        product_name=item.product_name,
-                        quantity=item.quantity,
-                        quality=item.quality,
-                        unit_price=item.unit_price,
-                        total_price=item.total_price
-                    )
-                    db.add(new_item)
-                db.flush()  # 복사 후 반드시 flush!
-            
-            # 출하(−) / 입하(+) 데이터 일괄 적용
-            shipment_specs = [
-                {  # 출하(감소)
-                    'multiplier': -1,
-                    'center_field': Shipment.departure_center_id,
-                    'company_field': Shipment.supplier_company_id,
-                },
-                {  # 입하(증가)
-                    'multiplier': 1,
-                    'center_field': Shipment.arrival_center_id,
-                    'company_field': Shipment.receiver_company_id,
+            for item in snapshot.resolved_items
+        ]
+    # 시작일 전날 스냅샷이 없는 센터는 finalized 기준점과 원장 합계로 시작 잔고를 채움
+    for center_id, index in center_index.items():
+        if (-1, index) in anchors:
+            continue
+        anchors[(-1, index)] = [
+            (key_index.setdefault(key, len(key_index)), quantity, unit_price)
+            for key, (quantity, unit_price, _) in _opening_center_balances(db, start_date, company_id, center_id).items()
+        ]
+
+    # 회사 전체 센터의 출하 아이템을 한 번에 조회
+    rows = db.query(
+        Shipment.shipment_datetime,
+        Shipment.departure_center_id,
+        Shipment.arrival_center_id,
+        Shipment.supplier_company_id,
+        Shipment.receiver_company_id,
+        ShipmentItem.product_name,
+        ShipmentItem.quality,
+        ShipmentItem.quantity,
+        ShipmentItem.unit_price
+    ).join(Shipment, ShipmentItem.shipment_id == Shipment.id).filter(
+        and_(
+            or_(
+                and_(Shipment.departure_center_id.in_(center_ids), Shipment.supplier_company_id == company_id),
+                and_(Shipment.arrival_center_id.in_(center_ids), Shipment.receiver_company_id == company_id)
+            ),
+            Shipment.shipment_datetime >= datetime.combine(start_date, time.min),
+            Shipment.shipment_datetime < datetime.combine(end_date + timedelta(days=1), time.min)
+        )
+    ).all()
+    deltas = []
+    for row in rows:
+        day_index = (row.shipment_datetime.date() - start_date).days
+        key = key_index.setdefault((row.product_name, row.quality), len(key_index))
+        if row.supplier_company_id == company_id and row.departure_center_id in center_index:
+            deltas.append((day_index, center_index[row.departure_center_id], key, -1, row.quantity, row.unit_price))
+        if row.receiver_company_id == company_id and row.arrival_center_id in center_index:
+            deltas.append((day_index, center_index[row.arrival_center_id], key, 1, row.quantity, row.unit_price))
+
+    keys = list(key_index)
+    quantity, unit_price, present, anchored = inventory_kernel.compute_daily_balances(
+        day_count, len(center_ids), max(len(keys), 1), deltas, anchors
+    )
+    total_price = quantity * unit_price
+    daily_quantity = (quantity * present).sum(axis=2)
+    daily_price = (total_price * present).sum(axis=2)
+
+    snapshot_rows = []
+    item_rows = []
+    for day_index in range(day_count):
+        snapshot_date = start_date + timedelta(days=day_index)
+        for center_id, index in center_index.items():
+            if anchored[day_index, index]:
+                continue
+            snapshot_id = uuid.uuid4()
+            snapshot_rows.append({
+                'id': snapshot_id,
+                'snapshot_date': snapshot_date,
+                'company_id': company_id,
+                'center_id': center_id,
+                'total_quantity': int(daily_quantity[day_index, index]),
+                'total_price': float(daily_price[day_index, index]),
+                'finalized': False
+            })
+            item_rows.extend(
+                {
+                    'id': uuid.uuid4(),
+                    'center_inventory_snapshot_id': snapshot_id,
+                    'product_name': keys[key][0],
+                    'quality': keys[key][1],
+                    'quantity': int(quantity[day_index, index, key]),
+                    'unit_price': float(unit_price[day_index, index, key]),
+                    'total_price': float(total_price[day_index, index, key])
                 }
-            ]
+                for key in present[day_index, index].nonzero()[0]
+            )
 
-            for spec in shipment_specs:
-                query = db.query(
-                    ShipmentItem.product_name,
-                    ShipmentItem.quality,
-                    func.sum(ShipmentItem.quantity).label('total_quantity'),
-                    func.avg(ShipmentItem.unit_price).label('avg_unit_price')
-                ).join(Shipment, ShipmentItem.shipment_id == Shipment.id).filter(
-                    and_(
-                        cast(Shipment.shipment_datetime, Date) == current_date,
-                        spec['company_field'] == company_id,
-                        spec['center_field'] == center_id
-                    )
-                ).group_by(
-                    ShipmentItem.product_name,
-                    ShipmentItem.quality
-                ).all()
-
-                for item in query:
-                    qty_delta = item.total_quantity * spec['multiplier']
-                    db_item = db.query(CenterInventorySnapshotItemModel).filter(
-                        and_(
-                            CenterInventorySnapshotItemModel.center_inventory_snapshot_id == center_snapshot.id,
-                            CenterInventorySnapshotItemModel.product_name == item.product_name,
-                            CenterInventorySnapshotItemModel.quality == item.quality
-                        )
-                    ).first()
-                    if db_item:
-                        db_item.quantity += qty_delta
-                        db_item.total_price = db_item.quantity * db_item.unit_price
-                    else:
-                        new_item = CenterInventorySnapshotItemModel(
-                            id=uuid.uuid4(),
-                            center_inventory_snapshot_id=center_snapshot.id,
-                            product_name=item.product_name,
-                            quantity=qty_delta,
-                            quality=item.quality,
-                            unit_price=item.avg_unit_price,
-                            total_price=qty_delta * item.avg_unit_price,
-                        )
-                        db.add(new_item)
-
-            # 총합 업데이트
-            total_quantity = sum(item.quantity for item in center_snapshot.items)
-            total_price = sum(item.total_price for item in center_snapshot.items)
-            center_snapshot.total_quantity = total_quantity
-            center_snapshot.total_price = total_price
-        
-        current_date += timedelta(days=1)
-    
+    upsert_center_snapshots(db, snapshot_rows, item_rows)
     db.commit()
 
 def finalize_center_inventory_snapshot(
@@ -460,7 +878,7 @@ def finalize_center_inventory_snapshot(
     
     # 아이템 변환
     items = db.query(CenterInventorySnapshotItemModel).filter(
-        CenterInventorySnapshotItemModel.center_inventory_snapshot_id == snapshot.id
+        CenterInventorySnapshotItemModel.center_inventory_snapshot_id == (snapshot.items_snapshot_id or snapshot.id)
     ).all()
     snapshot_items = [
         InventorySnapshotItem(
@@ -488,24 +906,164 @@ def finalize_company_inventory_snapshot(
     """
     특정 날짜의 회사 전체 인벤토리 스냅샷을 finalized 상태로 변경합니다.
     """
-    # 회사의 모든 센터 조회
-    centers = db.query(Center).filter(Center.company_id == company_id).all()
-    
-    center_snapshots = []
-    for center in centers:
-        try:
-            finalized_snapshot = finalize_center_inventory_snapshot(
-                db, target_date, company_id, center.id
+    return finalize_company_inventory_snapshots(db, target_date, target_date, company_id)[0]
+
+def finalize_company_inventory_snapshots(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID
+) -> List[DailyInventorySnapshot]:
+    """
+    [start_date, end_date] 구간에 저장된 회사의 모든 센터 스냅샷을 한 번의 UPDATE로 finalized 처리하고,
+    결과를 한 번의 일괄 조회로 돌려줍니다. 저장되지 않은 (센터, 날짜)는 건너뜁니다.
+    """
+    if start_date > end_date:
+        return []
+
+    db.query(CenterInventorySnapshotModel).filter(
+        and_(
+            CenterInventorySnapshotModel.company_id == company_id,
+            CenterInventorySnapshotModel.snapshot_date >= start_date,
+            CenterInventorySnapshotModel.snapshot_date <= end_date,
+            CenterInventorySnapshotModel.finalized == False
+        )
+    ).update(
+        {
+            CenterInventorySnapshotModel.finalized: True,
+            CenterInventorySnapshotModel.updated_at: func.now()
+        },
+        synchronize_session=False
+    )
+    db.commit()
+
+    snapshots_by_date = defaultdict(list)
+    for snapshot in _load_company_snapshots(db, company_id, start_date, end_date):
+        snapshots_by_date[snapshot.snapshot_date].append(_build_center_snapshot(snapshot, snapshot.resolved_items))
+
+    return [
+        DailyInventorySnapshot(
+            snapshot_date=start_date + timedelta(days=offset),
+            centers=snapshots_by_date[start_date + timedelta(days=offset)]
+        )
+        for offset in range((end_date - start_date).days + 1)
+    ]
+
+def _item_signature(items) -> frozenset:
+    return frozenset(
+        (item.product_name, item.quality, item.quantity, item.unit_price, item.total_price)
+        for item in items
+    )
+
+def compact_center_inventory_snapshots(
+    db: Session,
+    company_id: Optional[UUID] = None,
+    center_id: Optional[UUID] = None
+) -> int:
+    """
+    finalized 스냅샷 중 전날과 아이템이 완전히 같은 날의 아이템을 지우고,
+    아이템을 가진 가장 가까운 이전 스냅샷을 가리키도록(items_snapshot_id) 압축합니다.
+    finalized 스냅샷은 더 이상 갱신되지 않으므로 압축 대상은 finalized 끼리의 연속 구간으로 한정합니다.
+    센터별로 커밋하며, 새로 압축한 스냅샷 수를 반환합니다.
+    """
+    center_query = db.query(
+        CenterInventorySnapshotModel.company_id,
+        CenterInventorySnapshotModel.center_id
+    ).filter(CenterInventorySnapshotModel.finalized == True)
+    if company_id:
+        center_query = center_query.filter(CenterInventorySnapshotModel.company_id == company_id)
+    if center_id:
+        center_query = center_query.filter(CenterInventorySnapshotModel.center_id == center_id)
+
+    compacted = 0
+    for snapshot_company_id, snapshot_center_id in center_query.distinct().all():
+        snapshots = db.query(CenterInventorySnapshotModel).options(
+            selectinload(CenterInventorySnapshotModel.items)
+        ).filter(
+            and_(
+                CenterInventorySnapshotModel.company_id == snapshot_company_id,
+                CenterInventorySnapshotModel.center_id == snapshot_center_id,
+                CenterInventorySnapshotModel.finalized == True
             )
-            center_snapshots.append(finalized_snapshot)
-        except ValueError:
-            # 해당 센터의 스냅샷이 없는 경우 무시
+        ).order_by(CenterInventorySnapshotModel.snapshot_date).all()
+
+        pointer_rows = []
+        previous = None
+        # 직전 날짜의 (아이템을 가진 스냅샷 id, 아이템 시그니처)
+        previous_source = None
+        for snapshot in snapshots:
+            if snapshot.items_snapshot_id is not None:
+                # 이미 압축된 스냅샷: 가리키는 스냅샷의 아이템을 그대로 이어받음
+                source = previous_source if previous_source and previous_source[0] == snapshot.items_snapshot_id else None
+            else:
+                signature = _item_signature(snapshot.items)
+                adjacent = previous is not None and previous.snapshot_date == snapshot.snapshot_date - timedelta(days=1)
+                if adjacent and previous_source and previous_source[1] == signature:
+                    pointer_rows.append({'id': snapshot.id, 'items_snapshot_id': previous_source[0]})
+                    source = previous_source
+                else:
+                    source = (snapshot.id, signature)
+            previous = snapshot
+            previous_source = source
+
+        if not pointer_rows:
             continue
-    
-    return DailyInventorySnapshot(
-        snapshot_date=target_date,
-        centers=center_snapshots
-    )
+
+        compacted_ids = [row['id'] for row in pointer_rows]
+        db.query(CenterInventorySnapshotItemModel).filter(
+            CenterInventorySnapshotItemModel.center_inventory_snapshot_id.in_(compacted_ids)
+        ).delete(synchronize_session=False)
+        db.execute(update(CenterInventorySnapshotModel), pointer_rows)
+        db.commit()
+        compacted += len(pointer_rows)
+
+    return compacted
+
+def expand_compacted_snapshots(db: Session, snapshots: List[CenterInventorySnapshotModel]) -> bool:
+    """
+    수정하려는 스냅샷과 얽힌 압축 구간을 풀어, 아이템을 각 스냅샷에 다시 저장합니다.
+    - 압축된 스냅샷이면 가리키던 스냅샷의 아이템을 복사해 자기 아이템으로 가집니다.
+    - 다른 스냅샷이 이 스냅샷의 아이템을 가리키고 있으면, 그 스냅샷들에 (수정 전) 아이템을 복사해 둡니다.
+    이렇게 해야 수정이 다른 날짜의 아이템을 바꾸지 않습니다. 풀어낸 스냅샷이 있으면 True를 반환하며,
+    커밋은 호출하는 쪽에서 합니다.
+    """
+    to_expand = {snapshot.id: snapshot for snapshot in snapshots if snapshot.items_snapshot_id is not None}
+    source_ids = [snapshot.id for snapshot in snapshots if snapshot.items_snapshot_id is None]
+    if source_ids:
+        for dependent in db.query(CenterInventorySnapshotModel).filter(
+            CenterInventorySnapshotModel.items_snapshot_id.in_(source_ids)
+        ).all():
+            to_expand[dependent.id] = dependent
+    if not to_expand:
+        return False
+
+    source_items = defaultdict(list)
+    for item in db.query(CenterInventorySnapshotItemModel).filter(
+        CenterInventorySnapshotItemModel.center_inventory_snapshot_id.in_(
+            {snapshot.items_snapshot_id for snapshot in to_expand.values()}
+        )
+    ).all():
+        source_items[item.center_inventory_snapshot_id].append(item)
+
+    item_rows = [
+        {
+            'id': uuid.uuid4(),
+            'center_inventory_snapshot_id': snapshot.id,
+            'product_name': item.product_name,
+            'quality': item.quality,
+            'quantity': item.quantity,
+            'unit_price': item.unit_price,
+            'total_price': item.total_price
+        }
+        for snapshot in to_expand.values()
+        for item in source_items[snapshot.items_snapshot_id]
+    ]
+    if item_rows:
+        db.execute(insert(CenterInventorySnapshotItemModel), item_rows)
+    db.query(CenterInventorySnapshotModel).filter(
+        CenterInventorySnapshotModel.id.in_(list(to_expand))
+    ).update({CenterInventorySnapshotModel.items_snapshot_id: None}, synchronize_session=False)
+    return True
 
 def update_daily_inventory_snapshot(
     db: Session,
@@ -516,158 +1074,673 @@ def update_daily_inventory_snapshot(
 ) -> Tuple[DailyInventorySnapshot, List[Shipment], List[Shipment]]:
     """
     일자별 인벤토리 스냅샷을 수정하고, 필요한 도매/소매 출하 데이터를 생성합니다.
+    대상 스냅샷과 아이템은 한 번에 미리 읽어 (센터, 상품명, 품질) dict로 찾고,
+    조정 출하는 한 번의 flush, 조정 출하 아이템은 한 번의 bulk insert로 기록합니다.
     """
     # 1. 현재 스냅샷 조회
     current_snapshot = get_daily_company_inventory_snapshot(db, update_request.snapshot_date, company_id)
     if not current_snapshot.centers:
         raise ValueError("해당 날짜의 스냅샷이 존재하지 않습니다.")
-    
-    created_shipments = []
+
+    center_ids = [center_update.center_id for center_update in update_request.centers]
+
+    def load_target_snapshots():
+        return {
+            snapshot.center_id: snapshot
+            for snapshot in db.query(CenterInventorySnapshotModel).options(
+                selectinload(CenterInventorySnapshotModel.items)
+            ).filter(
+                and_(
+                    CenterInventorySnapshotModel.snapshot_date == update_request.snapshot_date,
+                    CenterInventorySnapshotModel.center_id.in_(center_ids),
+                    CenterInventorySnapshotModel.company_id == company_id
+                )
+            ).all()
+        }
+
+    # 조회 경로는 스냅샷을 저장하지 않으므로, 수정 대상 스냅샷이 없으면 먼저 저장
+    snapshots_by_center = load_target_snapshots()
+    missing_center_ids = [center_id for center_id in center_ids if center_id not in snapshots_by_center]
+    for center_id in missing_center_ids:
+        create_daily_center_inventory_snapshot(db, update_request.snapshot_date, company_id, center_id)
+    if missing_center_ids:
+        snapshots_by_center = load_target_snapshots()
+
+    # 압축된 스냅샷이나 압축 원본을 수정하면 다른 날짜의 아이템이 함께 바뀌므로 먼저 압축을 풂
+    if expand_compacted_snapshots(db, list(snapshots_by_center.values())):
+        db.expire_all()
+        snapshots_by_center = load_target_snapshots()
+
     created_shipments = []
-    
+    shipment_item_rows = []
+    ledger_movements = []
+    quantity_adjustments = []
+
     # 2. 각 센터별 업데이트 처리
     for center_update in update_request.centers:
-        # 2.1 현재 센터 스냅샷 조회
-        db_snapshot = db.query(CenterInventorySnapshotModel).filter(
-            and_(
-                CenterInventorySnapshotModel.snapshot_date == update_request.snapshot_date,
-                CenterInventorySnapshotModel.center_id == center_update.center_id,
-                CenterInventorySnapshotModel.company_id == company_id
-            )
-        ).first()
-        
+        db_snapshot = snapshots_by_center.get(center_update.center_id)
         if not db_snapshot:
             continue
-            
-        # 2.2 아이템별 수량 차이 계산 및 출하 데이터 생성
+        items_by_key = {(item.product_name, item.quality): item for item in db_snapshot.resolved_items}
+
+        # 2.1 아이템별 수량 차이 계산 (증가분은 입고 조정, 감소분은 출고 조정)
         wholesale_items = []
         retail_items = []
-        total_wholesale_price = 0
-        total_retail_price = 0
-        
         for item_update in center_update.items:
-            db_item = db.query(CenterInventorySnapshotItemModel).filter(
-                and_(
-                    CenterInventorySnapshotItemModel.center_inventory_snapshot_id == db_snapshot.id,
-                    CenterInventorySnapshotItemModel.product_name == item_update.product_name,
-                    CenterInventorySnapshotItemModel.quality == item_update.quality
-                )
-            ).first()
-            
+            db_item = items_by_key.get((item_update.product_name, item_update.quality))
             if not db_item:
                 continue
-                
+
             quantity_diff = item_update.quantity - db_item.quantity
-            
-            if quantity_diff > 0:  # 도매 출하
-                wholesale_items.append({
-                    'product_name': item_update.product_name,
-                    'quantity': quantity_diff,
-                    'quality': item_update.quality,
-                    'unit_price': item_update.unit_price,
-                    'total_price': quantity_diff * item_update.unit_price
-                })
-                total_wholesale_price += quantity_diff * item_update.unit_price
-            elif quantity_diff < 0:  # 소매 출하
-                retail_items.append({
-                    'product_name': item_update.product_name,
-                    'quantity': abs(quantity_diff),
-                    'quality': item_update.quality,
-                    'unit_price': item_update.unit_price,
-                    'total_price': abs(quantity_diff) * item_update.unit_price
-                })
-                total_retail_price += abs(quantity_diff) * item_update.unit_price
-            
+            if quantity_diff > 0:  # 도매 입고
+                wholesale_items.append((item_update, quantity_diff))
+            elif quantity_diff < 0:  # 소매 출고
+                retail_items.append((item_update, abs(quantity_diff)))
+
+            quantity_adjustments.append({
+                'company_id': company_id,
+                'center_id': center_update.center_id,
+                'product_name': item_update.product_name,
+                'quality': item_update.quality,
+                'movement_date': update_request.snapshot_date + timedelta(days=1),
+                'quantity_delta': quantity_diff,
+                'unit_price': item_update.unit_price
+            })
+
             # 아이템 업데이트
             db_item.quantity = item_update.quantity
             db_item.unit_price = item_update.unit_price
             db_item.total_price = item_update.quantity * item_update.unit_price
-        
-        # 2.3 도매 출하 데이터 생성
-        if wholesale_items:
-            shipment = Shipment(
-                title=f"인벤토리 조정 - {center_update.center_id}",
-                creator_id=profile_id,
-                supplier_company_id=company_id,
-                departure_center_id=center_update.center_id,
-                shipment_status="completed",
-                shipment_datetime=update_request.snapshot_date,
-                contract_id=contract_id
-            )
-            db.add(shipment)
-            db.flush()
-            for item in wholesale_items:
-                shipment_item = ShipmentItem(
-                    shipment_id=shipment.id,
-                    product_name=item['product_name'],
-                    quantity=item['quantity'],
-                    quality=item['quality'],
-                    unit_price=item['unit_price'],
-                    total_price=item['total_price']
-                )
-                db.add(shipment_item)
-            created_shipments.append(shipment)
-        # 2.4 소매 출하 데이터 생성
-        if retail_items:
+
+        # 2.2 도매/소매 조정 출하 생성 (입고는 센터로 들어오고, 출고는 센터에서 나감)
+        for adjustment_items, inbound in ((wholesale_items, True), (retail_items, False)):
+            if not adjustment_items:
+                continue
+            direction = {
+                'receiver_company_id': company_id,
+                'arrival_center_id': center_update.center_id
+            } if inbound else {
+                'supplier_company_id': company_id,
+                'departure_center_id': center_update.center_id
+            }
             shipment = Shipment(
+                id=uuid.uuid4(),
                 title=f"인벤토리 조정 - {center_update.center_id}",
                 creator_id=profile_id,
-                supplier_company_id=company_id,
-                departure_center_id=center_update.center_id,
                 shipment_status="completed",
-                shipment_datetime=update_request.snapshot_date,
-                contract_id=contract_id
+                shipment_datetime=datetime.combine(update_request.snapshot_date, time.min),
+                contract_id=contract_id,
+                **direction
             )
-            db.add(shipment)
-            db.flush()
-            for item in retail_items:
-                shipment_item = ShipmentItem(
-                    shipment_id=shipment.id,
-                    product_name=item['product_name'],
-                    quantity=item['quantity'],
-                    quality=item['quality'],
-                    unit_price=item['unit_price'],
-                    total_price=item['total_price']
-                )
-                db.add(shipment_item)
+            item_rows = [
+                {
+                    'id': uuid.uuid4(),
+                    'shipment_id': shipment.id,
+                    'product_name': item_update.product_name,
+                    'quantity': quantity,
+                    'quality': item_update.quality,
+                    'unit_price': item_update.unit_price,
+                    'total_price': quantity * item_update.unit_price
+                }
+                for item_update, quantity in adjustment_items
+            ]
             created_shipments.append(shipment)
-        
-        # 2.5 센터 스냅샷 업데이트
-        db_snapshot.total_quantity = sum(item.quantity for item in center_update.items)
-        db_snapshot.total_price = sum(item.quantity * item.unit_price for item in center_update.items)
-    
-    # 3. 이후 날짜의 스냅샷들 업데이트
-    # 향후 30일까지만 업데이트하도록 제한
-    max_future_days = 30
-    next_date = update_request.snapshot_date + timedelta(days=1)
-    days_processed = 0
-    
-    # 업데이트된 모든 센터 ID 수집
-    updated_center_ids = [center_update.center_id for center_update in update_request.centers]
-    
-    while days_processed < max_future_days:
-        # 모든 센터에 대해 다음 날짜의 스냅샷이 존재하는지 확인
-        existing_snapshots = db.query(CenterInventorySnapshotModel).filter(
-            and_(
-                CenterInventorySnapshotModel.snapshot_date == next_date,
-                CenterInventorySnapshotModel.company_id == company_id,
-                CenterInventorySnapshotModel.center_id.in_(updated_center_ids)
+            shipment_item_rows.extend(item_rows)
+            ledger_movements.extend(
+                build_shipment_movements(shipment, [ShipmentItem(**row) for row in item_rows])
             )
-        ).all()
-        
-        if not existing_snapshots:
-            # 더 이상 미래의 스냅샷이 없으면 종료
-            break
-            
-        # 각 센터의 기존 스냅샷을 업데이트
-        for center_id in updated_center_ids:
-            create_daily_center_inventory_snapshot(db, next_date, company_id, center_id, profile_id, contract_id=contract_id)
-        
-        next_date = next_date + timedelta(days=1)
-        days_processed += 1
-    
+
+        # 2.3 센터 스냅샷 업데이트 (총합은 실제 저장된 아이템 기준)
+        invalidate_after_commit(db, db_snapshot.center_id, db_snapshot.snapshot_date)
+        db_snapshot.total_quantity = sum(item.quantity for item in db_snapshot.resolved_items)
+        db_snapshot.total_price = sum(item.total_price for item in db_snapshot.resolved_items)
+
+    # 2.4 조정 출하는 한 번에 flush, 아이템은 한 번에 bulk insert
+    if created_shipments:
+        db.add_all(created_shipments)
+        db.flush()
+    if shipment_item_rows:
+        db.execute(insert(ShipmentItem), shipment_item_rows)
+    # 조정 출하도 일반 출하와 같이 원장에 기록 (수정한 날짜 자체는 위에서 직접 맞췄으므로 스냅샷 반영은 다음 날부터)
+    invalidate_daily_inventory_balances(db, record_inventory_movements(db, ledger_movements))
+
+    # 3. 이후 날짜의 스냅샷들에 수량 변경분 반영
+    propagate_inventory_movements(db, net_inventory_movements(quantity_adjustments))
+
     db.commit()
-    
+
     # 업데이트된 스냅샷 반환
     updated_snapshot = get_daily_company_inventory_snapshot(db, update_request.snapshot_date, company_id)
     return updated_snapshot, created_shipments, created_shipments
+
+def build_shipment_movements(shipment: Shipment, items, sign: int = 1) -> List[dict]:
+    """
+    출하 한 건이 센터 재고에 주는 변동(출발 센터 −, 도착 센터 +)을 원장 행 형태로 만듭니다.
+    sign=-1이면 기존 변동을 되돌리는 행을 만듭니다.
+    """
+    if not shipment.shipment_datetime:
+        return []
+
+    sides = []
+    if shipment.departure_center_id and shipment.supplier_company_id:
+        sides.append((-1, shipment.supplier_company_id, shipment.departure_center_id))
+    if shipment.arrival_center_id and shipment.receiver_company_id:
+        sides.append((1, shipment.receiver_company_id, shipment.arrival_center_id))
+
+    movement_date = shipment.shipment_datetime.date()
+    return [
+        {
+            'company_id': company_id,
+            'center_id': center_id,
+            'product_name': item.product_name,
+            'quality': item.quality,
+            'movement_date': movement_date,
+            'quantity_delta': item.quantity * multiplier * sign,
+            'unit_price': item.unit_price,
+            'shipment_id': shipment.id
+        }
+        for multiplier, company_id, center_id in sides
+        for item in items
+    ]
+
+def net_inventory_movements(movements: List[dict]) -> List[dict]:
+    """
+    (회사, 센터, 상품명, 품질, 일자)별로 변동을 합산하고 합계가 0인 변동은 제외합니다.
+    """
+    netted = {}
+    for movement in movements:
+        key = (
+            movement['company_id'], movement['center_id'],
+            movement['product_name'], movement['quality'], movement['movement_date']
+        )
+        if key in netted:
+            netted[key]['quantity_delta'] += movement['quantity_delta']
+            if movement['quantity_delta'] > 0:
+                netted[key]['unit_price'] = movement['unit_price']
+        else:
+            netted[key] = dict(movement)
+    return [movement for movement in netted.values() if movement['quantity_delta'] != 0]
+
+def record_inventory_movements(db: Session, movements: List[dict]) -> List[dict]:
+    """
+    재고 변동을 원장에 추가합니다. 커밋은 호출하는 쪽에서 합니다.
+    """
+    movements = net_inventory_movements(movements)
+    if movements:
+        db.execute(
+            insert(InventoryLedgerEntry),
+            [dict(movement, id=uuid.uuid4()) for movement in movements]
+        )
+    return movements
+
+def get_center_inventory_balance(
+    db: Session,
+    target_date: date,
+    company_id: UUID,
+    center_id: UUID,
+    after_date: Optional[date] = None
+) -> List:
+    """
+    원장의 누적 합계(prefix sum)로 특정 일자 종료 시점의 센터 재고를 (상품명, 품질)별로 조회합니다.
+    after_date가 주어지면 after_date 다음 날부터의 변동만 합산합니다(체크포인트 이후 변동분).
+    각 행은 (product_name, quality, quantity, unit_price)입니다. unit_price는 _apply_day_deltas와 같은 규칙으로,
+    품목이 처음 변동한 날의 첫 방향(출하 → 입하 순서) 변동들의 평균 단가입니다.
+    (일자, 방향)별로 먼저 묶으므로 순서가 같은 행이 여러 개여도 결과가 하나로 정해집니다.
+    """
+    filters = [
+        InventoryLedgerEntry.center_id == center_id,
+        InventoryLedgerEntry.company_id == company_id,
+        InventoryLedgerEntry.movement_date <= target_date
+    ]
+    if after_date is not None:
+        filters.append(InventoryLedgerEntry.movement_date > after_date)
+
+    # (상품명, 품질, 일자, 방향)별 변동 합계와 평균 단가
+    direction = case((InventoryLedgerEntry.quantity_delta < 0, -1), else_=1)
+    daily = select(
+        InventoryLedgerEntry.product_name,
+        InventoryLedgerEntry.quality,
+        InventoryLedgerEntry.movement_date,
+        direction.label('direction'),
+        func.sum(InventoryLedgerEntry.quantity_delta).label('quantity_delta'),
+        func.avg(InventoryLedgerEntry.unit_price).label('unit_price')
+    ).where(*filters).group_by(
+        InventoryLedgerEntry.product_name,
+        InventoryLedgerEntry.quality,
+        InventoryLedgerEntry.movement_date,
+        direction
+    ).subquery()
+
+    partition = (daily.c.product_name, daily.c.quality)
+    ranked = select(
+        daily.c.product_name,
+        daily.c.quality,
+        func.sum(daily.c.quantity_delta).over(partition_by=partition).label('quantity'),
+        daily.c.unit_price,
+        func.row_number().over(
+            partition_by=partition,
+            order_by=(daily.c.movement_date, daily.c.direction)
+        ).label('position')
+    ).subquery()
+
+    return db.execute(
+        select(
+            ranked.c.product_name,
+            ranked.c.quality,
+            ranked.c.quantity,
+            ranked.c.unit_price
+        ).where(ranked.c.position == 1).order_by(ranked.c.product_name, ranked.c.quality)
+    ).all()
+
+def propagate_inventory_movements(db: Session, movements: List[dict]) -> None:
+    """
+    재고 변동을 변동 일자 이후의 finalized 되지 않은 스냅샷들에 증분으로 반영합니다.
+    finalized 스냅샷은 체크포인트 재생과 마찬가지로 확정된 기준점이므로, 변동 일자 이후 처음 만나는
+    finalized 스냅샷에서 반영을 멈춥니다(그 뒤의 스냅샷은 그 기준점에서 이어지므로 바뀌지 않습니다).
+    영향받은 아이템을 한 번의 INSERT ... ON CONFLICT DO UPDATE로 더하거나 추가한 뒤
+    영향받은 스냅샷의 총합을 다시 계산합니다. 커밋은 호출하는 쪽에서 합니다.
+    """
+    if not movements:
+        return
+
+    # (스냅샷 id, 상품명, 품질) -> 아이템 행. 같은 아이템에 여러 변동이 겹치면 미리 합칩니다.
+    item_rows = {}
+    affected_snapshot_ids = set()
+    for movement in movements:
+        same_center = and_(
+            CenterInventorySnapshotModel.company_id == movement['company_id'],
+            CenterInventorySnapshotModel.center_id == movement['center_id']
+        )
+        # 변동 일자 이후 처음 만나는 finalized 스냅샷 (없으면 NULL)
+        next_finalized_date = db.query(func.min(CenterInventorySnapshotModel.snapshot_date)).filter(
+            same_center,
+            CenterInventorySnapshotModel.finalized == True,
+            CenterInventorySnapshotModel.snapshot_date >= movement['movement_date']
+        ).scalar_subquery()
+        snapshot_ids = db.query(CenterInventorySnapshotModel.id).filter(
+            same_center,
+            CenterInventorySnapshotModel.snapshot_date >= movement['movement_date'],
+            CenterInventorySnapshotModel.finalized == False,
+            or_(
+                next_finalized_date.is_(None),
+                CenterInventorySnapshotModel.snapshot_date < next_finalized_date
+            )
+        ).all()
+        qty_delta = movement['quantity_delta']
+
+        for (snapshot_id,) in snapshot_ids:
+            affected_snapshot_ids.add(snapshot_id)
+            key = (snapshot_id, movement['product_name'], movement['quality'])
+            row = item_rows.get(key)
+            if row:
+                row['quantity'] += qty_delta
+                row['total_price'] = row['quantity'] * row['unit_price']
+                continue
+            item_rows[key] = {
+                'id': uuid.uuid4(),
+                'center_inventory_snapshot_id': snapshot_id,
+                'product_name': movement['product_name'],
+                'quality': movement['quality'],
+                'quantity': qty_delta,
+                'unit_price': movement['unit_price'],
+                'total_price': qty_delta * movement['unit_price']
+            }
+
+    if not item_rows:
+        return
+
+    # 아이템이 있으면 수량을 더하고, 없으면 새로 추가 (존재 여부를 따로 조회하지 않음)
+    stmt = _upsert_statement(db, CenterInventorySnapshotItemModel)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['center_inventory_snapshot_id', 'product_name', 'quality'],
+        set_={
+            'quantity': CenterInventorySnapshotItemModel.quantity + stmt.excluded.quantity,
+            'total_price':
+                (CenterInventorySnapshotItemModel.quantity + stmt.excluded.quantity)
+                * CenterInventorySnapshotItemModel.unit_price,
+            'updated_at': func.now()
+        }
+    )
+    db.execute(stmt, list(item_rows.values()))
+
+    # 영향받은 스냅샷 총합 재계산
+    item_total_quantity = db.query(
+        func.coalesce(func.sum(CenterInventorySnapshotItemModel.quantity), 0)
+    ).filter(
+        CenterInventorySnapshotItemModel.center_inventory_snapshot_id == CenterInventorySnapshotModel.id
+    ).scalar_subquery()
+    item_total_price = db.query(
+        func.coalesce(func.sum(CenterInventorySnapshotItemModel.total_price), 0.0)
+    ).filter(
+        CenterInventorySnapshotItemModel.center_inventory_snapshot_id == CenterInventorySnapshotModel.id
+    ).scalar_subquery()
+    db.query(CenterInventorySnapshotModel).filter(
+        CenterInventorySnapshotModel.id.in_(affected_snapshot_ids)
+    ).update(
+        {
+            CenterInventorySnapshotModel.total_quantity: item_total_quantity,
+            CenterInventorySnapshotModel.total_price: item_total_price
+        },
+        synchronize_session=False
+    )
+
+
+def invalidate_daily_inventory_balances(db: Session, movements: List[dict]) -> None:
+    """
+    재고 변동이 생긴 센터의 일별 요약 중 가장 이른 변동 일자 이후의 행을 지우고,
+    유효 범위를 그 전날까지로 줄입니다. 다음 refresh는 줄어든 지점부터만 다시 계산합니다.
+    refresh와 엇갈리지 않도록 센터 잠금 안에서 처리하며, 커밋은 호출하는 쪽에서 합니다.
+    """
+    earliest_dates = {}
+    for movement in movements:
+        key = (movement['company_id'], movement['center_id'])
+        if key not in earliest_dates or movement['movement_date'] < earliest_dates[key]:
+            earliest_dates[key] = movement['movement_date']
+
+    # 교착 상태를 피하기 위해 스냅샷 재생성과 같은 순서로 센터 잠금을 잡음
+    for (company_id, center_id), movement_date in sorted(earliest_dates.items(), key=lambda entry: str(entry[0][1])):
+        with center_snapshot_lock(db, company_id, center_id):
+            db.query(DailyInventoryBalance).filter(
+                and_(
+                    DailyInventoryBalance.center_id == center_id,
+                    DailyInventoryBalance.balance_date >= movement_date
+                )
+            ).delete(synchronize_session=False)
+            coverage = db.get(DailyInventoryBalanceCoverage, center_id)
+            if not coverage or coverage.valid_through < movement_date:
+                continue
+            if coverage.valid_from >= movement_date:
+                db.delete(coverage)
+            else:
+                coverage.valid_through = movement_date - timedelta(days=1)
+
+def _refresh_center_daily_balances(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    center_id: UUID
+) -> int:
+    """
+    센터의 일별 요약이 [start_date, end_date]를 덮도록 필요한 날짜만 다시 계산해 기록합니다.
+    유효 범위가 start_date 전날까지 이어져 있으면 valid_through 다음 날부터 그날의 요약 행을 시작 잔고로 이어서 계산하고,
+    그렇지 않으면 start_date부터 finalized 기준점과 원장 합계로 시작 잔고를 구해 다시 계산합니다.
+    구간 안의 finalized 스냅샷은 기준점으로 사용합니다. 반환값은 기록한 요약 행 수입니다. 커밋은 호출하는 쪽에서 합니다.
+    """
+    coverage = db.get(DailyInventoryBalanceCoverage, center_id)
+    if coverage and coverage.valid_from <= start_date and coverage.valid_through >= end_date:
+        return 0
+
+    if coverage and coverage.valid_from <= start_date and coverage.valid_through >= start_date - timedelta(days=1):
+        refresh_start = coverage.valid_through + timedelta(days=1)
+        valid_from = coverage.valid_from
+        opening_balances = {
+            (row.product_name, row.quality): [row.quantity, row.unit_price, row.total_price]
+            for row in db.query(DailyInventoryBalance).filter(
+                and_(
+                    DailyInventoryBalance.center_id == center_id,
+                    DailyInventoryBalance.balance_date == coverage.valid_through
+                )
+            )
+        }
+        stale_from = refresh_start
+    else:
+        # 이어서 계산할 수 없으면 센터의 요약을 새 범위로 교체
+        refresh_start = start_date
+        valid_from = start_date
+        opening_balances = _opening_center_balances(db, start_date, company_id, center_id)
+        stale_from = None
+
+    finalized_by_date = {
+        snapshot_date: snapshot
+        for snapshot_date, snapshot in _load_center_snapshots_with_items(
+            db, refresh_start, end_date, company_id, center_id
+        ).items()
+        if snapshot.finalized
+    }
+    deltas = _load_center_ledger_deltas(db, refresh_start, end_date, company_id, center_id)
+
+    balance_rows = []
+    for current_date, balances, _ in _replay_daily_balances(
+        refresh_start, end_date, finalized_by_date, deltas, opening_balances
+    ):
+        balance_rows.extend(
+            {
+                'id': uuid.uuid4(),
+                'company_id': company_id,
+                'center_id': center_id,
+                'balance_date': current_date,
+                'product_name': product_name,
+                'quality': quality,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'total_price': total_price
+            }
+            for (product_name, quality), (quantity, unit_price, total_price) in balances.items()
+        )
+
+    stale_rows = db.query(DailyInventoryBalance).filter(DailyInventoryBalance.center_id == center_id)
+    if stale_from is not None:
+        stale_rows = stale_rows.filter(DailyInventoryBalance.balance_date >= stale_from)
+    stale_rows.delete(synchronize_session=False)
+    if balance_rows:
+        db.execute(insert(DailyInventoryBalance), balance_rows)
+
+    if not coverage:
+        coverage = DailyInventoryBalanceCoverage(center_id=center_id, company_id=company_id)
+        db.add(coverage)
+    coverage.valid_from = valid_from
+    coverage.valid_through = end_date
+    return len(balance_rows)
+
+def refresh_daily_inventory_balances(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID
+) -> int:
+    """
+    회사의 일별 재고 요약이 [start_date, end_date]를 덮도록 센터별로 필요한 날짜만 원장으로부터 계산합니다.
+    이미 유효한 날짜는 다시 계산하지 않으므로, 출하 변경이 없으면 두 번째 refresh는 아무것도 쓰지 않습니다.
+    센터 잠금을 잡은 채 지우기와 쓰기를 하나의 트랜잭션으로 처리하므로 동시에 실행되어도 충돌하지 않고,
+    커밋 전까지 조회는 이전 요약을 그대로 읽습니다. 반환값은 기록한 요약 행 수입니다.
+    """
+    if start_date > end_date:
+        return 0
+
+    center_ids = [center_id for (center_id,) in db.query(Center.id).filter(Center.company_id == company_id).all()]
+
+    refreshed_rows = 0
+    # 교착 상태를 피하기 위해 항상 같은 순서로 센터 잠금을 잡고, 커밋할 때까지 유지
+    with ExitStack() as locks:
+        for center_id in sorted(center_ids, key=str):
+            locks.enter_context(center_snapshot_lock(db, company_id, center_id))
+            refreshed_rows += _refresh_center_daily_balances(db, start_date, end_date, company_id, center_id)
+        db.commit()
+    return refreshed_rows
+
+def _load_daily_balance_snapshots(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    company_id: UUID,
+    centers: List[Center]
+) -> dict:
+    """
+    일별 요약이 유효한 (센터, 날짜)만 {(센터 id, 날짜): CenterInventorySnapshot}으로 반환합니다.
+    요약이 덮지 않는 (센터, 날짜)는 포함하지 않습니다.
+    """
+    if not centers:
+        return {}
+
+    coverages = db.query(DailyInventoryBalanceCoverage).filter(
+        and_(
+            DailyInventoryBalanceCoverage.center_id.in_([center.id for center in centers]),
+            DailyInventoryBalanceCoverage.valid_from <= end_date,
+            DailyInventoryBalanceCoverage.valid_through >= start_date
+        )
+    ).all()
+    if not coverages:
+        return {}
+
+    rows = db.query(DailyInventoryBalance).filter(
+        and_(
+            DailyInventoryBalance.company_id == company_id,
+            DailyInventoryBalance.center_id.in_([coverage.center_id for coverage in coverages]),
+            DailyInventoryBalance.balance_date >= start_date,
+            DailyInventoryBalance.balance_date <= end_date
+        )
+    ).order_by(DailyInventoryBalance.product_name, DailyInventoryBalance.quality).all()
+    rows_by_key = defaultdict(list)
+    for row in rows:
+        rows_by_key[(row.center_id, row.balance_date)].append(row)
+
+    centers_by_id = {center.id: center for center in centers}
+    balance_snapshots = {}
+    for coverage in coverages:
+        center = centers_by_id[coverage.center_id]
+        current_date = max(start_date, coverage.valid_from)
+        while current_date <= min(end_date, coverage.valid_through):
+            center_rows = rows_by_key[(center.id, current_date)]
+            balance_snapshots[(center.id, current_date)] = CenterInventorySnapshot(
+                center_id=center.id,
+                center_name=center.name,
+                total_quantity=sum(row.quantity for row in center_rows),
+                total_price=sum(row.total_price for row in center_rows),
+                items=[
+                    InventorySnapshotItem(
+                        product_name=row.product_name,
+                        quality=row.quality,
+                        quantity=row.quantity,
+                        unit_price=row.unit_price,
+                        total_price=row.total_price
+                    ) for row in center_rows
+                ]
+            )
+            current_date += timedelta(days=1)
+    return balance_snapshots
+
+def get_daily_company_inventory_balance(
+    db: Session,
+    target_date: date,
+    company_id: UUID
+) -> DailyInventorySnapshot:
+    """
+    일별 재고 요약 테이블을 읽어 회사 전체 재고를 조회합니다. 스냅샷을 생성하거나 커밋하지 않습니다.
+    요약이 덮지 않는 센터(아직 refresh 전이거나 출하 변경으로 무효화된 센터)는 원장으로 계산해서 반환합니다.
+    """
+    centers = db.query(Center).filter(Center.company_id == company_id).order_by(Center.name).all()
+    balance_snapshots = _load_daily_balance_snapshots(db, target_date, target_date, company_id, centers)
+
+    center_snapshots = []
+    for center in centers:
+        center_snapshot = balance_snapshots.get((center.id, target_date))
+        if not center_snapshot:
+            center_snapshot = compute_center_inventory_snapshots(db, target_date, target_date, company_id, center)[target_date]
+        center_snapshots.append(center_snapshot)
+    return DailyInventorySnapshot(snapshot_date=target_date, centers=center_snapshots)
+
+def get_point_in_time_inventory(
+    db: Session,
+    target_date: date,
+    company_id: UUID,
+    center_id: UUID,
+    product_name: Optional[str] = None,
+    quality: Optional[ProductQuality] = None
+) -> PointInTimeInventory:
+    """
+    스냅샷 없이 shipments/shipment_items만으로 target_date 종료 시점의 센터 재고를 계산합니다.
+    일별 순변동을 (센터, 상품명, 품질)로 나눠 날짜순 SUM() OVER 로 누적 잔고를 구하고,
+    MAX() OVER 로 구한 target_date 이전의 마지막 변동일 잔고만 남깁니다.
+    """
+    end_datetime = datetime.combine(target_date + timedelta(days=1), time.min)
+
+    def movements(center_column, company_column, sign):
+        query = select(
+            center_column.label('center_id'),
+            ShipmentItem.product_name.label('product_name'),
+            ShipmentItem.quality.label('quality'),
+            func.date(Shipment.shipment_datetime).label('movement_date'),
+            (ShipmentItem.quantity * sign).label('quantity_delta')
+        ).join(Shipment, ShipmentItem.shipment_id == Shipment.id).where(
+            center_column == center_id,
+            company_column == company_id,
+            Shipment.shipment_datetime < end_datetime
+        )
+        if product_name is not None:
+            query = query.where(ShipmentItem.product_name == product_name)
+        if quality is not None:
+            query = query.where(ShipmentItem.quality == quality)
+        return query
+
+    movement_rows = union_all(
+        movements(Shipment.departure_center_id, Shipment.supplier_company_id, -1),
+        movements(Shipment.arrival_center_id, Shipment.receiver_company_id, 1)
+    ).subquery()
+
+    daily = select(
+        movement_rows.c.center_id,
+        movement_rows.c.product_name,
+        movement_rows.c.quality,
+        movement_rows.c.movement_date,
+        func.sum(movement_rows.c.quantity_delta).label('net_delta')
+    ).group_by(
+        movement_rows.c.center_id,
+        movement_rows.c.product_name,
+        movement_rows.c.quality,
+        movement_rows.c.movement_date
+    ).subquery()
+
+    partition = (daily.c.center_id, daily.c.product_name, daily.c.quality)
+    running = select(
+        daily.c.product_name,
+        daily.c.quality,
+        daily.c.movement_date,
+        func.sum(daily.c.net_delta).over(
+            partition_by=partition,
+            order_by=daily.c.movement_date
+        ).label('quantity'),
+        func.max(daily.c.movement_date).over(partition_by=partition).label('last_movement_date')
+    ).subquery()
+
+    # daily는 (센터, 상품명, 품질, 일자)별 한 행이므로 마지막 변동일의 행은 항상 하나
+    rows = db.execute(
+        select(
+            running.c.product_name,
+            running.c.quality,
+            running.c.movement_date,
+            running.c.quantity
+        ).where(running.c.movement_date == running.c.last_movement_date).order_by(
+            running.c.product_name, running.c.quality
+        )
+    ).all()
+
+    return PointInTimeInventory(
+        center_id=center_id,
+        as_of_date=target_date,
+        items=[
+            PointInTimeInventoryItem(
+                product_name=row.product_name,
+                quality=row.quality,
+                quantity=row.quantity,
+                last_movement_date=row.movement_date
+            ) for row in rows
+        ]
+    )
+
+
+# 비동기 조회: 같은 쿼리를 AsyncSession 위에서 실행합니다 (드라이버 I/O는 이벤트 루프에서 대기).
+# run_sync의 본문은 이벤트 루프 스레드에서 실행되므로 SQL 한 번으로 끝나는 조회만 둡니다.
+# 스냅샷 재생처럼 CPU를 쓰는 조회는 스레드 풀에서 실행되는 동기 라우트에서 호출합니다.
+
+async def get_point_in_time_inventory_async(
+    db: AsyncSession,
+    target_date: date,
+    company_id: UUID,
+    center_id: UUID,
+    product_name: Optional[str] = None,
+    quality: Optional[ProductQuality] = None
+) -> PointInTimeInventory:
+    return await db.run_sync(
+        get_point_in_time_inventory, target_date, company_id, center_id, product_name, quality
+    )
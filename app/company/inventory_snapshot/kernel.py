@@ -0,0 +1,119 @@
+"""
+여러 센터의 일별 재고 잔고를 한 번에 계산하는 컬럼형 커널.
+
+출하 델타를 (일자, 센터, 상품×품질) 축의 배열로 모은 뒤 누적합으로 모든 날짜의 잔고를 구합니다.
+NumPy는 선택 의존성이며, 설치되어 있지 않으면 is_available()이 False를 반환하고
+호출 측은 센터별 재생(create_daily_snapshots_from_shipments)으로 대체해야 합니다.
+"""
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy 미설치 환경
+    np = None
+
+
+def is_available() -> bool:
+    return np is not None
+
+
+def compute_daily_balances(
+    day_count: int,
+    center_count: int,
+    key_count: int,
+    deltas: List[Tuple[int, int, int, int, int, float]],
+    anchors: Dict[Tuple[int, int], List[Tuple[int, int, float]]]
+):
+    """
+    일별 잔고를 계산합니다.
+
+    - deltas: (일자 인덱스, 센터 인덱스, 키 인덱스, 방향(출하 -1 / 입하 +1), 수량, 단가)
+    - anchors: (일자 인덱스, 센터 인덱스) -> [(키 인덱스, 수량, 단가)]
+      이미 존재하는 스냅샷으로, 해당 날짜의 잔고를 그대로 고정(리셋)합니다.
+      일자 인덱스 -1은 시작일 전날(시작 잔고)입니다.
+
+    반환값은 (quantity, unit_price, present, anchored) 배열이며,
+    앞의 세 배열은 [day_count, center_count, key_count], anchored는 [day_count, center_count] 모양입니다.
+    센터별 재생과 동일하게 같은 날에는 출하(−) → 입하(+) 순서로 적용하고,
+    새 품목의 단가는 처음 반영된 날 먼저 적용된 방향의 평균 단가를 사용합니다.
+    """
+    # 0번 축은 시작일 전날을 포함하므로 길이가 day_count + 1
+    total_days = day_count + 1
+    shape = (total_days, center_count, key_count)
+
+    out_qty = np.zeros(shape, dtype=np.int64)
+    in_qty = np.zeros(shape, dtype=np.int64)
+    out_price = np.zeros(shape, dtype=np.float64)
+    in_price = np.zeros(shape, dtype=np.float64)
+    out_count = np.zeros(shape, dtype=np.int64)
+    in_count = np.zeros(shape, dtype=np.int64)
+
+    if deltas:
+        columns = np.array(deltas, dtype=np.float64)
+        days = columns[:, 0].astype(np.int64) + 1
+        centers = columns[:, 1].astype(np.int64)
+        keys = columns[:, 2].astype(np.int64)
+        directions = columns[:, 3]
+        quantities = columns[:, 4].astype(np.int64)
+        prices = columns[:, 5]
+
+        for direction, qty_acc, price_acc, count_acc in (
+            (-1, out_qty, out_price, out_count),
+            (1, in_qty, in_price, in_count)
+        ):
+            mask = directions == direction
+            index = (days[mask], centers[mask], keys[mask])
+            np.add.at(qty_acc, index, quantities[mask])
+            np.add.at(price_acc, index, prices[mask])
+            np.add.at(count_acc, index, 1)
+
+    # 리셋(기존 스냅샷) 지점과 그 시점의 잔고
+    anchored = np.zeros((total_days, center_count), dtype=bool)
+    anchored[0, :] = True
+    anchor_qty = np.zeros(shape, dtype=np.int64)
+    anchor_price = np.zeros(shape, dtype=np.float64)
+    anchor_has = np.zeros(shape, dtype=bool)
+    for (day_index, center_index), items in anchors.items():
+        anchored[day_index + 1, center_index] = True
+        for key_index, quantity, unit_price in items:
+            anchor_qty[day_index + 1, center_index, key_index] = quantity
+            anchor_price[day_index + 1, center_index, key_index] = unit_price
+            anchor_has[day_index + 1, center_index, key_index] = True
+
+    day_axis = np.arange(total_days)[:, None]
+    last_anchor = np.maximum.accumulate(np.where(anchored, day_axis, 0), axis=0)
+    last_anchor_3d = np.broadcast_to(last_anchor[:, :, None], shape)
+
+    # 수량: 직전 리셋 잔고 + (누적 델타 - 리셋 시점 누적 델타)
+    cumulative = np.cumsum(in_qty - out_qty, axis=0)
+    quantity = (
+        np.take_along_axis(anchor_qty, last_anchor_3d, axis=0)
+        + cumulative
+        - np.take_along_axis(cumulative, last_anchor_3d, axis=0)
+    )
+
+    # 단가: 리셋 잔고에 있던 품목은 그 단가, 아니면 리셋 이후 처음 반영된 날의 평균 단가
+    has_event = (out_count + in_count) > 0
+    day_price = np.where(
+        out_count > 0,
+        out_price / np.maximum(out_count, 1),
+        in_price / np.maximum(in_count, 1)
+    )
+    event_day = np.where(has_event, np.arange(total_days)[:, None, None], total_days)
+    next_event = np.minimum.accumulate(event_day[::-1], axis=0)[::-1]
+    next_event = np.concatenate([next_event, np.full((1, center_count, key_count), total_days)], axis=0)
+    first_event = np.take_along_axis(next_event, last_anchor_3d + 1, axis=0)
+
+    day_index = np.broadcast_to(np.arange(total_days)[:, None, None], shape)
+    event_present = first_event <= day_index
+    event_price = np.take_along_axis(day_price, np.minimum(first_event, total_days - 1), axis=0)
+
+    has_anchor_item = np.take_along_axis(anchor_has, last_anchor_3d, axis=0)
+    unit_price = np.where(
+        has_anchor_item,
+        np.take_along_axis(anchor_price, last_anchor_3d, axis=0),
+        event_price
+    )
+    present = has_anchor_item | event_present
+
+    return quantity[1:], unit_price[1:], present[1:], anchored[1:]
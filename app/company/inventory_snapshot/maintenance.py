@@ -0,0 +1,47 @@
+"""
+인벤토리 스냅샷 유지보수 명령.
+
+    python -m app.company.inventory_snapshot.maintenance compact [--company-id ID] [--center-id ID] [--vacuum]
+"""
+import argparse
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.company.inventory_snapshot.crud import compact_center_inventory_snapshots
+
+
+def compact(company_id: UUID = None, center_id: UUID = None, vacuum: bool = False) -> int:
+    """finalized 스냅샷 이력을 압축하고, 필요하면 아이템 테이블을 VACUUM 합니다."""
+    from app.database.session import SessionLocal, engine
+
+    db = SessionLocal()
+    try:
+        compacted = compact_center_inventory_snapshots(db, company_id, center_id)
+    finally:
+        db.close()
+
+    if vacuum and engine.dialect.name == "postgresql":
+        # VACUUM은 트랜잭션 밖에서만 실행할 수 있음
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM (ANALYZE) center_snapshot_items"))
+    return compacted
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="인벤토리 스냅샷 유지보수")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compact_parser = subparsers.add_parser("compact", help="변동 없는 날의 스냅샷 아이템을 압축합니다.")
+    compact_parser.add_argument("--company-id", type=UUID)
+    compact_parser.add_argument("--center-id", type=UUID)
+    compact_parser.add_argument("--vacuum", action="store_true", help="압축 후 VACUUM (ANALYZE) 실행 (PostgreSQL)")
+
+    args = parser.parse_args(argv)
+    if args.command == "compact":
+        compacted = compact(args.company_id, args.center_id, args.vacuum)
+        print(f"압축된 스냅샷: {compacted}개")
+
+
+if __name__ == "__main__":
+    main()
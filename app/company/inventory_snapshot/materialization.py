@@ -0,0 +1,81 @@
+"""
+조회 경로에서 계산만 하고 저장하지 않은 스냅샷을 백그라운드에서 저장하는 큐.
+
+(center_id, 날짜) 단위로 중복을 제거하며, drain()은 센터별로 가장 늦은 날짜까지 한 번에 재생합니다.
+"""
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+
+class SnapshotMaterializationQueue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (center_id, 날짜) -> company_id
+        self._pending: Dict[Tuple[UUID, date], UUID] = {}
+
+    def enqueue(self, company_id: UUID, center_id: UUID, target_date: date) -> bool:
+        """대기열에 추가합니다. 이미 대기 중인 (center_id, 날짜)면 False를 반환합니다."""
+        key = (center_id, target_date)
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending[key] = company_id
+            return True
+
+    def pending(self) -> List[Tuple[UUID, UUID, date]]:
+        """대기 중인 (company_id, center_id, 날짜) 목록을 반환합니다."""
+        with self._lock:
+            return [
+                (company_id, center_id, target_date)
+                for (center_id, target_date), company_id in self._pending.items()
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+    def drain(self, session_factory: Optional[Callable[[], Session]] = None) -> int:
+        """
+        대기 중인 스냅샷을 저장합니다. 센터마다 가장 이른 날짜부터 가장 늦은 날짜까지 한 번만 재생하며,
+        저장한 센터 수를 반환합니다. 한 센터가 실패해도 나머지 센터는 계속 처리합니다.
+        """
+        from app.company.inventory_snapshot.crud import create_daily_center_inventory_snapshot
+
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        if not pending:
+            return 0
+
+        # (company_id, center_id) -> [가장 이른 날짜, 가장 늦은 날짜]
+        ranges = defaultdict(list)
+        for (center_id, target_date), company_id in pending.items():
+            ranges[(company_id, center_id)].append(target_date)
+
+        if session_factory is None:
+            from app.database.session import SessionLocal
+            session_factory = SessionLocal
+
+        materialized = 0
+        db = session_factory()
+        try:
+            for (company_id, center_id), dates in ranges.items():
+                try:
+                    create_daily_center_inventory_snapshot(
+                        db, max(dates), company_id, center_id, from_date=min(dates)
+                    )
+                    materialized += 1
+                except Exception as e:
+                    db.rollback()
+                    print(f"스냅샷 저장 실패: center_id={center_id}, error={e}")
+        finally:
+            db.close()
+        return materialized
+
+
+materialization_queue = SnapshotMaterializationQueue()
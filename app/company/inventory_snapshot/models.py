@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Integer, func, Date, Enum, Boolean
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Integer, func, Date, Enum, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -24,6 +24,14 @@ class CenterInventorySnapshotItem(Base):
     # Relationships
     center_inventory_snapshot = relationship("CenterInventorySnapshot", back_populates="items")
 
+    __table_args__ = (
+        Index(
+            "ux_center_snapshot_items_snapshot_product",
+            "center_inventory_snapshot_id", "product_name", "quality",
+            unique=True
+        ),
+    )
+
 class CenterInventorySnapshot(Base):
     __tablename__ = "center_inventory_snapshots"
 
@@ -34,10 +42,96 @@ class CenterInventorySnapshot(Base):
     total_quantity = Column(Integer, nullable=False, default=0)
     total_price = Column(Float, nullable=False, default=0.0)
     finalized = Column(Boolean, nullable=False, default=False)
+    # 압축된 스냅샷은 아이템을 저장하지 않고, 아이템을 가진 이전 스냅샷을 가리킵니다.
+    items_snapshot_id = Column(UUID(as_uuid=True), ForeignKey("center_inventory_snapshots.id"), nullable=True, index=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     center = relationship("Center")
-    items = relationship("CenterInventorySnapshotItem", back_populates="center_inventory_snapshot")
\ No newline at end of file
+    items = relationship("CenterInventorySnapshotItem", back_populates="center_inventory_snapshot")
+    items_source = relationship("CenterInventorySnapshot", remote_side=[id])
+
+    @property
+    def resolved_items(self):
+        """압축된 스냅샷이면 아이템을 가진 이전 스냅샷의 아이템을 반환합니다."""
+        if self.items_snapshot_id is None:
+            return self.items
+        return self.items_source.items
+
+    __table_args__ = (
+        Index(
+            "ux_center_inventory_snapshots_company_center_date",
+            "company_id", "center_id", "snapshot_date",
+            unique=True
+        ),
+    )
+
+class InventoryLedgerEntry(Base):
+    """센터 재고 변동 원장 (append-only). 특정 일자의 잔고는 해당 일자까지의 quantity_delta 합계입니다."""
+    __tablename__ = "inventory_ledger_entries"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
+    center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"), nullable=False)
+    product_name = Column(String, nullable=False)
+    quality = Column(Enum(ProductQuality), nullable=False)
+    movement_date = Column(Date, nullable=False)
+    quantity_delta = Column(Integer, nullable=False)
+    unit_price = Column(Float, nullable=False)
+    # 출하가 삭제되어도 원장은 남아야 하므로 FK를 두지 않습니다.
+    shipment_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_inventory_ledger_entries_center_product_date",
+            "center_id", "product_name", "quality", "movement_date"
+        ),
+    )
+
+class DailyInventoryBalance(Base):
+    """
+    조회 전용 일별 재고 요약 테이블 (센터 x 상품 x 품질 x 일자).
+    재고 원장으로부터 refresh 작업이 계산하며, 조회 API는 쓰기 없이 이 테이블을 읽습니다.
+    센터별로 유효한 날짜 범위는 DailyInventoryBalanceCoverage에 기록합니다.
+    """
+    __tablename__ = "daily_inventory_balances"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
+    center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"), nullable=False)
+    balance_date = Column(Date, nullable=False)
+    product_name = Column(String, nullable=False)
+    quality = Column(Enum(ProductQuality), nullable=False)
+    quantity = Column(Integer, nullable=False, default=0)
+    unit_price = Column(Float, nullable=False)
+    total_price = Column(Float, nullable=False, default=0.0)
+
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_daily_inventory_balances_company_date", "company_id", "balance_date"),
+        Index(
+            "ux_daily_inventory_balances_center_date_product",
+            "center_id", "balance_date", "product_name", "quality",
+            unique=True
+        ),
+    )
+
+class DailyInventoryBalanceCoverage(Base):
+    """
+    센터별 일별 재고 요약의 유효 범위 [valid_from, valid_through].
+    출하 변경은 변동 일자 이후의 요약을 지우고 valid_through를 그 전날로 줄이며,
+    refresh는 valid_through 다음 날부터만 이어서 계산합니다.
+    """
+    __tablename__ = "daily_inventory_balance_coverage"
+
+    center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"), primary_key=True)
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False, index=True)
+    valid_from = Column(Date, nullable=False)
+    valid_through = Column(Date, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
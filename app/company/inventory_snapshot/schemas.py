@@ -23,6 +23,18 @@ class DailyInventorySnapshot(BaseModel):
     snapshot_date: date
     centers: List[CenterInventorySnapshot]
 
+class PointInTimeInventoryItem(BaseModel):
+    product_name: str
+    quality: ProductQuality
+    quantity: int
+    last_movement_date: date
+
+class PointInTimeInventory(BaseModel):
+    """출하 이력에서 바로 계산한 특정 일자 종료 시점의 센터 재고"""
+    center_id: UUID
+    as_of_date: date
+    items: List[PointInTimeInventoryItem]
+
 class InventorySnapshotResponse(BaseModel):
     rows: List[DailyInventorySnapshot]
 
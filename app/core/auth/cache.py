@@ -0,0 +1,130 @@
+"""
+인증 의존성(get_current_user, get_authenticated_profile)의 짧은 TTL 프로세스 내 캐시.
+
+사용자와 프로필의 컬럼 값만 보관하고, 캐시 적중 시 session.merge(load=False)로 세션에 붙여
+SELECT 없이 ORM 객체를 돌려줍니다. 관계(profile.company 등)는 접근할 때 평소처럼 지연 로드됩니다.
+프로필/회사 수정 엔드포인트에서 명시적으로 무효화하며, ORM으로 수정/삭제될 때도 이벤트로 무효화합니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import settings
+from app.core.auth.models import User
+from app.profile.models import Profile
+from app.company.common.models import Company
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return values
+
+    def put(self, key: Hashable, values: dict) -> None:
+        if self.ttl_seconds <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_where(self, predicate) -> None:
+        """predicate(key, values)가 참인 항목을 모두 제거합니다."""
+        with self._lock:
+            for key in [key for key, (_, values) in self._entries.items() if predicate(key, values)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# user_id -> User 컬럼 값
+user_cache = TTLCache(settings.AUTH_CACHE_TTL_SECONDS, settings.AUTH_CACHE_SIZE)
+# (profile_id, user_id) -> Profile 컬럼 값 (company_id, role 포함)
+profile_cache = TTLCache(settings.AUTH_CACHE_TTL_SECONDS, settings.AUTH_CACHE_SIZE)
+
+
+def _column_values(instance) -> dict:
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(instance).mapper.column_attrs}
+
+
+def _attach(db: Session, model, values: dict):
+    """캐시된 컬럼 값으로 만든 객체를 SELECT 없이 세션에 붙입니다."""
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return db.merge(instance, load=False)
+
+
+def get_cached_user(db: Session, user_id: UUID) -> Optional[User]:
+    values = user_cache.get(user_id)
+    return _attach(db, User, values) if values is not None else None
+
+
+def cache_user(user: User) -> None:
+    user_cache.put(user.id, _column_values(user))
+
+
+def get_cached_profile(db: Session, profile_id: UUID, user_id: UUID) -> Optional[Profile]:
+    values = profile_cache.get((profile_id, user_id))
+    return _attach(db, Profile, values) if values is not None else None
+
+
+def cache_profile(profile: Profile) -> None:
+    """소유자 확인을 통과한 프로필만 (profile_id, user_id) 키로 보관합니다."""
+    profile_cache.put((profile.id, profile.user_id), _column_values(profile))
+
+
+def invalidate_user(user_id: UUID) -> None:
+    user_cache.invalidate_where(lambda key, values: key == user_id)
+
+
+def invalidate_profile(profile_id: UUID) -> None:
+    profile_cache.invalidate_where(lambda key, values: key[0] == profile_id)
+
+
+def invalidate_company(company_id: UUID) -> None:
+    """회사에 속한 프로필을 모두 무효화합니다."""
+    profile_cache.invalidate_where(lambda key, values: values["company_id"] == company_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_updated_user(mapper, connection, target):
+    invalidate_user(target.id)
+
+
+@event.listens_for(Profile, "after_update")
+@event.listens_for(Profile, "after_delete")
+def _invalidate_updated_profile(mapper, connection, target):
+    invalidate_profile(target.id)
+
+
+@event.listens_for(Company, "after_update")
+@event.listens_for(Company, "after_delete")
+def _invalidate_updated_company(mapper, connection, target):
+    invalidate_company(target.id)
@@ -1,26 +1,49 @@
 from fastapi import HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from app.database.session import get_db
+from app.database.session import get_db, get_async_db
 from app.core.auth.models import User
 from app.core.auth.utils import verify_access_token
+from app.core.auth.cache import cache_user, get_cached_user
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+def get_current_user_id(token: str = Depends(oauth2_scheme)) -> UUID:
+    """액세스 토큰만 검증해 사용자 ID를 반환합니다. DB를 조회하지 않습니다."""
     try:
         token_data = verify_access_token(token)
-        user_id = UUID(token_data["sub"])
+        return UUID(token_data["sub"])
+    except Exception:
+        raise HTTPException(
+            status_code=401, detail="인증 정보가 유효하지 않습니다", headers={"WWW-Authenticate": "Bearer"},
+        )
+
+def _load_current_user(db: Session, user_id: UUID) -> User:
+    try:
+        user = get_cached_user(db, user_id)
+        if user:
+            return user
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             raise HTTPException(status_code=401, detail="인증된 사용자를 찾을 수 없습니다")
+        cache_user(user)
         return user
     except Exception:
         raise HTTPException(
             status_code=401, detail="인증 정보가 유효하지 않습니다", headers={"WWW-Authenticate": "Bearer"},
         )
-    
\ No newline at end of file
+
+def get_current_user(
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> User:
+    return _load_current_user(db, user_id)
+
+async def get_current_user_async(
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """비동기 핸들러용 get_current_user. 핸들러와 같은 AsyncSession(같은 커넥션)에서 조회합니다."""
+    return await db.run_sync(_load_current_user, user_id)
@@ -20,6 +20,26 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./test.db"
     TEST_DATABASE_URL: str = "sqlite:///./test.db"
     
+    # 커넥션 풀 설정
+    # DB_POOL_MODE: "queue" (QueuePool), "pgbouncer" (PgBouncer 트랜잭션 풀링 뒤, 앱 풀 없음), "null" (풀 없음)
+    DB_POOL_MODE: str = "queue"
+    DB_POOL_SIZE: int = 5           # 유지할 커넥션 수
+    DB_MAX_OVERFLOW: int = 10       # pool_size를 넘어 임시로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: int = 30       # 커넥션 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800     # 이 시간(초)이 지난 커넥션은 재연결 (-1이면 비활성화)
+    DB_POOL_PRE_PING: bool = True   # 체크아웃 시 커넥션 생존 확인
+    
+    # 스냅샷 사전 생성 워커 설정
+    SNAPSHOT_WORKER_RUN_AT: str = "00:05"  # 매일 실행 시각 (HH:MM, 서버 시간)
+    SNAPSHOT_WORKER_MAX_WORKERS: int = 4   # 동시에 처리할 회사 수
+    
+    # 인증 캐시 (get_current_user / get_authenticated_profile)
+    AUTH_CACHE_TTL_SECONDS: int = 30  # 0이면 비활성화
+    AUTH_CACHE_SIZE: int = 10000      # 사용자/프로필 캐시 각각의 최대 항목 수
+    
+    # finalized 스냅샷 LRU 캐시 크기 ((센터, 날짜) 개수)
+    FINALIZED_SNAPSHOT_CACHE_SIZE: int = 4096
+    
     # 배포 환경 설정
     ENVIRONMENT: str = "development"
     
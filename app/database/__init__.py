@@ -1,2 +1,2 @@
-from .session import get_db, engine
+from .session import get_db, get_async_db, engine, async_engine
 from .base import Base
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+커넥션 풀 구성과 체크아웃 지표.
+
+풀 방식은 Settings.DB_POOL_MODE로 고릅니다.
+- queue: 앱 프로세스 안에서 QueuePool로 커넥션을 재사용합니다 (기본값).
+- pgbouncer: PgBouncer(트랜잭션 풀링)가 풀을 담당하므로 앱 쪽 풀은 두지 않고(NullPool),
+  PgBouncer까지의 연결은 항상 새로 맺으므로 pre-ping도 하지 않습니다.
+  asyncpg는 서버 측 prepared statement를 캐시하므로 이 모드에서는 캐시를 끕니다.
+- null: 풀 없이 요청마다 새로 연결합니다.
+"""
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+POOL_MODES = ("queue", "pgbouncer", "null")
+
+
+def async_database_url(database_url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버(asyncpg, aiosqlite) URL로 바꿉니다."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+def engine_options(database_url: str, settings=None, is_async: bool = False) -> dict:
+    """설정에 맞는 create_engine(또는 create_async_engine) 풀 옵션을 반환합니다."""
+    if settings is None:
+        from app.core.config import settings
+
+    mode = settings.DB_POOL_MODE
+    if mode not in POOL_MODES:
+        raise ValueError(f"Invalid DB_POOL_MODE: {mode} (expected one of {', '.join(POOL_MODES)})")
+
+    url = make_url(database_url)
+    if mode == "pgbouncer":
+        options = {"poolclass": NullPool, "pool_pre_ping": False}
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+    if mode == "null":
+        return {"poolclass": NullPool, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # 메모리 SQLite는 커넥션마다 별도 DB이므로 방언 기본 풀을 그대로 사용
+        return {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    return {
+        "poolclass": AsyncAdaptedQueuePool if is_async else QueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+class PoolMetrics:
+    """
+    풀 이벤트로 체크아웃/체크인/새 연결/무효화 횟수와 커넥션 점유 시간을 집계합니다.
+    snapshot()은 누적 지표에 현재 풀 상태(크기, 사용 중, overflow)를 더해 반환합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.total_hold_seconds = 0.0
+            self.max_hold_seconds = 0.0
+
+    def attach(self, engine: Engine) -> None:
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.monotonic()
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is None:
+            return
+        held = time.monotonic() - checkout_at
+        with self._lock:
+            self.checkins += 1
+            self.checked_out -= 1
+            self.total_hold_seconds += held
+            self.max_hold_seconds = max(self.max_hold_seconds, held)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, engine: Optional[Engine] = None) -> dict:
+        with self._lock:
+            metrics = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "avg_hold_ms": round(self.total_hold_seconds * 1000 / self.checkins, 3) if self.checkins else 0.0,
+                "max_hold_ms": round(self.max_hold_seconds * 1000, 3),
+            }
+        if engine is not None:
+            pool = engine.pool
+            metrics["pool_class"] = type(pool).__name__
+            # QueuePool 계열만 크기/overflow 정보를 제공
+            for name in ("size", "checkedin", "checkedout", "overflow"):
+                method = getattr(pool, name, None)
+                if callable(method):
+                    metrics[f"pool_{name}"] = method()
+        return metrics
+
+
+pool_metrics = PoolMetrics()
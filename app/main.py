@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
@@ -15,6 +15,9 @@ from app.transactions.summary.api import router as summary_router
 from app.transactions.payment.api import router as payment_router
 from app.profile.api import router as profile_router
 from app.core.config import settings
+from app.core.auth.dependencies import get_current_user
+from app.database.session import engine, async_engine, async_pool_metrics
+from app.database.pool import pool_metrics
 
 app = FastAPI()
 
@@ -52,4 +55,16 @@ app.add_middleware(SetCOOPMiddleware)
 
 @app.get("/")
 def root():
-    return {"message": "HADALA API 서버가 실행 중입니다."}
\ No newline at end of file
+    return {"message": "HADALA API 서버가 실행 중입니다."}
+
+
+@app.get("/health/db", dependencies=[Depends(get_current_user)])
+def db_pool_health():
+    """
+    DB 커넥션 풀 상태와 체크아웃 지표를 반환합니다. 비동기 엔진의 풀은 "async" 항목에 담습니다.
+    내부 운영 지표이므로 로그인한 사용자만 조회할 수 있습니다.
+    """
+    return {
+        **pool_metrics.snapshot(engine),
+        "async": async_pool_metrics.snapshot(async_engine.sync_engine)
+    }
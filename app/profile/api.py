@@ -5,9 +5,10 @@ from uuid import UUID
 from app.database.session import get_db
 from app.profile import crud, schemas
 from app.core.auth.models import User
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile
 from app.profile.models import Profile, ProfileRole
 from app.core.auth.dependencies import get_current_user
+from app.core.auth.cache import invalidate_profile
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
@@ -105,13 +106,15 @@ def update_my_profile(
             detail="해당 프로필에 대한 접근 권한이 없습니다"
         )
 
-    return crud.update_my_profile(db, profile_id, profile_update)
+    updated_profile = crud.update_my_profile(db, profile_id, profile_update)
+    invalidate_profile(profile_id)
+    return updated_profile
 
 @router.put("/{profile_id}/role", response_model=schemas.ProfileResponse)
 def update_profile_role(
     profile_id: UUID,
     new_role: schemas.ProfileRoleUpdate,
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db),
 ):
     profile = crud.get_profile(db, profile_id)
@@ -123,4 +126,6 @@ def update_profile_role(
         if profile.company_id != current_profile.company_id or current_profile.role != ProfileRole.owner:
             raise HTTPException(status_code=403, detail="권한이 없습니다")
 
-    return crud.update_profile_role(db, profile.id, new_role.role) 
\ No newline at end of file
+    updated_profile = crud.update_profile_role(db, profile.id, new_role.role)
+    invalidate_profile(profile.id)
+    return updated_profile 
\ No newline at end of file
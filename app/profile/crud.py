@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, contains_eager
 from typing import List, Optional
 from uuid import UUID
 
@@ -35,6 +35,19 @@ def get_profile(db: Session, profile_id: UUID) -> Optional[Profile]:
     """
     return db.query(Profile).options(joinedload(Profile.company)).filter(Profile.id == profile_id).first()
 
+def get_profile_with_user_and_company(db: Session, profile_id: UUID) -> Optional[Profile]:
+    """
+    프로필과 소유 사용자, 소속 회사를 하나의 SQL 문(JOIN)으로 조회합니다.
+    """
+    return (
+        db.query(Profile)
+        .outerjoin(Profile.user)
+        .outerjoin(Profile.company)
+        .options(contains_eager(Profile.user), contains_eager(Profile.company))
+        .filter(Profile.id == profile_id)
+        .first()
+    )
+
 def get_profile_by_username(db: Session, username: str) -> Optional[Profile]:
     """
     username으로 프로필을 조회합니다.
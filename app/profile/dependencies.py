@@ -1,38 +1,64 @@
 from fastapi import Header, HTTPException, status, Depends
 from typing import Optional
 from uuid import UUID
-from app.database.session import get_db
-from app.core.auth.models import User
+from app.database.session import get_db, get_async_db
+from app.profile.models import Profile
 from app.profile import crud
 from sqlalchemy.orm import Session
-from app.core.auth.dependencies import get_current_user
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.auth.dependencies import get_current_user_id
+from app.core.auth.cache import cache_profile, get_cached_profile
 
 
-async def get_current_profile(
-    current_profile_id: Optional[UUID] = Header(None, alias="X-Profile-ID", description="현재 사용 중인 프로필 ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """
-    헤더의 current_profile_id를 통해 현재 사용 중인 프로필을 가져옵니다.
-    """
+def _load_authenticated_profile(db: Session, current_profile_id: Optional[UUID], current_user_id: UUID) -> Profile:
     if not current_profile_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="current_profile_id 헤더가 필요합니다"
         )
     
-    profile = crud.get_profile(db, current_profile_id)
+    profile = get_cached_profile(db, current_profile_id, current_user_id)
+    if profile:
+        return profile
+    
+    profile = crud.get_profile_with_user_and_company(db, current_profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로필을 찾을 수 없습니다"
         )
     
-    if profile.user_id != current_user.id:
+    if profile.user is None or profile.user_id != current_user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="해당 프로필에 대한 접근 권한이 없습니다"
         )
     
-    return profile 
\ No newline at end of file
+    cache_profile(profile)
+    return profile
+
+
+def get_authenticated_profile(
+    current_profile_id: Optional[UUID] = Header(None, alias="X-Profile-ID", description="현재 사용 중인 프로필 ID"),
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> Profile:
+    """
+    액세스 토큰과 X-Profile-ID 헤더로 현재 사용 중인 프로필을 가져옵니다.
+    
+    토큰 검증 후 프로필, 소유 사용자, 소속 회사를 하나의 SQL 문으로 조회해 소유권을 확인합니다.
+    (캐시 적중 시에는 조회하지 않습니다.)
+    """
+    return _load_authenticated_profile(db, current_profile_id, current_user_id)
+
+
+async def get_authenticated_profile_async(
+    current_profile_id: Optional[UUID] = Header(None, alias="X-Profile-ID", description="현재 사용 중인 프로필 ID"),
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+) -> Profile:
+    """
+    비동기 핸들러용 get_authenticated_profile.
+    핸들러와 같은 AsyncSession에서 조회하므로 이벤트 루프를 막지 않고 동기 풀 커넥션도 쓰지 않습니다.
+    """
+    return await db.run_sync(_load_authenticated_profile, current_profile_id, current_user_id)
@@ -0,0 +1,99 @@
+"""
+(정렬 시각, id) 기준 키셋(커서) 페이지네이션.
+
+커서는 마지막으로 반환한 행의 (정렬 시각, id)를 base64로 감싼 불투명 문자열이며,
+다음 페이지는 OFFSET 없이 그 행 뒤에서부터 조회하므로 페이지 깊이와 무관하게 일정한 비용이 듭니다.
+정렬 시각은 NULL일 수 있으며(예: contract_datetime), NULL 행이 가장 앞에 옵니다.
+(회사, 정렬 시각 NULLS FIRST, id) 인덱스가 이 정렬 순서와 같으므로 정렬 없이 인덱스 순서대로 읽습니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, tuple_, union_all
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: UUID) -> str:
+    """(정렬 시각, id)를 불투명 커서 문자열로 인코딩합니다."""
+    payload = json.dumps([sort_value.isoformat() if sort_value else None, str(row_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], UUID]:
+    """커서를 (정렬 시각, id)로 디코딩합니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(sort_value) if sort_value else None), UUID(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _after_cursor(query: Query, sort_column, id_column, cursor: str) -> Query:
+    """커서 행 뒤의 행만 남기는 조건을 추가합니다."""
+    sort_value, row_id = decode_cursor(cursor)
+    if sort_value is None:
+        return query.filter(or_(
+            and_(sort_column.is_(None), id_column > row_id),
+            sort_column.isnot(None)
+        ))
+    # 행 값 비교는 인덱스 범위 조건으로 쓰입니다. NULL 정렬 시각은 비교 결과가 NULL이므로 제외되며,
+    # NULL 행은 모두 커서보다 앞에 있으므로 올바른 결과입니다.
+    return query.filter(tuple_(sort_column, id_column) > tuple_(sort_value, row_id))
+
+
+def paginate_keyset(
+    query: Query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    branches: Optional[Sequence] = None
+) -> Tuple[List, Optional[str]]:
+    """
+    query를 (sort_column NULLS FIRST, id_column) 오름차순으로 정렬해 한 페이지를 조회합니다.
+
+    Args:
+        query: 필터가 적용된 쿼리
+        sort_column: 정렬 시각 컬럼
+        id_column: 동순위 구분용 id 컬럼
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor (없으면 처음부터)
+        skip: 하위 호환용 OFFSET (cursor와 함께 쓰면 커서 이후에서 건너뜀)
+        branches: 서로 겹치지 않는 필터 조건 목록. 주어지면 OR 필터 대신 조건마다 인덱스 순서로
+            한 페이지 분량의 id만 읽어 UNION ALL로 합친 뒤, 그 id들 안에서 정렬합니다.
+
+    Returns:
+        (행 목록, 다음 페이지 커서 또는 None)
+    """
+    ordering = (sort_column.asc().nullsfirst(), id_column.asc())
+    # 다음 페이지 존재 여부를 알기 위해 한 행 더 조회
+    page_size = skip + limit + 1
+
+    if branches:
+        branch_ids = []
+        for criterion in branches:
+            branch = query.filter(criterion)
+            if cursor:
+                branch = _after_cursor(branch, sort_column, id_column, cursor)
+            branch = branch.with_entities(id_column).order_by(*ordering).limit(page_size).subquery()
+            branch_ids.append(select(branch.c[id_column.key]))
+        query = query.filter(id_column.in_(union_all(*branch_ids)))
+    elif cursor:
+        query = _after_cursor(query, sort_column, id_column, cursor)
+
+    query = query.order_by(*ordering)
+    if skip:
+        query = query.offset(skip)
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.profile.models import Profile, ProfileRole
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile, get_authenticated_profile_async
 from app.transactions.contract import crud
 from app.transactions.contract.schemas import (
     ContractCreate, ContractUpdate, ContractResponse,
@@ -59,10 +60,10 @@ def check_contract_permission(
             )
 
 @router.get("/{contract_id}", response_model=ContractResponse)
-def read_contract(
+async def read_contract(
     contract_id: UUID,
-    db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    db: AsyncSession = Depends(get_async_db),
+    current_profile: Profile = Depends(get_authenticated_profile_async)
 ):
     """
     특정 계약 데이터를 조회합니다.
@@ -78,12 +79,12 @@ def read_contract(
     Raises:
         HTTPException: 권한이 없거나 데이터가 없는 경우
     """
-    check_contract_permission(
-        db, contract_id, current_profile, 
+    await db.run_sync(
+        check_contract_permission, contract_id, current_profile,
         expected_roles=[ProfileRole.owner, ProfileRole.manager, ProfileRole.member]
     )
     
-    contract = crud.get_contract_with_details(db, contract_id)
+    contract = await crud.get_contract_with_details_async(db, contract_id)
     if not contract:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
@@ -92,18 +93,24 @@ def read_contract(
     return contract
 
 @router.get("/", response_model=List[ContractResponse])
-def list_contracts(
-    db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile),
+async def list_contracts(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_profile: Profile = Depends(get_authenticated_profile_async),
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(100, ge=1, le=1000, description="가져올 항목 수"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜"),
     contract_status: Optional[str] = Query(None, description="계약 상태"),
-    is_supplier: Optional[bool] = Query(None, description="공급자 여부")
+    is_supplier: Optional[bool] = Query(None, description="공급자 여부"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부")
 ):
     """
-    계약 데이터 목록을 조회합니다.
+    계약 데이터 목록을 (contract_datetime, id) 순으로 조회합니다.
+
+    응답 본문은 계약 목록 그대로이며, 다음 페이지 커서는 X-Next-Cursor 헤더로,
+    전체 개수는 include_total=true일 때 X-Total-Count 헤더로 전달합니다.
     
     Args:
         db: 데이터베이스 세션
@@ -114,38 +121,50 @@ def list_contracts(
         end_date: 종료 날짜
         contract_status: 계약 상태
         is_supplier: 공급자 여부
+        cursor: 다음 페이지 커서
+        include_total: True이면 전체 개수를 계산
     
     Returns:
         List[ContractResponse]: 계약 데이터 목록
+    
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우
     """
     # 사용자의 회사 ID로 필터링
     company_id = current_profile.company_id
     
-    contracts, total = crud.get_contracts(
-        db=db,
-        skip=skip,
-        limit=limit,
-        company_id=company_id,
-        start_date=start_date,
-        end_date=end_date,
-        contract_status=contract_status,
-        is_supplier=is_supplier
-    )
+    try:
+        contracts, total, next_cursor = await crud.get_contracts_async(
+            db,
+            skip=skip,
+            limit=limit,
+            company_id=company_id,
+            start_date=start_date,
+            end_date=end_date,
+            contract_status=contract_status,
+            is_supplier=is_supplier,
+            cursor=cursor,
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    # 상세 정보 포함하여 반환
-    items = []
-    for contract in contracts:
-        detailed_contract = crud.get_contract_with_details(db, contract.id)
-        if detailed_contract:
-            items.append(detailed_contract)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
     
-    return items
+    # 상세 정보는 get_contracts_async에서 엔티티 종류별로 한 번에 조회해 구성
+    return contracts
 
 @router.post("/", response_model=ContractResponse, status_code=status.HTTP_201_CREATED)
 def create_contract(
     contract: ContractCreate,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     새로운 계약 데이터를 생성합니다.
@@ -186,7 +205,7 @@ def update_contract(
     contract_id: UUID,
     contract: ContractUpdate,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     계약 데이터를 업데이트합니다.
@@ -228,7 +247,7 @@ def update_contract_status(
     contract_id: UUID,
     status_update: ContractStatusUpdate,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     계약 상태를 업데이트합니다.
@@ -270,7 +289,7 @@ def update_payment_status(
     contract_id: UUID,
     status_update: PaymentStatusUpdate,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     결제 상태를 업데이트합니다.
@@ -311,7 +330,7 @@ def update_payment_status(
 def delete_contract(
     contract_id: UUID,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     계약 데이터를 삭제합니다.
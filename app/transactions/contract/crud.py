@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, and_, or_
 
 from app.profile.crud import get_profile_by_username
@@ -14,6 +15,7 @@ from app.profile.models import Profile
 from app.company.common.models import Company
 from app.company.center.models import Center
 from app.transactions.common.models import ContractStatus, PaymentStatus
+from app.transactions.common.pagination import paginate_keyset
 
 def get_contract(db: Session, contract_id: UUID) -> Optional[Contract]:
     """특정 계약 데이터를 조회합니다."""
@@ -27,10 +29,18 @@ def get_contracts(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     contract_status: Optional[str] = None,
-    is_supplier: Optional[bool] = None
-) -> Tuple[List[Contract], int]:
-    """계약 데이터 목록을 조회합니다."""
+    is_supplier: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False
+) -> Tuple[List[Contract], Optional[int], Optional[str]]:
+    """
+    계약 데이터 목록을 (contract_datetime, id) 순으로 조회합니다.
+
+    cursor가 주어지면 그 뒤에서부터 키셋 방식으로 조회하며, 전체 개수는 include_total일 때만 계산합니다.
+    (계약 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None)을 반환합니다.
+    """
     query = db.query(Contract)
+    company_branches = None
     
     # 필터 조건 적용
     if company_id:
@@ -40,12 +50,14 @@ def get_contracts(
             else:
                 query = query.filter(Contract.receiver_company_id == company_id)
         else:
-            query = query.filter(
-                or_(
-                    Contract.supplier_company_id == company_id,
-                    Contract.receiver_company_id == company_id
+            # 공급/수령 회사 인덱스를 각각 정렬 순서대로 읽도록 두 갈래로 나눔 (양쪽 모두인 계약은 공급 쪽에서만)
+            company_branches = [
+                Contract.supplier_company_id == company_id,
+                and_(
+                    Contract.receiver_company_id == company_id,
+                    or_(Contract.supplier_company_id.is_(None), Contract.supplier_company_id != company_id)
                 )
-            )
+            ]
     if start_date:
         query = query.filter(Contract.contract_datetime >= start_date)
     if end_date:
@@ -72,13 +84,18 @@ def get_contracts(
             # Enum 객체로 전달된 경우 직접 비교
             query = query.filter(Contract.contract_status == contract_status)
     
-    # 전체 개수 조회
-    total = query.count()
+    # 전체 개수 조회 (요청 시에만)
+    total = None
+    if include_total:
+        total = (query.filter(or_(*company_branches)) if company_branches else query).count()
     
-    # 페이지네이션 적용
-    contracts = query.offset(skip).limit(limit).all()
+    # 키셋 페이지네이션 적용
+    contracts, next_cursor = paginate_keyset(
+        query, Contract.contract_datetime, Contract.id,
+        limit, cursor=cursor, skip=skip, branches=company_branches
+    )
     
-    return contracts, total
+    return contracts, total, next_cursor
 
 def create_contract(db: Session, contract: ContractCreate, creator_username: str) -> Optional[Contract]:
     """새로운 계약 데이터를 생성합니다."""
@@ -218,126 +235,142 @@ def get_contract_with_details(db: Session, contract_id: UUID) -> Optional[Contra
     if not contract:
         return None
     
-    # items를 명시적으로 로드
-    items = db.query(ContractItem).filter(ContractItem.contract_id == contract_id).all()
-    
-    # 관계 데이터 조회
-    supplier_contractor = None
-    if contract.supplier_contractor_id:
-        supplier_contractor_profile = db.query(Profile).filter(Profile.id == contract.supplier_contractor_id).first()
-        if supplier_contractor_profile:
-            supplier_contractor = ProfileSummary(
-                id=supplier_contractor_profile.id,
-                username=supplier_contractor_profile.username,
-                name=supplier_contractor_profile.name,
-                email=supplier_contractor_profile.email,
-                company_name=supplier_contractor_profile.company_name
-            )
-    
-    supplier_company = None
-    if contract.supplier_company_id:
-        supplier_company_obj = db.query(Company).filter(Company.id == contract.supplier_company_id).first()
-        if supplier_company_obj:
-            supplier_company = CompanySummary(
-                id=supplier_company_obj.id,
-                name=supplier_company_obj.name,
-                business_number=None,
-                address=None
-            )
-    
-    receiver_contractor = None
-    if contract.receiver_contractor_id:
-        receiver_contractor_profile = db.query(Profile).filter(Profile.id == contract.receiver_contractor_id).first()
-        if receiver_contractor_profile:
-            receiver_contractor = ProfileSummary(
-                id=receiver_contractor_profile.id,
-                username=receiver_contractor_profile.username,
-                name=receiver_contractor_profile.name,
-                email=receiver_contractor_profile.email,
-                company_name=receiver_contractor_profile.company_name
-            )
-    
-    receiver_company = None
-    if contract.receiver_company_id:
-        receiver_company_obj = db.query(Company).filter(Company.id == contract.receiver_company_id).first()
-        if receiver_company_obj:
-            receiver_company = CompanySummary(
-                id=receiver_company_obj.id,
-                name=receiver_company_obj.name,
-                business_number=None,
-                address=None
-            )
-    
-    departure_center = None
-    if contract.departure_center_id:
-        departure_center_obj = db.query(Center).filter(Center.id == contract.departure_center_id).first()
-        if departure_center_obj:
-            departure_center = CenterSummary(
-                id=departure_center_obj.id,
-                name=departure_center_obj.name,
-                address=departure_center_obj.address,
-                region=departure_center_obj.region
-            )
-    
-    arrival_center = None
-    if contract.arrival_center_id:
-        arrival_center_obj = db.query(Center).filter(Center.id == contract.arrival_center_id).first()
-        if arrival_center_obj:
-            arrival_center = CenterSummary(
-                id=arrival_center_obj.id,
-                name=arrival_center_obj.name,
-                address=arrival_center_obj.address,
-                region=arrival_center_obj.region
-            )
-    
-    creator = None
-    if contract.creator_id:
-        creator_profile = db.query(Profile).filter(Profile.id == contract.creator_id).first()
-        if creator_profile:
-            creator = ProfileSummary(
-                id=creator_profile.id,
-                username=creator_profile.username,
-                name=creator_profile.name,
-                email=creator_profile.email,
-                company_name=creator_profile.company_name
-            )
-    
+    return get_contracts_with_details(db, [contract])[0]
+
+
+def _load_by_ids(db: Session, model, ids) -> dict:
+    """주어진 ID 목록의 엔티티를 IN 쿼리 한 번으로 조회해 {id: 엔티티}로 반환합니다."""
+    ids = {id_ for id_ in ids if id_ is not None}
+    if not ids:
+        return {}
+    return {row.id: row for row in db.query(model).filter(model.id.in_(ids)).all()}
+
+
+def get_contracts_with_details(db: Session, contracts: List[Contract]) -> List[ContractResponse]:
+    """
+    여러 계약의 상세 정보를 한 번에 구성합니다.
+
+    아이템, 프로필, 회사, 센터를 엔티티 종류별 IN 쿼리 한 번씩으로 조회한 뒤 메모리에서 응답을 조립하므로,
+    계약 수와 무관하게 쿼리 수가 일정합니다.
+    """
+    if not contracts:
+        return []
+
+    contract_ids = [contract.id for contract in contracts]
+    items_by_contract = {contract_id: [] for contract_id in contract_ids}
+    for item in db.query(ContractItem).filter(ContractItem.contract_id.in_(contract_ids)).all():
+        items_by_contract[item.contract_id].append(item)
+
+    profiles = _load_by_ids(db, Profile, (
+        profile_id
+        for contract in contracts
+        for profile_id in (contract.supplier_contractor_id, contract.receiver_contractor_id, contract.creator_id)
+    ))
+    # 프로필의 company_name도 같은 회사 쿼리에서 함께 조회
+    companies = _load_by_ids(db, Company, [
+        company_id
+        for contract in contracts
+        for company_id in (contract.supplier_company_id, contract.receiver_company_id)
+    ] + [profile.company_id for profile in profiles.values()])
+    centers = _load_by_ids(db, Center, (
+        center_id
+        for contract in contracts
+        for center_id in (contract.departure_center_id, contract.arrival_center_id)
+    ))
+
+    def profile_summary(profile_id) -> Optional[ProfileSummary]:
+        profile = profiles.get(profile_id)
+        if not profile:
+            return None
+        company = companies.get(profile.company_id)
+        return ProfileSummary(
+            id=profile.id,
+            username=profile.username,
+            name=profile.name,
+            email=profile.email,
+            company_name=company.name if company else None
+        )
+
+    def company_summary(company_id) -> Optional[CompanySummary]:
+        company = companies.get(company_id)
+        if not company:
+            return None
+        return CompanySummary(
+            id=company.id,
+            name=company.name,
+            business_number=None,
+            address=None
+        )
+
+    def center_summary(center_id) -> Optional[CenterSummary]:
+        center = centers.get(center_id)
+        if not center:
+            return None
+        return CenterSummary(
+            id=center.id,
+            name=center.name,
+            address=center.address,
+            region=center.region
+        )
+
     # 응답 데이터 구성
-    return ContractResponse(
-        id=contract.id,
-        title=contract.title,
-        supplier_contractor_id=contract.supplier_contractor_id,
-        supplier_company_id=contract.supplier_company_id,
-        receiver_contractor_id=contract.receiver_contractor_id,
-        receiver_company_id=contract.receiver_company_id,
-        departure_center_id=contract.departure_center_id,
-        arrival_center_id=contract.arrival_center_id,
-        contract_datetime=contract.contract_datetime,
-        delivery_datetime=contract.delivery_datetime,
-        payment_due_date=contract.payment_due_date,
-        contract_status=contract.contract_status,
-        payment_status=contract.payment_status,
-        notes=contract.notes,
-        total_price=contract.total_price,
-        creator_id=contract.creator_id,
-        next_contract_id=contract.next_contract_id,
-        items=[
-            ContractItemResponse(
-                id=item.id,
-                product_name=item.product_name,
-                quality=item.quality,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                total_price=item.total_price,
-                created_at=item.created_at,
-                updated_at=item.updated_at
-            ) for item in items
-        ],
-        supplier_contractor=supplier_contractor,
-        supplier_company=supplier_company,
-        receiver_contractor=receiver_contractor,
-        receiver_company=receiver_company,
-        departure_center=departure_center,
-        arrival_center=arrival_center,
-        creator=creator
-    ) 
\ No newline at end of file
+    return [
+        ContractResponse(
+            id=contract.id,
+            title=contract.title,
+            supplier_contractor_id=contract.supplier_contractor_id,
+            supplier_company_id=contract.supplier_company_id,
+            receiver_contractor_id=contract.receiver_contractor_id,
+            receiver_company_id=contract.receiver_company_id,
+            departure_center_id=contract.departure_center_id,
+            arrival_center_id=contract.arrival_center_id,
+            contract_datetime=contract.contract_datetime,
+            delivery_datetime=contract.delivery_datetime,
+            payment_due_date=contract.payment_due_date,
+            contract_status=contract.contract_status,
+            payment_status=contract.payment_status,
+            notes=contract.notes,
+            total_price=contract.total_price,
+            creator_id=contract.creator_id,
+            next_contract_id=contract.next_contract_id,
+            items=[
+                ContractItemResponse(
+                    id=item.id,
+                    product_name=item.product_name,
+                    quality=item.quality,
+                    quantity=item.quantity,
+                    unit_price=item.unit_price,
+                    total_price=item.total_price,
+                    created_at=item.created_at,
+                    updated_at=item.updated_at
+                ) for item in items_by_contract[contract.id]
+            ],
+            supplier_contractor=profile_summary(contract.supplier_contractor_id),
+            supplier_company=company_summary(contract.supplier_company_id),
+            receiver_contractor=profile_summary(contract.receiver_contractor_id),
+            receiver_company=company_summary(contract.receiver_company_id),
+            departure_center=center_summary(contract.departure_center_id),
+            arrival_center=center_summary(contract.arrival_center_id),
+            creator=profile_summary(contract.creator_id)
+        )
+        for contract in contracts
+    ]
+
+
+async def get_contracts_async(
+    db: AsyncSession, **filters
+) -> Tuple[List[ContractResponse], Optional[int], Optional[str]]:
+    """
+    get_contracts의 비동기 버전. 같은 쿼리를 AsyncSession 위에서 실행하고 상세 응답까지 구성해
+    (계약 응답 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None)을 반환합니다.
+    """
+    def load(session: Session):
+        contracts, total, next_cursor = get_contracts(session, **filters)
+        return get_contracts_with_details(session, contracts), total, next_cursor
+
+    return await db.run_sync(load)
+
+
+async def get_contract_with_details_async(db: AsyncSession, contract_id: UUID) -> Optional[ContractResponse]:
+    """get_contract_with_details의 비동기 버전입니다."""
+    return await db.run_sync(get_contract_with_details, contract_id)
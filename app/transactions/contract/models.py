@@ -63,3 +63,15 @@ class Contract(Base):
     next_contract = relationship("Contract", remote_side=[id], backref="previous_contract")
     items = relationship("ContractItem", back_populates="contract", cascade="all, delete-orphan")
     creator = relationship("Profile", foreign_keys=[creator_id])
+
+    __table_args__ = (
+        # 회사별 계약 목록의 키셋 페이지네이션 (contract_datetime NULLS FIRST, id) 순서
+        Index(
+            "ix_contracts_supplier_company_datetime_id", "supplier_company_id", "contract_datetime", "id",
+            postgresql_ops={"contract_datetime": "NULLS FIRST"}
+        ),
+        Index(
+            "ix_contracts_receiver_company_datetime_id", "receiver_company_id", "contract_datetime", "id",
+            postgresql_ops={"contract_datetime": "NULLS FIRST"}
+        ),
+    )
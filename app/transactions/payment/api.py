@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from datetime import datetime, date, timezone
 from typing import Optional
-from app.database.session import get_db
-from app.profile.dependencies import get_current_profile
+from app.database.session import get_db, get_async_db
+from app.profile.dependencies import get_authenticated_profile, get_authenticated_profile_async
 from app.profile.models import Profile
 from app.company.common.crud import get_company_by_id
 from . import crud, schemas
@@ -12,11 +13,11 @@ from . import crud, schemas
 router = APIRouter(prefix="/payments", tags=["payments"])
 
 @router.get("/report", response_model=schemas.PaymentReport)
-def get_payment_report(
+async def get_payment_report(
     start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
-    current_profile: Profile = Depends(get_current_profile),
-    db: Session = Depends(get_db)
+    current_profile: Profile = Depends(get_authenticated_profile_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     현재 사용자의 회사 지급 현황 보고서를 반환합니다.
@@ -28,13 +29,13 @@ def get_payment_report(
             detail="회사에 속해있지 않습니다"
         )
     
-    return crud.get_payment_report(db, current_profile.company_id, start_date, end_date)
+    return await crud.get_payment_report_async(db, current_profile.company_id, start_date, end_date)
 
 @router.get("/summary", response_model=schemas.PaymentSummary)
 def get_payment_summary(
     start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
@@ -51,7 +52,7 @@ def get_payment_summary(
 
 @router.get("/overdue")
 def get_overdue_contracts(
-    current_profile: Profile = Depends(get_current_profile),
+    current_profile: Profile = Depends(get_authenticated_profile),
     db: Session = Depends(get_db)
 ):
     """
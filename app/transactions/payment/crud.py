@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, or_
 from uuid import UUID
 from datetime import datetime, date, timedelta
@@ -175,4 +176,14 @@ def get_overdue_contracts(db: Session, company_id: UUID) -> List[Contract]:
             Contract.payment_status == PaymentStatus.UNPAID,
             Contract.payment_due_date < datetime.now()
         )
-    ).all() 
\ No newline at end of file
+    ).all()
+
+
+async def get_payment_report_async(
+    db: AsyncSession,
+    company_id: UUID,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> schemas.PaymentReport:
+    """get_payment_report의 비동기 버전입니다."""
+    return await db.run_sync(get_payment_report, company_id, start_date, end_date)
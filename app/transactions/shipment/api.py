@@ -3,10 +3,11 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.profile.models import Profile, ProfileRole
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile, get_authenticated_profile_async
 from app.transactions.shipment import crud
 from app.transactions.shipment.schemas import (
     ShipmentCreate, ShipmentUpdate, ShipmentResponse,
@@ -58,10 +59,10 @@ def check_shipment_permission(
             )
 
 @router.get("/{shipment_id}", response_model=ShipmentResponse)
-def read_shipment(
+async def read_shipment(
     shipment_id: UUID,
-    db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    db: AsyncSession = Depends(get_async_db),
+    current_profile: Profile = Depends(get_authenticated_profile_async)
 ):
     """
     특정 출하 데이터를 조회합니다.
@@ -77,12 +78,12 @@ def read_shipment(
     Raises:
         HTTPException: 권한이 없거나 데이터가 없는 경우
     """
-    check_shipment_permission(
-        db, shipment_id, current_profile, 
+    await db.run_sync(
+        check_shipment_permission, shipment_id, current_profile,
         expected_roles=[ProfileRole.owner, ProfileRole.manager, ProfileRole.member]
     )
     
-    shipment = crud.get_shipment_with_details(db, shipment_id)
+    shipment = await crud.get_shipment_with_details_async(db, shipment_id)
     if not shipment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
@@ -91,18 +92,20 @@ def read_shipment(
     return shipment
 
 @router.get("/", response_model=ShipmentListResponse)
-def list_shipments(
-    db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile),
+async def list_shipments(
+    db: AsyncSession = Depends(get_async_db),
+    current_profile: Profile = Depends(get_authenticated_profile_async),
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(100, ge=1, le=1000, description="가져올 항목 수"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜"),
     shipment_status: Optional[str] = Query(None, description="출하 상태"),
-    is_supplier: Optional[bool] = Query(None, description="공급자 여부")
+    is_supplier: Optional[bool] = Query(None, description="공급자 여부"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부")
 ):
     """
-    출하 데이터 목록을 조회합니다.
+    출하 데이터 목록을 (shipment_datetime, id) 순으로 조회합니다.
     
     Args:
         db: 데이터베이스 세션
@@ -113,38 +116,47 @@ def list_shipments(
         end_date: 종료 날짜
         shipment_status: 출하 상태
         is_supplier: 공급자 여부
+        cursor: 다음 페이지 커서
+        include_total: True이면 전체 개수를 계산
     
     Returns:
-        ShipmentListResponse: 출하 데이터 목록과 총 개수
+        ShipmentListResponse: 출하 데이터 목록, 다음 페이지 커서, (요청 시) 총 개수
+    
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우
     """
     company_id = current_profile.company_id
-    shipments, total = crud.get_shipments(
-        db=db,
-        skip=skip,
-        limit=limit,
-        company_id=company_id,
-        start_date=start_date,
-        end_date=end_date,
-        shipment_status=shipment_status,
-        is_supplier=is_supplier
-    )
-    items = []
-    for shipment in shipments:
-        detailed_shipment = crud.get_shipment_with_details(db, shipment.id)
-        if detailed_shipment:
-            items.append(detailed_shipment)
+    try:
+        items, total, next_cursor = await crud.get_shipments_async(
+            db,
+            skip=skip,
+            limit=limit,
+            company_id=company_id,
+            start_date=start_date,
+            end_date=end_date,
+            shipment_status=shipment_status,
+            is_supplier=is_supplier,
+            cursor=cursor,
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     return {
         "shipments": items,
         "total": total,
         "page": skip // limit + 1 if limit else 1,
-        "size": limit
+        "size": limit,
+        "next_cursor": next_cursor
     }
 
 @router.post("/", response_model=ShipmentResponse, status_code=status.HTTP_201_CREATED)
 def create_shipment(
     shipment: ShipmentCreate,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     새로운 출하 데이터를 생성합니다.
@@ -185,7 +197,7 @@ def update_shipment(
     shipment_id: UUID,
     shipment: ShipmentUpdate,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     출하 데이터를 업데이트합니다.
@@ -226,7 +238,7 @@ def update_shipment(
 def delete_shipment(
     shipment_id: UUID,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ):
     """
     출하 데이터를 삭제합니다.
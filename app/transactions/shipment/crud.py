@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, and_, or_
 from app.company.common.crud import get_company_by_name
 from app.profile.crud import get_profile_by_username
@@ -13,6 +14,18 @@ from app.transactions.shipment.schemas import (
 from app.profile.models import Profile
 from app.company.common.models import Company
 from app.transactions.common.models import ShipmentStatus
+from app.transactions.common.pagination import paginate_keyset
+from app.company.inventory_snapshot.crud import (
+    build_shipment_movements, record_inventory_movements, propagate_inventory_movements,
+    invalidate_daily_inventory_balances
+)
+
+def _apply_inventory_movements(db: Session, movements: List[dict]) -> None:
+    """재고 변동을 원장에 기록하고, 이후 날짜의 일별 요약을 무효화하고, 스냅샷에 증분 반영합니다."""
+    movements = record_inventory_movements(db, movements)
+    invalidate_daily_inventory_balances(db, movements)
+    propagate_inventory_movements(db, movements)
+
 
 def get_shipment(db: Session, shipment_id: UUID) -> Optional[Shipment]:
     """특정 출하 데이터를 조회합니다."""
@@ -27,10 +40,18 @@ def get_shipments(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     shipment_status: Optional[str] = None,
-    is_supplier: Optional[bool] = None
-) -> Tuple[List[Shipment], int]:
-    """출하 데이터 목록을 조회합니다."""
+    is_supplier: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False
+) -> Tuple[List[Shipment], Optional[int], Optional[str]]:
+    """
+    출하 데이터 목록을 (shipment_datetime, id) 순으로 조회합니다.
+
+    cursor가 주어지면 그 뒤에서부터 키셋 방식으로 조회하며, 전체 개수는 include_total일 때만 계산합니다.
+    (출하 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None)을 반환합니다.
+    """
     query = db.query(Shipment)
+    company_branches = None
     
     # 필터 조건 적용
     if company_id:
@@ -40,12 +61,14 @@ def get_shipments(
             else:
                 query = query.filter(Shipment.receiver_company_id == company_id)
         else:
-            query = query.filter(
-                or_(
-                    Shipment.supplier_company_id == company_id,
-                    Shipment.receiver_company_id == company_id
+            # 공급/수령 회사 인덱스를 각각 정렬 순서대로 읽도록 두 갈래로 나눔 (양쪽 모두인 출하은 공급 쪽에서만)
+            company_branches = [
+                Shipment.supplier_company_id == company_id,
+                and_(
+                    Shipment.receiver_company_id == company_id,
+                    or_(Shipment.supplier_company_id.is_(None), Shipment.supplier_company_id != company_id)
                 )
-            )
+            ]
     if start_date:
         query = query.filter(Shipment.shipment_datetime >= start_date)
     if end_date:
@@ -55,13 +78,19 @@ def get_shipments(
         status_enum = ShipmentStatus(shipment_status) if isinstance(shipment_status, str) else shipment_status
         query = query.filter(Shipment.shipment_status == status_enum)
     
-    # 전체 개수 조회
-    total = query.count()
+    # 전체 개수 조회 (요청 시에만)
+    total = None
+    if include_total:
+        total = (query.filter(or_(*company_branches)) if company_branches else query).count()
     
-    # 페이지네이션 적용
-    shipments = query.offset(skip).limit(limit).all()
+    # 키셋 페이지네이션 적용 (아이템은 selectinload로 한 번에 로드)
+    shipments, next_cursor = paginate_keyset(
+        query.options(selectinload(Shipment.items)),
+        Shipment.shipment_datetime, Shipment.id,
+        limit, cursor=cursor, skip=skip, branches=company_branches
+    )
     
-    return shipments, total
+    return shipments, total, next_cursor
 
 
 def get_profile_id_by_username(db: Session, username: str) -> Optional[UUID]:
@@ -97,6 +126,7 @@ def create_shipment(db: Session, shipment: ShipmentCreate, creator_username: str
     
     # 출하 아이템 생성
     total_price = 0
+    db_items = []
     for item in shipment.items:
         item_total_price = item.quantity * item.unit_price
         db_item = ShipmentItem(
@@ -108,10 +138,14 @@ def create_shipment(db: Session, shipment: ShipmentCreate, creator_username: str
             total_price=item_total_price
         )
         db.add(db_item)
+        db_items.append(db_item)
         total_price += item_total_price
     
     # 총 가격 업데이트
     db_shipment.total_price = total_price
+
+    # 재고 원장 기록 및 스냅샷 반영
+    _apply_inventory_movements(db, build_shipment_movements(db_shipment, db_items))
     db.commit()
     db.refresh(db_shipment)
     
@@ -127,6 +161,9 @@ def update_shipment(
     db_shipment = get_shipment(db, shipment_id)
     if not db_shipment:
         return None
+
+    # 변경 전 재고 변동 (되돌리기용)
+    previous_movements = build_shipment_movements(db_shipment, db_shipment.items, sign=-1)
     
     # 기본 필드 업데이트
     update_data = shipment_update.model_dump(exclude_unset=True)
@@ -141,6 +178,7 @@ def update_shipment(
         
         # 새로운 아이템 추가
         total_price = 0
+        current_items = []
         for item in shipment_update.items:
             item_total_price = item.quantity * item.unit_price
             db_item = ShipmentItem(
@@ -152,10 +190,18 @@ def update_shipment(
                 total_price=item_total_price
             )
             db.add(db_item)
+            current_items.append(db_item)
             total_price += item_total_price
     
-    # 총 가격 업데이트
-    db_shipment.total_price = total_price
+        # 총 가격 업데이트
+        db_shipment.total_price = total_price
+    else:
+        current_items = list(db_shipment.items)
+
+    # 재고 원장 기록 및 스냅샷 반영 (기존 변동 취소 + 새 변동, 순변동만 반영)
+    _apply_inventory_movements(
+        db, previous_movements + build_shipment_movements(db_shipment, current_items)
+    )
     
     db.commit()
     db.refresh(db_shipment)
@@ -167,6 +213,9 @@ def delete_shipment(db: Session, shipment_id: UUID) -> bool:
     db_shipment = get_shipment(db, shipment_id)
     if not db_shipment:
         return False
+
+    # 재고 원장 기록 및 스냅샷 반영 (기존 변동 취소)
+    _apply_inventory_movements(db, build_shipment_movements(db_shipment, db_shipment.items, sign=-1))
     
     db.delete(db_shipment)
     db.commit()
@@ -182,7 +231,11 @@ def get_shipment_with_details(db: Session, shipment_id: UUID) -> Optional[Shipme
     # 관계 데이터 로드
     db.refresh(shipment)
     
-    # 응답 데이터 구성
+    return build_shipment_response(shipment)
+
+
+def build_shipment_response(shipment: Shipment) -> ShipmentResponse:
+    """이미 로드된 출하 데이터(아이템 포함)로 응답 객체를 구성합니다. 추가 쿼리를 실행하지 않습니다."""
     return ShipmentResponse(
         id=shipment.id,
         title=shipment.title,
@@ -209,4 +262,23 @@ def get_shipment_with_details(db: Session, shipment_id: UUID) -> Optional[Shipme
                 updated_at=item.updated_at if item.updated_at is not None else item.created_at
             ) for item in shipment.items
         ]
-    ) 
\ No newline at end of file
+    )
+
+
+async def get_shipments_async(
+    db: AsyncSession, **filters
+) -> Tuple[List[ShipmentResponse], Optional[int], Optional[str]]:
+    """
+    get_shipments의 비동기 버전. 같은 쿼리를 AsyncSession 위에서 실행하고 응답 객체까지 구성해
+    (출하 응답 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None)을 반환합니다.
+    """
+    def load(session: Session):
+        shipments, total, next_cursor = get_shipments(session, **filters)
+        return [build_shipment_response(shipment) for shipment in shipments], total, next_cursor
+
+    return await db.run_sync(load)
+
+
+async def get_shipment_with_details_async(db: AsyncSession, shipment_id: UUID) -> Optional[ShipmentResponse]:
+    """get_shipment_with_details의 비동기 버전입니다."""
+    return await db.run_sync(get_shipment_with_details, shipment_id)
@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Enum, func, Integer
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Enum, func, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,11 +19,11 @@ class Shipment(Base):
     
     creator_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False, index=True)
     supplier_person_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), index=True)
-    supplier_company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), index=True)
+    supplier_company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"))
     receiver_person_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), index=True)
-    receiver_company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), index=True)
-    departure_center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"), index=True)
-    arrival_center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"), index=True)
+    receiver_company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"))
+    departure_center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"))
+    arrival_center_id = Column(UUID(as_uuid=True), ForeignKey("centers.id"))
     
     shipment_datetime = Column(DateTime(timezone=True))
     shipment_status = Column(Enum(ShipmentStatus), nullable=False, default=ShipmentStatus.PENDING)
@@ -42,6 +42,21 @@ class Shipment(Base):
     arrival_center = relationship("Center", foreign_keys=[arrival_center_id])
     items = relationship("ShipmentItem", back_populates="shipment", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 센터별 기간 조회(재고 재생, 요약)는 반열린 시각 구간으로 필터링하며 이 인덱스를 사용합니다.
+        Index("ix_shipments_departure_center_datetime", "departure_center_id", "shipment_datetime"),
+        Index("ix_shipments_arrival_center_datetime", "arrival_center_id", "shipment_datetime"),
+        # 회사별 출하 목록의 키셋 페이지네이션 (shipment_datetime NULLS FIRST, id) 순서
+        Index(
+            "ix_shipments_supplier_company_datetime_id", "supplier_company_id", "shipment_datetime", "id",
+            postgresql_ops={"shipment_datetime": "NULLS FIRST"}
+        ),
+        Index(
+            "ix_shipments_receiver_company_datetime_id", "receiver_company_id", "shipment_datetime", "id",
+            postgresql_ops={"shipment_datetime": "NULLS FIRST"}
+        ),
+    )
+
 class ShipmentItem(Base):
     __tablename__ = "shipment_items"
 
@@ -59,4 +74,13 @@ class ShipmentItem(Base):
 
     # Relationships
     shipment = relationship("Shipment", back_populates="items")
+
+    __table_args__ = (
+        # 시점 재고 조회(출하 -> 아이템 조인 후 상품별 집계)를 인덱스만으로 처리하기 위한 커버링 인덱스
+        Index(
+            "ix_shipment_items_shipment_product_quality",
+            "shipment_id", "product_name", "quality",
+            postgresql_include=["quantity"]
+        ),
+    )
     
\ No newline at end of file
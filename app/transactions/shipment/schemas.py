@@ -56,8 +56,9 @@ class ShipmentResponse(ShipmentBase):
 
 class ShipmentListResponse(BaseModel):
     shipments: List[ShipmentResponse]
-    total: int
+    total: Optional[int] = None  # include_total=true일 때만 계산
     page: int
     size: int
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
 
     model_config = ConfigDict(from_attributes=True)
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.transactions.summary.schemas import SummaryRequest, SummaryResponse, TransactionType, Direction
 from app.transactions.summary import services
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile
 from app.profile.models import Profile
 
 router = APIRouter(prefix="/summary", tags=["summary"])
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/summary", tags=["summary"])
 def get_daily_summary_by_request(
     request: SummaryRequest,
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ) -> SummaryResponse:
     """
     SummaryRequest를 기반으로 일자별 종합 데이터를 반환합니다.
@@ -30,7 +30,7 @@ def get_contract_outbound_summary(
     start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ) -> SummaryResponse:
     """
     회사의 출고 계약 요약을 조회합니다. (하위 호환성)
@@ -56,7 +56,7 @@ def get_contract_inbound_summary(
     start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ) -> SummaryResponse:
     """
     회사의 입고 계약 요약을 조회합니다. (하위 호환성)
@@ -82,7 +82,7 @@ def get_shipment_outbound_summary(
     start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ) -> SummaryResponse:
     """
     회사의 출고 배송 요약을 조회합니다. (하위 호환성)
@@ -108,7 +108,7 @@ def get_shipment_inbound_summary(
     start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ) -> SummaryResponse:
     """
     회사의 입고 배송 요약을 조회합니다. (하위 호환성)
@@ -137,7 +137,7 @@ def get_summary(
     start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     end_date: date = Query(..., description="종료 날짜 (YYYY-MM-DD 형식)"),
     db: Session = Depends(get_db),
-    current_profile: Profile = Depends(get_current_profile)
+    current_profile: Profile = Depends(get_authenticated_profile)
 ) -> SummaryResponse:
     """
     거래 유형과 방향에 따른 요약 데이터를 조회합니다.
@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta
 from typing import List, Dict, Any, Optional, Union
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
@@ -15,6 +15,11 @@ from app.transactions.summary.schemas import (
 from app.transactions.common.models import ProductQuality, ContractStatus
 from app.company.center.models import Center
 
+def _day_bounds(target_date: date):
+    """target_date 하루를 [자정, 다음날 자정) 반열린 구간으로 반환합니다. 컬럼에 함수를 씌우지 않아 인덱스를 탈 수 있습니다."""
+    day_start = datetime.combine(target_date, time.min)
+    return day_start, day_start + timedelta(days=1)
+
 def get_contracts_by_date_and_company(
     db: Session,
     target_date: date,
@@ -26,6 +31,7 @@ def get_contracts_by_date_and_company(
     """
     # 방향에 따라 센터 필드 선택
     center_field = Contract.departure_center_id if direction == Direction.OUTBOUND else Contract.arrival_center_id
+    day_start, day_end = _day_bounds(target_date)
     
     query = db.query(
         center_field,
@@ -38,7 +44,8 @@ def get_contracts_by_date_and_company(
     ).join(
         Center, center_field == Center.id
     ).filter(
-        func.date(Contract.delivery_datetime) == target_date
+        Contract.delivery_datetime >= day_start,
+        Contract.delivery_datetime < day_end
     )
     
     # 회사 필터 적용
@@ -69,6 +76,7 @@ def get_shipments_by_date_and_company(
     """
     # 방향에 따라 센터 필드 선택
     center_field = Shipment.departure_center_id if direction == Direction.OUTBOUND else Shipment.arrival_center_id
+    day_start, day_end = _day_bounds(target_date)
     
     query = db.query(
         center_field,
@@ -81,7 +89,8 @@ def get_shipments_by_date_and_company(
     ).join(
         Center, center_field == Center.id
     ).filter(
-        func.date(Shipment.shipment_datetime) == target_date
+        Shipment.shipment_datetime >= day_start,
+        Shipment.shipment_datetime < day_end
     )
     
     # 회사 필터 적용
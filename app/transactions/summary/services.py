@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional, Union
 from sqlalchemy.orm import Session
 from collections import defaultdict
@@ -62,7 +62,7 @@ def generate_date_range(start_date: date, end_date: date) -> List[date]:
     current_date = start_date
     while current_date <= end_date:
         date_list.append(current_date)
-        current_date = current_date.replace(day=current_date.day + 1)
+        current_date += timedelta(days=1)
     return date_list
 
 
@@ -0,0 +1,129 @@
+"""
+스냅샷 사전 생성 워커.
+
+매일 자정 이후 모든 센터의 당일 CenterInventorySnapshot과 일별 재고 요약을 미리 만들어 두어,
+아침 첫 조회가 재생 비용을 치르지 않도록 합니다. 웹 프로세스와 별도로 실행합니다.
+
+    python -m app.worker            # 매일 SNAPSHOT_WORKER_RUN_AT에 실행
+    python -m app.worker --once     # 한 번만 실행 (--date로 대상 날짜 지정 가능)
+"""
+import argparse
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.company.center.models import Center
+from app.company.inventory_snapshot.crud import (
+    create_daily_center_inventory_snapshot, refresh_daily_inventory_balances
+)
+
+
+def _default_session_factory() -> Session:
+    from app.database.session import SessionLocal
+    return SessionLocal()
+
+
+def materialize_company_snapshots(
+    company_id: UUID,
+    target_date: date,
+    session_factory: Callable[[], Session] = _default_session_factory
+) -> int:
+    """
+    회사의 모든 센터에 대해 target_date 스냅샷을 만들고 일별 재고 요약을 target_date까지 이어서 갱신합니다.
+    처리한 센터 수를 반환합니다.
+    """
+    db = session_factory()
+    try:
+        center_ids = [
+            center_id for (center_id,) in db.query(Center.id).filter(Center.company_id == company_id).all()
+        ]
+        for center_id in center_ids:
+            create_daily_center_inventory_snapshot(db, target_date, company_id, center_id)
+        refresh_daily_inventory_balances(db, target_date, target_date, company_id)
+        return len(center_ids)
+    finally:
+        db.close()
+
+
+def run_nightly_materialization(
+    target_date: Optional[date] = None,
+    max_workers: Optional[int] = None,
+    session_factory: Callable[[], Session] = _default_session_factory
+) -> Dict[UUID, int]:
+    """
+    센터가 있는 모든 회사의 target_date(기본: 오늘) 스냅샷을 만듭니다.
+    회사 단위로 최대 max_workers개까지 병렬 처리하며, 회사별 처리한 센터 수를 반환합니다.
+    한 회사가 실패해도 나머지 회사는 계속 처리합니다.
+    """
+    target_date = target_date or date.today()
+    max_workers = max_workers or settings.SNAPSHOT_WORKER_MAX_WORKERS
+
+    db = session_factory()
+    try:
+        company_ids = [
+            company_id for (company_id,) in db.query(Center.company_id).distinct().all()
+        ]
+    finally:
+        db.close()
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(materialize_company_snapshots, company_id, target_date, session_factory): company_id
+            for company_id in company_ids
+        }
+        for future in as_completed(futures):
+            company_id = futures[future]
+            try:
+                results[company_id] = future.result()
+            except Exception as e:
+                print(f"스냅샷 사전 생성 실패: company_id={company_id}, error={e}")
+    return results
+
+
+def seconds_until_next_run(now: datetime, run_at: str) -> float:
+    """now 이후 가장 가까운 run_at(HH:MM)까지 남은 초를 반환합니다."""
+    hour, minute = (int(part) for part in run_at.split(":"))
+    next_run = datetime.combine(now.date(), time(hour, minute))
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+def run_scheduled_materialization(target_date: Optional[date] = None) -> Optional[Dict[UUID, int]]:
+    """
+    예약된 사전 생성을 한 번 실행하고 결과를 출력합니다.
+    세션 생성 실패 등 어떤 예외도 밖으로 올리지 않고 기록만 하므로, 한 번 실패해도 다음 날 실행은 계속됩니다.
+    """
+    try:
+        results = run_nightly_materialization(target_date)
+    except Exception as e:
+        print(f"스냅샷 사전 생성 실행 실패: error={e}")
+        return None
+    print(f"스냅샷 사전 생성 완료: 회사 {len(results)}개, 센터 {sum(results.values())}개")
+    return results
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="인벤토리 스냅샷 사전 생성 워커")
+    parser.add_argument("--once", action="store_true", help="한 번만 실행하고 종료")
+    parser.add_argument("--date", type=date.fromisoformat, help="대상 날짜 (기본: 오늘)")
+    args = parser.parse_args(argv)
+
+    if args.once:
+        results = run_nightly_materialization(args.date)
+        print(f"스냅샷 사전 생성 완료: 회사 {len(results)}개, 센터 {sum(results.values())}개")
+        return
+
+    while True:
+        time_module.sleep(seconds_until_next_run(datetime.now(), settings.SNAPSHOT_WORKER_RUN_AT))
+        run_scheduled_materialization()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from app.profile.models import ProfileRole, ProfileType
 from app.company.common.models import CompanyType
 from tests.factories import UserFactory, ProfileFactory, CompanyFactory
 import uuid
-from app.profile.dependencies import get_current_profile
+from app.profile.dependencies import get_authenticated_profile
 
 @pytest.fixture
 def owner_token_and_profile(db: Session):
@@ -130,7 +130,7 @@ def test_remove_company_user(client: TestClient, db: Session, owner_token_and_pr
 def test_get_my_company(client, db, owner_token_and_profile, company):
     """내 회사 조회 API 테스트"""
     token, profile = owner_token_and_profile
-    client.app.dependency_overrides[get_current_profile] = lambda: profile
+    client.app.dependency_overrides[get_authenticated_profile] = lambda: profile
     profile.company_id = company.id
     db.commit()
     response = client.get(
@@ -1,11 +1,11 @@
 import pytest
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from app.main import app
 from tests.factories import (
     UserFactory, ProfileFactory, CompanyFactory, 
-    CenterFactory, InventorySnapshotFactory
+    CenterFactory, InventorySnapshotFactory, ShipmentFactory
 )
 from app.core.auth.utils import create_access_token
 from app.profile.models import ProfileType, ProfileRole
@@ -86,6 +86,28 @@ def dummy_contract(db: Session, wholesale_company, owner_token_and_profile):
     db.refresh(contract)
     return contract
 
+@pytest.fixture
+def center_shipments(db: Session, wholesale_company, centers, owner_token_and_profile, dummy_contract):
+    """첫 번째 센터에 3일 전 입하 100개, 2일 전 출하 30개를 생성합니다."""
+    token, profile = owner_token_and_profile
+    center = centers[0]
+    today = date.today()
+    ShipmentFactory.create_complete_shipment(
+        db, dummy_contract.id, profile.id,
+        items_data=[{"product_name": "쌀", "quantity": 100, "quality": "A", "unit_price": 1000.0}],
+        receiver_company_id=wholesale_company.id,
+        arrival_center_id=center.id,
+        shipment_datetime=datetime.combine(today - timedelta(days=3), datetime.min.time()) + timedelta(hours=9)
+    )
+    ShipmentFactory.create_complete_shipment(
+        db, dummy_contract.id, profile.id,
+        items_data=[{"product_name": "쌀", "quantity": 30, "quality": "A", "unit_price": 1000.0}],
+        supplier_company_id=wholesale_company.id,
+        departure_center_id=center.id,
+        shipment_datetime=datetime.combine(today - timedelta(days=2), datetime.min.time()) + timedelta(hours=18)
+    )
+    return center
+
 def auth_headers(token, profile_id):
     """인증 헤더를 생성합니다."""
     return {"Authorization": f"Bearer {token}", "X-Profile-ID": str(profile_id)}
@@ -120,6 +142,34 @@ class TestInventorySnapshotAPI:
             assert "items" in center
             assert len(center["items"]) > 0
 
+    def test_get_company_inventory_snapshot_batches_queries(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, inventory_snapshots
+    ):
+        """회사 스냅샷 조회는 센터 수와 무관하게 스냅샷/아이템 쿼리 두 번으로 끝납니다."""
+        from sqlalchemy import event
+
+        engine = db.get_bind()
+        token, profile = owner_token_and_profile
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            if "center_inventory_snapshots" in statement or "center_snapshot_items" in statement:
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            response = client.get(
+                f"/inventory-snapshots/company/{wholesale_company.id}/date/{date.today()}",
+                headers=auth_headers(token, profile.id)
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+
+        assert response.status_code == 200
+        assert {center["center_name"] for center in response.json()["centers"]} == {"센터 1", "센터 2"}
+        assert len(statements) == 2
+
     def test_get_company_inventory_snapshots_by_date_range(
         self, client: TestClient, db: Session,
         owner_token_and_profile, wholesale_company, inventory_snapshots
@@ -147,6 +197,40 @@ class TestInventorySnapshotAPI:
         assert str(yesterday) in dates
         assert str(today) in dates
 
+    def test_get_company_inventory_snapshots_by_date_range_across_month_end(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """월말을 넘는 기간도 하루씩 빠짐없이 반환하고 누락된 스냅샷은 재생으로 채웁니다."""
+        token, profile = owner_token_and_profile
+        today = date.today()
+        start_date = today - timedelta(days=3)
+
+        response = client.get(
+            f"/inventory-snapshots/company/{wholesale_company.id}/date-range",
+            params={"start_date": str(start_date), "end_date": str(today)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert [day["snapshot_date"] for day in result] == [
+            str(start_date + timedelta(days=offset)) for offset in range(4)
+        ]
+        quantities = [
+            {center["center_name"]: center["total_quantity"] for center in day["centers"]} for day in result
+        ]
+        assert quantities == [{"센터 1": 100, "센터 2": 0}] + [{"센터 1": 70, "센터 2": 0}] * 3
+
+        response = client.get(
+            f"/inventory-snapshots/company/{wholesale_company.id}/date-range",
+            params={"start_date": "2025-01-30", "end_date": "2025-02-02"},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        assert [day["snapshot_date"] for day in response.json()] == [
+            "2025-01-30", "2025-01-31", "2025-02-01", "2025-02-02"
+        ]
+
     def test_get_center_inventory_snapshot(
         self, client: TestClient, db: Session,
         owner_token_and_profile, wholesale_company, centers, inventory_snapshots
@@ -335,4 +419,972 @@ class TestInventorySnapshotAPI:
         # 날짜 범위가 잘못되어도 API는 정상 동작하지만 빈 결과 반환
         assert response.status_code == 200
         result = response.json()
-        assert len(result) == 0 
\ No newline at end of file
+        assert len(result) == 0
+
+    def test_create_center_inventory_snapshot_replays_shipments(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """출하 이력으로부터 누락된 일자의 스냅샷을 일괄 생성합니다."""
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+
+        response = client.post(
+            f"/inventory-snapshots/center/{center.id}/date/{today}",
+            params={"company_id": str(wholesale_company.id)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["total_quantity"] == 70
+        assert result["items"][0]["quantity"] == 70
+        assert result["items"][0]["total_price"] == 70000.0
+
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        snapshots = db.query(SnapshotModel).filter(SnapshotModel.center_id == center.id).order_by(
+            SnapshotModel.snapshot_date
+        ).all()
+        assert [s.snapshot_date for s in snapshots] == [today - timedelta(days=d) for d in (3, 2, 1, 0)]
+        assert [s.total_quantity for s in snapshots] == [100, 70, 70, 70]
+
+    def test_shipment_change_propagates_to_existing_snapshots(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments, dummy_contract
+    ):
+        """출하 변동은 이후 날짜의 finalized 되지 않은 스냅샷에 증분 반영되고, 처음 만나는 finalized 스냅샷에서 멈춥니다."""
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+        headers = auth_headers(token, profile.id)
+        params = {"company_id": str(wholesale_company.id)}
+
+        client.post(f"/inventory-snapshots/center/{center.id}/date/{today}", params=params, headers=headers)
+        response = client.post(
+            f"/inventory-snapshots/center/{center.id}/finalize/{today - timedelta(days=1)}",
+            params=params, headers=headers
+        )
+        assert response.status_code == 200
+
+        def add_inbound(shipment_date, items):
+            response = client.post(
+                "/shipments/",
+                json={
+                    "title": "추가 입고",
+                    "contract_id": str(dummy_contract.id),
+                    "receiver_company_id": str(wholesale_company.id),
+                    "arrival_center_id": str(center.id),
+                    "shipment_datetime": datetime.combine(shipment_date, datetime.min.time()).isoformat(),
+                    "items": items
+                },
+                headers=headers
+            )
+            assert response.status_code == 201
+
+        def stored_snapshots():
+            db.expire_all()
+            return db.query(SnapshotModel).filter(SnapshotModel.center_id == center.id).order_by(
+                SnapshotModel.snapshot_date
+            ).all()
+
+        # 2일 전 입고: 2일 전 스냅샷까지만 반영, 어제(finalized)와 그 이후인 오늘은 그대로
+        add_inbound(today - timedelta(days=2), [
+            {"product_name": "쌀", "quality": "A", "quantity": 10, "unit_price": 1000.0, "total_price": 10000.0},
+            {"product_name": "감자", "quality": "B", "quantity": 5, "unit_price": 2000.0, "total_price": 10000.0}
+        ])
+        snapshots = stored_snapshots()
+        assert [s.total_quantity for s in snapshots] == [100, 85, 70, 70]
+        assert sorted((i.product_name, i.quantity) for i in snapshots[1].items) == [("감자", 5), ("쌀", 80)]
+        assert sorted((i.product_name, i.quantity) for i in snapshots[3].items) == [("쌀", 70)]
+
+        # finalized 이후의 입고는 오늘 스냅샷에 반영 (어제 체크포인트 + 오늘 입고)
+        add_inbound(today, [
+            {"product_name": "감자", "quality": "B", "quantity": 5, "unit_price": 2000.0, "total_price": 10000.0}
+        ])
+        snapshots = stored_snapshots()
+        assert [s.total_quantity for s in snapshots] == [100, 85, 70, 75]
+        assert snapshots[3].total_price == 80000.0
+        assert sorted((i.product_name, i.quantity) for i in snapshots[3].items) == [("감자", 5), ("쌀", 70)]
+
+    def test_create_center_inventory_snapshot_from_finalized_checkpoint(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments, dummy_contract
+    ):
+        """finalized 스냅샷을 체크포인트로 삼아 그 이후의 출하만 재생합니다."""
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+        InventorySnapshotFactory.create_complete_inventory_snapshot(
+            db, today - timedelta(days=2), wholesale_company.id, center.id,
+            items_data=[{"product_name": "쌀", "quantity": 500, "quality": "A", "unit_price": 1000.0}],
+            finalized=True
+        )
+        ShipmentFactory.create_complete_shipment(
+            db, dummy_contract.id, profile.id,
+            items_data=[{"product_name": "쌀", "quantity": 10, "quality": "A", "unit_price": 1000.0}],
+            receiver_company_id=wholesale_company.id,
+            arrival_center_id=center.id,
+            shipment_datetime=datetime.combine(today - timedelta(days=1), datetime.min.time())
+        )
+
+        response = client.post(
+            f"/inventory-snapshots/center/{center.id}/date/{today}",
+            params={"company_id": str(wholesale_company.id)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        assert response.json()["total_quantity"] == 510
+
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        snapshot_dates = [
+            s.snapshot_date for s in db.query(SnapshotModel).filter(SnapshotModel.center_id == center.id)
+        ]
+        assert today - timedelta(days=3) not in snapshot_dates
+
+
+    def test_rebuild_company_inventory_snapshots(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, center_shipments, dummy_contract
+    ):
+        """회사 전체 재생성은 finalized 스냅샷을 기준점으로 유지하고, 커널 유무와 무관하게 같은 결과를 냅니다."""
+        token, profile = owner_token_and_profile
+        today = date.today()
+        start_date = today - timedelta(days=3)
+        InventorySnapshotFactory.create_complete_inventory_snapshot(
+            db, today - timedelta(days=2), wholesale_company.id, centers[0].id,
+            items_data=[{"product_name": "쌀", "quantity": 500, "quality": "A", "unit_price": 1000.0}],
+            finalized=True
+        )
+        ShipmentFactory.create_complete_shipment(
+            db, dummy_contract.id, profile.id,
+            items_data=[{"product_name": "감자", "quantity": 20, "quality": "B", "unit_price": 500.0}],
+            receiver_company_id=wholesale_company.id,
+            arrival_center_id=centers[1].id,
+            shipment_datetime=datetime.combine(today - timedelta(days=1), datetime.min.time())
+        )
+
+        def rebuild():
+            response = client.post(
+                f"/inventory-snapshots/company/{wholesale_company.id}/rebuild",
+                params={"start_date": str(start_date), "end_date": str(today)},
+                headers=auth_headers(token, profile.id)
+            )
+            assert response.status_code == 200
+            return [
+                {
+                    center["center_name"]: (center["total_quantity"], center["total_price"])
+                    for center in day["centers"]
+                }
+                for day in response.json()
+            ]
+
+        expected = [
+            {"센터 1": (100, 100000.0), "센터 2": (0, 0.0)},
+            {"센터 1": (500, 500000.0), "센터 2": (0, 0.0)},
+            {"센터 1": (500, 500000.0), "센터 2": (20, 10000.0)},
+            {"센터 1": (500, 500000.0), "센터 2": (20, 10000.0)},
+        ]
+        assert rebuild() == expected
+
+        with patch("app.company.inventory_snapshot.kernel.np", None):
+            assert rebuild() == expected
+
+    def test_rebuild_company_inventory_snapshots_keeps_earlier_history(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, dummy_contract
+    ):
+        """재생성 구간 이전의 출하 이력은 시작 잔고로 이어지며, 커널 유무와 무관하게 같은 결과를 냅니다."""
+        token, profile = owner_token_and_profile
+        today = date.today()
+        start_date = today - timedelta(days=3)
+        ShipmentFactory.create_complete_shipment(
+            db, dummy_contract.id, profile.id,
+            items_data=[{"product_name": "쌀", "quantity": 100, "quality": "A", "unit_price": 1000.0}],
+            receiver_company_id=wholesale_company.id,
+            arrival_center_id=centers[0].id,
+            shipment_datetime=datetime.combine(today - timedelta(days=10), datetime.min.time())
+        )
+
+        def rebuild():
+            response = client.post(
+                f"/inventory-snapshots/company/{wholesale_company.id}/rebuild",
+                params={"start_date": str(start_date), "end_date": str(today)},
+                headers=auth_headers(token, profile.id)
+            )
+            assert response.status_code == 200
+            return [
+                {center["center_name"]: center["total_quantity"] for center in day["centers"]}
+                for day in response.json()
+            ]
+
+        expected = [{"센터 1": 100, "센터 2": 0}] * 4
+        assert rebuild() == expected
+        with patch("app.company.inventory_snapshot.kernel.np", None):
+            assert rebuild() == expected
+
+        response = client.get(
+            f"/inventory-snapshots/center/{centers[0].id}/date/{today}",
+            params={"company_id": str(wholesale_company.id)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.json()["total_quantity"] == 100
+        assert response.json()["items"][0]["total_price"] == 100000.0
+
+    def test_rebuild_company_inventory_snapshots_commits_once(
+        self, db: Session, wholesale_company, centers, center_shipments
+    ):
+        """센터별 재생은 중간에 커밋하지 않아, 모든 센터 잠금이 재생성이 끝날 때까지 유지됩니다."""
+        from sqlalchemy import event
+        from app.company.inventory_snapshot import crud as snapshot_crud
+
+        today = date.today()
+        commits = []
+        commits_seen_by_helper = []
+        create_from_shipments = snapshot_crud.create_daily_snapshots_from_shipments
+
+        def record_commit(session):
+            commits.append(session)
+
+        def create_and_record(*args, **kwargs):
+            commits_seen_by_helper.append(len(commits))
+            return create_from_shipments(*args, **kwargs)
+
+        event.listen(db, "after_commit", record_commit)
+        try:
+            with patch("app.company.inventory_snapshot.kernel.np", None), \
+                    patch.object(snapshot_crud, "create_daily_snapshots_from_shipments", side_effect=create_and_record):
+                snapshot_crud.rebuild_company_inventory_snapshots(
+                    db, today - timedelta(days=3), today, wholesale_company.id
+                )
+        finally:
+            event.remove(db, "after_commit", record_commit)
+
+        assert commits_seen_by_helper == [0, 0]
+        assert len(commits) == 1
+
+    def test_company_inventory_summary_refresh_and_read(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """요약 테이블을 갱신한 뒤 조회하면 스냅샷을 만들지 않고 요약에서 바로 응답합니다."""
+        token, profile = owner_token_and_profile
+        today = date.today()
+
+        response = client.post(
+            f"/inventory-snapshots/company/{wholesale_company.id}/summary/refresh",
+            params={"start_date": str(today - timedelta(days=3)), "end_date": str(today)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        assert response.json()["refreshed_rows"] == 4
+
+        response = client.get(
+            f"/inventory-snapshots/company/{wholesale_company.id}/summary/{today - timedelta(days=3)}",
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        centers = {center["center_name"]: center for center in response.json()["centers"]}
+        assert centers["센터 1"]["total_quantity"] == 100
+        assert centers["센터 2"]["total_quantity"] == 0
+
+        response = client.get(
+            f"/inventory-snapshots/company/{wholesale_company.id}/summary/{today}",
+            headers=auth_headers(token, profile.id)
+        )
+        centers = {center["center_name"]: center for center in response.json()["centers"]}
+        assert centers["센터 1"]["total_quantity"] == 70
+        assert centers["센터 1"]["total_price"] == 70000.0
+
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        assert db.query(SnapshotModel).count() == 0
+
+    def test_company_inventory_summary_refreshes_incrementally(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments, dummy_contract
+    ):
+        """출하 변경은 이후 날짜의 요약만 무효화하고, refresh는 무효화된 날짜만 원장으로 다시 계산합니다."""
+        from sqlalchemy import event
+        from app.company.inventory_snapshot.materialization import materialization_queue
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        token, profile = owner_token_and_profile
+        headers = auth_headers(token, profile.id)
+        today = date.today()
+        center = center_shipments
+        params = {"start_date": str(today - timedelta(days=3)), "end_date": str(today)}
+
+        def refresh():
+            statements = []
+
+            def collect(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            engine = db.get_bind()
+            event.listen(engine, "before_cursor_execute", collect)
+            try:
+                response = client.post(
+                    f"/inventory-snapshots/company/{wholesale_company.id}/summary/refresh",
+                    params=params, headers=headers
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", collect)
+            assert response.status_code == 200
+            assert not any("FROM shipment" in statement or "JOIN shipment" in statement for statement in statements)
+            return response.json()["refreshed_rows"]
+
+        def summary_quantity(target_date):
+            response = client.get(
+                f"/inventory-snapshots/company/{wholesale_company.id}/summary/{target_date}", headers=headers
+            )
+            assert response.status_code == 200
+            centers = {center["center_name"]: center for center in response.json()["centers"]}
+            return centers["센터 1"]["total_quantity"]
+
+        assert refresh() == 4
+        # 이미 유효한 구간은 다시 계산하지 않음
+        assert refresh() == 0
+
+        response = client.post(
+            "/shipments/",
+            json={
+                "title": "추가 입고",
+                "contract_id": str(dummy_contract.id),
+                "receiver_company_id": str(wholesale_company.id),
+                "arrival_center_id": str(center.id),
+                "shipment_datetime": datetime.combine(today - timedelta(days=1), datetime.min.time()).isoformat(),
+                "items": [{"product_name": "쌀", "quality": "A", "quantity": 10, "unit_price": 1000.0, "total_price": 10000.0}]
+            },
+            headers=headers
+        )
+        assert response.status_code == 201
+
+        # 무효화된 날짜는 refresh 전에도 원장으로 계산해서 응답하고, 이전 날짜는 요약 그대로
+        assert summary_quantity(today) == 80
+        assert summary_quantity(today - timedelta(days=3)) == 100
+
+        # 입고 일자(어제)부터 오늘까지만 다시 계산
+        assert refresh() == 2
+        assert summary_quantity(today) == 80
+
+        # 저장된 스냅샷이 없는 조회는 요약에서 응답하고 materialization을 예약하지 않음
+        with patch.object(materialization_queue, "enqueue") as enqueue:
+            response = client.get(
+                f"/inventory-snapshots/center/{center.id}/date/{today}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=headers
+            )
+            assert response.status_code == 200
+            assert response.json()["total_quantity"] == 80
+
+            response = client.get(
+                f"/inventory-snapshots/company/{wholesale_company.id}/date-range",
+                params=params, headers=headers
+            )
+            assert response.status_code == 200
+            enqueue.assert_not_called()
+        assert db.query(SnapshotModel).count() == 0
+
+    def test_get_center_inventory_snapshot_computes_without_writing(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """저장된 스냅샷이 없으면 조회는 쓰기 없이 계산하고, 저장은 materialization 큐가 맡습니다."""
+        from app.company.inventory_snapshot.materialization import materialization_queue
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+
+        with patch.object(materialization_queue, "drain") as drain:
+            response = client.get(
+                f"/inventory-snapshots/center/{center.id}/date/{today}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=auth_headers(token, profile.id)
+            )
+            assert response.status_code == 200
+            assert response.json()["total_quantity"] == 70
+            assert db.query(SnapshotModel).count() == 0
+
+            # 같은 (센터, 날짜)는 한 번만 대기열에 들어갑니다
+            client.get(
+                f"/inventory-snapshots/center/{center.id}/date/{today}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=auth_headers(token, profile.id)
+            )
+            assert materialization_queue.pending() == [(wholesale_company.id, center.id, today)]
+            assert drain.call_count == 2
+
+        materialization_queue.drain(lambda: db)
+        assert materialization_queue.pending() == []
+        snapshot = db.query(SnapshotModel).filter(
+            SnapshotModel.center_id == center.id,
+            SnapshotModel.snapshot_date == today
+        ).one()
+        assert snapshot.total_quantity == 70
+
+    def test_computed_snapshot_matches_materialized_snapshot(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, dummy_contract
+    ):
+        """같은 날 단가가 다른 변동이 있어도, 계산한 스냅샷과 저장된 스냅샷의 단가와 총액이 같습니다."""
+        from app.company.inventory_snapshot.materialization import materialization_queue
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = centers[0]
+        shipment_datetime = datetime.combine(today - timedelta(days=2), datetime.min.time())
+        for quantity, unit_price in ((10, 100.0), (5, 200.0)):
+            ShipmentFactory.create_complete_shipment(
+                db, dummy_contract.id, profile.id,
+                items_data=[{"product_name": "쌀", "quantity": quantity, "quality": "A", "unit_price": unit_price}],
+                receiver_company_id=wholesale_company.id,
+                arrival_center_id=center.id,
+                shipment_datetime=shipment_datetime
+            )
+
+        # drain()이 세션을 닫으므로 요청에 쓸 값은 미리 꺼내 둠
+        url = f"/inventory-snapshots/center/{center.id}/date/{today}"
+        params = {"company_id": str(wholesale_company.id)}
+        headers = auth_headers(token, profile.id)
+
+        def get_center_snapshot():
+            response = client.get(url, params=params, headers=headers)
+            assert response.status_code == 200
+            return response.json()
+
+        with patch.object(materialization_queue, "drain"):
+            computed = get_center_snapshot()
+        materialization_queue.drain(lambda: db)
+        materialized = get_center_snapshot()
+
+        assert computed["items"][0]["unit_price"] == 150.0
+        assert computed["total_price"] == 2250.0
+        assert materialized == computed
+
+    def test_snapshot_replay_runs_off_event_loop(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """저장된 스냅샷이 없을 때의 재생 계산은 이벤트 루프 스레드가 아닌 스레드 풀에서 실행됩니다."""
+        import asyncio
+        from app.company.inventory_snapshot import crud as snapshot_crud
+        from app.company.inventory_snapshot.materialization import materialization_queue
+        token, profile = owner_token_and_profile
+        today = date.today()
+        compute = snapshot_crud.compute_center_inventory_snapshots
+        running_loops = []
+
+        def compute_and_record(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                running_loops.append(True)
+            except RuntimeError:
+                running_loops.append(False)
+            return compute(*args, **kwargs)
+
+        with patch.object(materialization_queue, "drain"), \
+                patch.object(snapshot_crud, "compute_center_inventory_snapshots", side_effect=compute_and_record):
+            for url, params in (
+                (f"/inventory-snapshots/center/{center_shipments.id}/date/{today}", {"company_id": str(wholesale_company.id)}),
+                (f"/inventory-snapshots/company/{wholesale_company.id}/date/{today}", {}),
+                (f"/inventory-snapshots/company/{wholesale_company.id}/summary/{today}", {}),
+            ):
+                response = client.get(url, params=params, headers=auth_headers(token, profile.id))
+                assert response.status_code == 200
+        materialization_queue.clear()
+
+        assert running_loops and not any(running_loops)
+
+    def test_get_center_inventory_snapshot_computes_from_ledger(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """저장된 스냅샷이 없는 조회는 출하를 재생하지 않고, finalized 기준점과 원장 합계로 계산합니다."""
+        from sqlalchemy import event
+        from app.company.inventory_snapshot.materialization import materialization_queue
+
+        engine = db.get_bind()
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+
+        def get_center_snapshot(target_date):
+            statements = []
+
+            def collect(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", collect)
+            try:
+                response = client.get(
+                    f"/inventory-snapshots/center/{center.id}/date/{target_date}",
+                    params={"company_id": str(wholesale_company.id)},
+                    headers=auth_headers(token, profile.id)
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", collect)
+            assert response.status_code == 200
+            assert not any("FROM shipment" in statement or "JOIN shipment" in statement for statement in statements)
+            return response.json()
+
+        # 응답 후 저장(materialization)은 막아 두고 계산 경로만 확인
+        with patch.object(materialization_queue, "drain"):
+            # 기준점이 없으면 원장 전체 합계 (100 입고, 30 출고)
+            assert get_center_snapshot(today)["total_quantity"] == 70
+            assert get_center_snapshot(today - timedelta(days=3))["total_quantity"] == 100
+
+            # finalized 기준점이 있으면 그 이후의 원장 변동만 더함
+            InventorySnapshotFactory.create_complete_inventory_snapshot(
+                db, today - timedelta(days=2), wholesale_company.id, center.id,
+                items_data=[{"product_name": "쌀", "quantity": 500, "quality": "A", "unit_price": 1000.0}],
+                finalized=True
+            )
+            result = get_center_snapshot(today)
+            assert result["total_quantity"] == 500
+            assert result["items"][0]["total_price"] == 500000.0
+        materialization_queue.clear()
+
+    def test_upsert_center_snapshots_merges_on_conflict(
+        self, client: TestClient, db: Session, wholesale_company, centers
+    ):
+        """같은 (회사, 센터, 날짜)를 다시 기록하면 기존 스냅샷을 갱신하고, finalized 스냅샷은 건드리지 않습니다."""
+        from app.company.inventory_snapshot.crud import upsert_center_snapshots
+        from app.company.inventory_snapshot.models import (
+            CenterInventorySnapshot as SnapshotModel,
+            CenterInventorySnapshotItem as SnapshotItemModel
+        )
+        today = date.today()
+        InventorySnapshotFactory.create_center_inventory_snapshot(
+            db, today, wholesale_company.id, centers[1].id, finalized=True
+        )
+
+        def write(quantity):
+            snapshot_rows = []
+            item_rows = []
+            for center in centers:
+                snapshot_id = uuid.uuid4()
+                snapshot_rows.append({
+                    'id': snapshot_id, 'snapshot_date': today, 'company_id': wholesale_company.id,
+                    'center_id': center.id, 'total_quantity': quantity, 'total_price': quantity * 10.0,
+                    'finalized': False
+                })
+                item_rows.append({
+                    'id': uuid.uuid4(), 'center_inventory_snapshot_id': snapshot_id, 'product_name': "쌀",
+                    'quality': ProductQuality.A, 'quantity': quantity, 'unit_price': 10.0,
+                    'total_price': quantity * 10.0
+                })
+            upsert_center_snapshots(db, snapshot_rows, item_rows)
+            db.commit()
+
+        write(5)
+        write(7)
+
+        snapshots = {s.center_id: s for s in db.query(SnapshotModel).all()}
+        assert len(snapshots) == 2
+        assert snapshots[centers[0].id].total_quantity == 7
+        assert snapshots[centers[1].id].total_quantity == 100
+        items = db.query(SnapshotItemModel).all()
+        assert [(item.center_inventory_snapshot_id, item.quantity) for item in items] == [
+            (snapshots[centers[0].id].id, 7)
+        ]
+
+    def test_finalize_company_inventory_snapshots_in_bulk(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, inventory_snapshots
+    ):
+        """기간 내 모든 센터 스냅샷을 UPDATE 한 번으로 finalized 처리하고 일괄 조회로 반환합니다."""
+        from sqlalchemy import event
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+
+        engine = db.get_bind()
+        token, profile = owner_token_and_profile
+        today = date.today()
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            if "center_inventory_snapshots" in statement or "center_snapshot_items" in statement:
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            response = client.post(
+                f"/inventory-snapshots/company/{wholesale_company.id}/finalize",
+                params={"start_date": str(today - timedelta(days=1)), "end_date": str(today)},
+                headers=auth_headers(token, profile.id)
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+
+        assert response.status_code == 200
+        result = response.json()
+        assert [day["snapshot_date"] for day in result] == [str(today - timedelta(days=1)), str(today)]
+        assert all(len(day["centers"]) == 2 for day in result)
+        assert len([statement for statement in statements if statement.lstrip().startswith("UPDATE")]) == 1
+        assert len(statements) == 3
+
+        db.expire_all()
+        assert all(snapshot.finalized for snapshot in db.query(SnapshotModel).all())
+
+    def test_compact_finalized_snapshots_resolves_to_earlier_day(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers
+    ):
+        """변동 없는 finalized 날짜의 아이템은 지워지고, 조회 시 가장 가까운 이전 저장일로 해석됩니다."""
+        from app.company.inventory_snapshot.crud import compact_center_inventory_snapshots
+        from app.company.inventory_snapshot.models import CenterInventorySnapshotItem as SnapshotItemModel
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = centers[0]
+        unchanged = [{"product_name": "쌀", "quantity": 50, "quality": "A", "unit_price": 1000.0, "total_price": 50000.0}]
+        changed = [{"product_name": "쌀", "quantity": 45, "quality": "A", "unit_price": 1000.0, "total_price": 45000.0}]
+        for offset, items_data in ((3, unchanged), (2, unchanged), (1, unchanged), (0, changed)):
+            InventorySnapshotFactory.create_complete_inventory_snapshot(
+                db, today - timedelta(days=offset), wholesale_company.id, center.id,
+                items_data=items_data, finalized=True
+            )
+
+        assert compact_center_inventory_snapshots(db, wholesale_company.id) == 2
+        assert compact_center_inventory_snapshots(db, wholesale_company.id) == 0
+        assert db.query(SnapshotItemModel).count() == 2
+
+        response = client.get(
+            f"/inventory-snapshots/company/{wholesale_company.id}/date-range",
+            params={"start_date": str(today - timedelta(days=3)), "end_date": str(today)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        quantities = [
+            [item["quantity"] for center in day["centers"] if center["center_name"] == "센터 1" for item in center["items"]]
+            for day in response.json()
+        ]
+        assert quantities == [[50], [50], [50], [45]]
+
+    def test_update_compacted_snapshots_keeps_other_days(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, dummy_contract
+    ):
+        """압축 원본이나 압축된 날짜를 수정해도 다른 날짜의 아이템은 바뀌지 않고, 총합은 아이템과 일치합니다."""
+        from app.company.inventory_snapshot.crud import compact_center_inventory_snapshots
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = centers[0]
+        unchanged = [{"product_name": "쌀", "quantity": 50, "quality": "A", "unit_price": 1000.0, "total_price": 50000.0}]
+        changed = [{"product_name": "쌀", "quantity": 45, "quality": "A", "unit_price": 1000.0, "total_price": 45000.0}]
+        for offset, items_data in ((3, unchanged), (2, unchanged), (1, unchanged), (0, changed)):
+            InventorySnapshotFactory.create_complete_inventory_snapshot(
+                db, today - timedelta(days=offset), wholesale_company.id, center.id,
+                items_data=items_data, finalized=True
+            )
+        assert compact_center_inventory_snapshots(db, wholesale_company.id) == 2
+
+        def update(target_date, quantity):
+            response = client.put(
+                f"/inventory-snapshots/company/{wholesale_company.id}/date/{target_date}",
+                json={
+                    "snapshot_date": str(target_date),
+                    "centers": [{
+                        "center_id": str(center.id),
+                        "items": [{"product_name": "쌀", "quality": "A", "quantity": quantity, "unit_price": 1000.0}]
+                    }]
+                },
+                params={"contract_id": str(dummy_contract.id)},
+                headers=auth_headers(token, profile.id)
+            )
+            assert response.status_code == 200
+
+        # 압축 원본(3일 전)과 압축된 날짜(어제)를 각각 수정
+        update(today - timedelta(days=3), 60)
+        update(today - timedelta(days=1), 40)
+
+        response = client.get(
+            f"/inventory-snapshots/company/{wholesale_company.id}/date-range",
+            params={"start_date": str(today - timedelta(days=3)), "end_date": str(today)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        snapshots = [
+            next(center for center in day["centers"] if center["center_name"] == "센터 1")
+            for day in response.json()
+        ]
+        assert [[item["quantity"] for item in snapshot["items"]] for snapshot in snapshots] == [[60], [50], [40], [45]]
+        assert [snapshot["total_quantity"] for snapshot in snapshots] == [60, 50, 40, 45]
+        assert [snapshot["total_price"] for snapshot in snapshots] == [60000.0, 50000.0, 40000.0, 45000.0]
+
+    def test_get_point_in_time_inventory(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """시점 재고는 스냅샷을 만들지 않고 출하 이력의 누적 합계로 계산합니다."""
+        from app.company.inventory_snapshot.models import CenterInventorySnapshot as SnapshotModel
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+
+        expected = {
+            today - timedelta(days=4): [],
+            today - timedelta(days=3): [("쌀", 100, str(today - timedelta(days=3)))],
+            today: [("쌀", 70, str(today - timedelta(days=2)))],
+        }
+        for target_date, items in expected.items():
+            response = client.get(
+                f"/inventory-snapshots/center/{center.id}/point-in-time/{target_date}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=auth_headers(token, profile.id)
+            )
+            assert response.status_code == 200
+            assert [
+                (item["product_name"], item["quantity"], item["last_movement_date"])
+                for item in response.json()["items"]
+            ] == items
+
+        response = client.get(
+            f"/inventory-snapshots/center/{center.id}/point-in-time/{today}",
+            params={"company_id": str(wholesale_company.id), "product_name": "감자"},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.json()["items"] == []
+        assert db.query(SnapshotModel).count() == 0
+
+    def test_update_company_inventory_snapshot_bulk_writes_adjustments(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, inventory_snapshots, dummy_contract
+    ):
+        """재고 조정은 아이템을 미리 읽어 두고, 조정 출하 아이템을 한 번의 bulk insert로 기록합니다."""
+        from sqlalchemy import event
+        from app.transactions.shipment.models import ShipmentItem
+
+        engine = db.get_bind()
+        token, profile = owner_token_and_profile
+        today = date.today()
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("INSERT INTO shipment_items") or (
+                statement.lstrip().startswith("SELECT") and "FROM center_snapshot_items" in statement
+            ):
+                statements.append(statement)
+
+        update_data = {
+            "snapshot_date": str(today),
+            "centers": [
+                {
+                    "center_id": str(center.id),
+                    "items": [
+                        {"product_name": "쌀", "quality": "A", "quantity": 100, "unit_price": 10000.0},
+                        {"product_name": "양파", "quality": "A", "quantity": 5, "unit_price": 3000.0}
+                    ]
+                } for center in centers
+            ]
+        }
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            response = client.put(
+                f"/inventory-snapshots/company/{wholesale_company.id}/date/{today}",
+                json=update_data,
+                params={"contract_id": str(dummy_contract.id)},
+                headers=auth_headers(token, profile.id)
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+
+        assert response.status_code == 200
+        assert len([s for s in statements if s.lstrip().startswith("INSERT")]) == 1
+        for center in response.json()["centers"]:
+            quantities = {item["product_name"]: item["quantity"] for item in center["items"]}
+            assert quantities == {"쌀": 100, "양파": 5}
+        adjustments = sorted((item.product_name, item.quantity) for item in db.query(ShipmentItem).all())
+        assert adjustments == [("쌀", 60), ("쌀", 60), ("양파", 15), ("양파", 15)]
+
+    def test_update_company_inventory_snapshot_records_adjustments_in_ledger(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, inventory_snapshots, dummy_contract
+    ):
+        """재고 조정 출하도 원장에 기록되어, 원장 누적 합계와 출하 기반 시점 재고가 같은 값을 냅니다."""
+        from app.company.inventory_snapshot.crud import get_center_inventory_balance
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = centers[0]
+
+        response = client.put(
+            f"/inventory-snapshots/company/{wholesale_company.id}/date/{today}",
+            json={
+                "snapshot_date": str(today),
+                "centers": [{
+                    "center_id": str(center.id),
+                    "items": [
+                        {"product_name": "쌀", "quality": "A", "quantity": 100, "unit_price": 10000.0},
+                        {"product_name": "양파", "quality": "A", "quantity": 5, "unit_price": 3000.0}
+                    ]
+                }]
+            },
+            params={"contract_id": str(dummy_contract.id)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+
+        # 증가분(쌀 +60)은 입고, 감소분(양파 -15)은 출고로 기록
+        ledger = [
+            (row.product_name, row.quantity)
+            for row in get_center_inventory_balance(db, today, wholesale_company.id, center.id)
+        ]
+        assert ledger == [("쌀", 60), ("양파", -15)]
+
+        response = client.get(
+            f"/inventory-snapshots/center/{center.id}/point-in-time/{today}",
+            params={"company_id": str(wholesale_company.id)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert sorted((item["product_name"], item["quantity"]) for item in response.json()["items"]) == ledger
+
+    def test_create_center_inventory_snapshot_reuses_existing_rebuild(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, center_shipments
+    ):
+        """센터 잠금을 얻은 뒤 이미 만들어진 스냅샷이 있으면 재생하지 않고 그대로 재사용합니다."""
+        from sqlalchemy import event
+        from app.company.inventory_snapshot.crud import center_lock_key
+
+        engine = db.get_bind()
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = center_shipments
+
+        key = center_lock_key(wholesale_company.id, center.id)
+        assert key == center_lock_key(wholesale_company.id, center.id)
+        assert -2 ** 63 <= key < 2 ** 63
+
+        def create():
+            return client.post(
+                f"/inventory-snapshots/center/{center.id}/date/{today}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=auth_headers(token, profile.id)
+            )
+
+        first = create()
+        assert first.status_code == 200
+
+        shipment_queries = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            if "FROM shipment" in statement:
+                shipment_queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            second = create()
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert shipment_queries == []
+
+    def test_finalized_center_snapshot_served_from_cache(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, inventory_snapshots, dummy_contract
+    ):
+        """finalized 스냅샷은 두 번째 조회부터 DB를 읽지 않고, 수정되면 캐시가 무효화됩니다."""
+        from sqlalchemy import event
+
+        engine = db.get_bind()
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = centers[0]
+
+        client.post(
+            f"/inventory-snapshots/company/{wholesale_company.id}/finalize",
+            params={"start_date": str(today), "end_date": str(today)},
+            headers=auth_headers(token, profile.id)
+        )
+
+        def get_center_snapshot():
+            return client.get(
+                f"/inventory-snapshots/center/{center.id}/date/{today}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=auth_headers(token, profile.id)
+            )
+
+        assert get_center_snapshot().json()["total_quantity"] == 60
+
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            if "center_inventory_snapshots" in statement or "center_snapshot_items" in statement:
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            assert get_center_snapshot().json()["total_quantity"] == 60
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+        assert statements == []
+
+        response = client.put(
+            f"/inventory-snapshots/company/{wholesale_company.id}/date/{today}",
+            json={
+                "snapshot_date": str(today),
+                "centers": [{
+                    "center_id": str(center.id),
+                    "items": [
+                        {"product_name": "쌀", "quality": "A", "quantity": 45, "unit_price": 10000.0},
+                        {"product_name": "양파", "quality": "A", "quantity": 20, "unit_price": 3000.0}
+                    ]
+                }]
+            },
+            params={"contract_id": str(dummy_contract.id)},
+            headers=auth_headers(token, profile.id)
+        )
+        assert response.status_code == 200
+        assert get_center_snapshot().json()["total_quantity"] == 65
+
+    def test_finalized_snapshot_cache_invalidated_after_commit(
+        self, client: TestClient, db: Session,
+        owner_token_and_profile, wholesale_company, centers, inventory_snapshots, dummy_contract
+    ):
+        """수정 커밋 전에 다른 요청이 이전 finalized 스냅샷을 다시 캐시해도, 커밋 후에는 새 값을 반환합니다."""
+        from app.company.inventory_snapshot import crud as snapshot_crud
+        from app.company.inventory_snapshot.cache import finalized_snapshot_cache
+        from app.company.inventory_snapshot.schemas import CenterInventorySnapshot
+
+        token, profile = owner_token_and_profile
+        today = date.today()
+        center = centers[0]
+        client.post(
+            f"/inventory-snapshots/company/{wholesale_company.id}/finalize",
+            params={"start_date": str(today), "end_date": str(today)},
+            headers=auth_headers(token, profile.id)
+        )
+
+        def get_center_snapshot():
+            return client.get(
+                f"/inventory-snapshots/center/{center.id}/date/{today}",
+                params={"company_id": str(wholesale_company.id)},
+                headers=auth_headers(token, profile.id)
+            ).json()
+
+        stale = CenterInventorySnapshot.model_validate(get_center_snapshot())
+        assert stale.total_quantity == 60
+        record_inventory_movements = snapshot_crud.record_inventory_movements
+
+        def record_and_recache(*args, **kwargs):
+            # 무효화 이후, 커밋 이전에 동시 요청이 이전 스냅샷을 다시 캐시한 상황
+            finalized_snapshot_cache.put(center.id, today, stale)
+            return record_inventory_movements(*args, **kwargs)
+
+        with patch.object(snapshot_crud, "record_inventory_movements", side_effect=record_and_recache):
+            response = client.put(
+                f"/inventory-snapshots/company/{wholesale_company.id}/date/{today}",
+                json={
+                    "snapshot_date": str(today),
+                    "centers": [{
+                        "center_id": str(center.id),
+                        "items": [
+                            {"product_name": "쌀", "quality": "A", "quantity": 45, "unit_price": 10000.0},
+                            {"product_name": "양파", "quality": "A", "quantity": 20, "unit_price": 3000.0}
+                        ]
+                    }]
+                },
+                params={"contract_id": str(dummy_contract.id)},
+                headers=auth_headers(token, profile.id)
+            )
+        assert response.status_code == 200
+        assert get_center_snapshot()["total_quantity"] == 65
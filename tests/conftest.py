@@ -1,12 +1,13 @@
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from fastapi.testclient import TestClient
 from dotenv import load_dotenv
 
 from app.database.base import Base
-from app.database.session import get_db
+from app.database.session import get_db, get_async_db
 from app.main import app
 
 # 테스트용 .env.test 파일 로드
@@ -23,6 +24,15 @@ engine = create_engine(
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 라우트용 엔진 (같은 SQLite 파일, aiosqlite 드라이버)
+# 요청마다 이벤트 루프가 다를 수 있으므로 커넥션을 재사용하지 않음
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test.db",
+    poolclass=NullPool,
+)
+
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 @pytest.fixture(scope="function")
 def db():
     """테스트용 데이터베이스 세션을 제공합니다."""
@@ -36,6 +46,11 @@ def db():
         # 테스트 종료 후 테이블 삭제
         Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture
+def async_bind():
+    """비동기 라우트가 사용하는 엔진 (쿼리 이벤트 리스너 등록용 sync_engine)"""
+    return async_engine.sync_engine
+
 @pytest.fixture(scope="function")
 def client(db):
     """테스트용 FastAPI 클라이언트를 제공합니다."""
@@ -45,7 +60,14 @@ def client(db):
         finally:
             pass
 
+    async def override_get_async_db():
+        # 테스트 세션의 변경 사항을 비동기 세션에서 볼 수 있도록 먼저 커밋
+        db.commit()
+        async with AsyncTestingSessionLocal() as async_db:
+            yield async_db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -759,5 +759,10 @@ class ShipmentFactory:
             item = ShipmentFactory.create_shipment_item(db, shipment.id, **item_data)
             items.append(item)
         
+        # 출하 CRUD와 마찬가지로 재고 원장에 기록
+        from app.company.inventory_snapshot.crud import build_shipment_movements, record_inventory_movements
+        record_inventory_movements(db, build_shipment_movements(shipment, items))
+        db.commit()
+        
         return {"shipment": shipment, "items": items}
 
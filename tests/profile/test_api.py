@@ -414,4 +414,68 @@ class TestProfileAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["username"] == "company_user"
-        # company_name 검증 제거 
\ No newline at end of file
+        # company_name 검증 제거 
+    def test_auth_resolution_is_cached_until_profile_update(self, client: TestClient, db: Session):
+        """인증된 사용자/프로필 조회는 캐시되고, 프로필 수정 시 무효화됩니다."""
+        from sqlalchemy import event
+
+        setup = TestDataFactory.create_complete_user_setup(db, username="cached_user", company_name="캐시 회사")
+        user, profile = setup["user"], setup["profile"]
+        token = create_access_token(data={"sub": str(user.id)})
+        headers = {"Authorization": f"Bearer {token}", "X-Profile-ID": str(profile.id)}
+
+        engine = db.get_bind()
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        def auth_queries(path):
+            statements.clear()
+            event.listen(engine, "before_cursor_execute", collect)
+            try:
+                response = client.get(path, headers=headers)
+            finally:
+                event.remove(engine, "before_cursor_execute", collect)
+            return response, [s for s in statements if "FROM users" in s or "FROM profiles" in s]
+
+        # 토큰 검증 후 프로필/사용자/회사를 하나의 SQL 문으로 조회
+        response, queries = auth_queries("/companies/me")
+        assert response.status_code == 200
+        assert len(queries) == 1
+        assert "JOIN users" in queries[0] and "JOIN companies" in queries[0]
+
+        # 두 번째 요청부터는 캐시에서 사용자/프로필을 가져옴
+        response, queries = auth_queries("/companies/me")
+        assert response.status_code == 200
+        assert response.json()["name"] == "캐시 회사"
+        assert queries == []
+
+        # 프로필 수정 엔드포인트가 캐시를 무효화
+        response = client.put(f"/profile/{profile.id}", json={"name": "수정된 이름"}, headers=headers)
+        assert response.status_code == 200
+        response, queries = auth_queries("/companies/me")
+        assert response.status_code == 200
+        assert len([s for s in queries if "FROM profiles" in s]) == 1
+
+        # ORM으로 회사 연결이 바뀌어도 캐시된 값을 쓰지 않음
+        db.refresh(profile)
+        profile.company_id = None
+        db.commit()
+        response, _ = auth_queries("/companies/me")
+        assert response.status_code == 404
+
+    def test_authenticated_profile_requires_ownership(self, client: TestClient, db: Session):
+        """다른 사용자의 프로필 ID로는 인증할 수 없습니다."""
+        setup = TestDataFactory.create_complete_user_setup(db, username="owner_user", company_name="소유 회사")
+        other_user = UserFactory.create_user(db)
+        token = create_access_token(data={"sub": str(other_user.id)})
+
+        response = client.get(
+            "/companies/me",
+            headers={"Authorization": f"Bearer {token}", "X-Profile-ID": str(setup["profile"].id)}
+        )
+        assert response.status_code == 403
+
+        response = client.get("/companies/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 400
@@ -0,0 +1,68 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.company.inventory_snapshot.models import CenterInventorySnapshot, DailyInventoryBalanceCoverage
+from app.worker import (
+    main, run_nightly_materialization, run_scheduled_materialization, seconds_until_next_run
+)
+from tests.factories import CenterFactory, CompanyFactory, ProfileFactory, UserFactory
+
+
+def test_run_nightly_materialization_creates_snapshot_for_every_center(db: Session):
+    """모든 회사의 모든 센터에 대해 대상 날짜 스냅샷을 미리 만듭니다."""
+    target_date = date(2025, 3, 1)
+    company_centers = {}
+    for index in range(2):
+        user = UserFactory.create_user(db, email=f"worker_{index}@example.com")
+        owner = ProfileFactory.create_wholesaler_profile(db, user_id=user.id, username=f"worker_owner_{index}")
+        company = CompanyFactory.create_wholesale_company(db, owner_id=owner.id, name=f"워커 회사 {index}")
+        company_centers[company.id] = [
+            CenterFactory.create_center(db, company.id, name=f"센터 {index}-{number}").id
+            for number in range(index + 1)
+        ]
+
+    results = run_nightly_materialization(target_date, max_workers=1, session_factory=lambda: db)
+
+    assert results == {company_id: len(center_ids) for company_id, center_ids in company_centers.items()}
+    snapshot_centers = {
+        snapshot.center_id
+        for snapshot in db.query(CenterInventorySnapshot).filter(CenterInventorySnapshot.snapshot_date == target_date)
+    }
+    assert snapshot_centers == {center_id for center_ids in company_centers.values() for center_id in center_ids}
+    # 일별 재고 요약도 대상 날짜까지 갱신
+    covered_centers = {
+        coverage.center_id
+        for coverage in db.query(DailyInventoryBalanceCoverage).filter(
+            DailyInventoryBalanceCoverage.valid_through == target_date
+        )
+    }
+    assert covered_centers == snapshot_centers
+
+
+def test_seconds_until_next_run():
+    assert seconds_until_next_run(datetime(2025, 3, 1, 0, 0), "00:05") == 300
+    assert seconds_until_next_run(datetime(2025, 3, 1, 0, 10), "00:05") == 24 * 3600 - 300
+
+
+def test_scheduled_loop_survives_failed_run():
+    """한 번의 실행이 실패해도 워커 루프는 멈추지 않고 다음 실행을 계속합니다."""
+    runs = []
+
+    def fail_then_succeed(target_date=None):
+        runs.append(target_date)
+        if len(runs) == 1:
+            raise RuntimeError("connection refused")
+        return {}
+
+    with patch("app.worker.run_nightly_materialization", side_effect=fail_then_succeed), \
+            patch("app.worker.time_module.sleep", side_effect=[None, None, KeyboardInterrupt]):
+        assert run_scheduled_materialization() is None
+        assert run_scheduled_materialization() == {}
+        runs.clear()
+        with pytest.raises(KeyboardInterrupt):
+            main([])
+
+    assert len(runs) == 2
@@ -348,6 +348,121 @@ class TestContractAPI:
         result = response.json()
         assert len(result) >= 3  # 최소 3개 이상의 계약이 있어야 함
 
+    def test_list_contracts_loads_details_in_batch(
+        self, client: TestClient, db: Session, async_bind,
+        supplier_token_and_profile, receiver_token_and_profile, supplier_company, receiver_company, centers
+    ):
+        """계약 목록 조회가 계약 수와 무관하게 엔티티 종류별 쿼리 1회로 상세 정보를 구성하는지 테스트"""
+        from sqlalchemy import event
+
+        token, profile = supplier_token_and_profile
+        _, receiver_profile = receiver_token_and_profile
+
+        for i in range(4):
+            contract_data = {
+                "title": f"배치 조회 계약 {i+1}",
+                "supplier_contractor_id": str(profile.id),
+                "receiver_contractor_id": str(receiver_profile.id),
+                "supplier_company_id": str(supplier_company.id),
+                "receiver_company_id": str(receiver_company.id),
+                "departure_center_id": str(centers[i % 2].id),
+                "arrival_center_id": str(centers[2].id),
+                "items": [
+                    {
+                        "product_name": "쌀",
+                        "quality": ProductQuality.A.value,
+                        "quantity": 100,
+                        "unit_price": 10000.0,
+                        "total_price": 1000000.0
+                    }
+                ]
+            }
+            response = client.post("/contracts/", json=contract_data, headers=auth_headers(token, profile.id))
+            assert response.status_code == 201
+
+        statements = []
+        engine = async_bind
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            response = client.get("/contracts/", headers=auth_headers(token, profile.id))
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+
+        assert response.status_code == 200
+        result = response.json()
+        assert len(result) == 4
+        assert all(contract["supplier_contractor"]["company_name"] == supplier_company.name for contract in result)
+        assert all(contract["receiver_contractor"]["company_name"] == receiver_company.name for contract in result)
+        assert {contract["departure_center"]["name"] for contract in result} == {centers[0].name, centers[1].name}
+        assert all(len(contract["items"]) == 1 for contract in result)
+
+        def count(table):
+            return len([s for s in statements if f"FROM {table}" in s and "count(" not in s])
+
+        assert count("contract_items") == 1
+        assert count("companies") == 1
+        assert count("centers") == 1
+        # 인증 의존성의 프로필 조회를 제외한 프로필 IN 쿼리
+        assert len([s for s in statements if "FROM profiles" in s and " IN (" in s]) == 1
+
+    def test_list_contracts_cursor_pagination(
+        self, client: TestClient, db: Session,
+        supplier_token_and_profile, supplier_company, receiver_company
+    ):
+        """계약 목록 커서(키셋) 페이지네이션 테스트 (계약 일시가 없는 계약 포함)"""
+        token, profile = supplier_token_and_profile
+
+        contract_datetimes = [None, None, datetime(2025, 3, 1, 9, 0), datetime(2025, 3, 1, 9, 0), datetime(2025, 3, 2, 9, 0)]
+        for i, contract_datetime in enumerate(contract_datetimes):
+            contract_data = {
+                "title": f"커서 계약 {i+1}",
+                "supplier_company_id": str(supplier_company.id),
+                "receiver_company_id": str(receiver_company.id),
+                "items": [
+                    {
+                        "product_name": "쌀",
+                        "quality": ProductQuality.A.value,
+                        "quantity": 10,
+                        "unit_price": 1000.0,
+                        "total_price": 10000.0
+                    }
+                ]
+            }
+            if contract_datetime:
+                contract_data["contract_datetime"] = contract_datetime.isoformat()
+            response = client.post("/contracts/", json=contract_data, headers=auth_headers(token, profile.id))
+            assert response.status_code == 201
+
+        titles = []
+        cursor = None
+        for _ in range(4):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/contracts/", params=params, headers=auth_headers(token, profile.id))
+            assert response.status_code == 200
+            assert "X-Total-Count" not in response.headers
+            titles.extend(contract["title"] for contract in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert len(titles) == 5
+        assert set(titles) == {f"커서 계약 {i+1}" for i in range(5)}
+        # 계약 일시가 없는 계약이 먼저, 이후 일시 순
+        assert set(titles[:2]) == {"커서 계약 1", "커서 계약 2"}
+        assert titles[-1] == "커서 계약 5"
+
+        response = client.get(
+            "/contracts/", params={"include_total": "true"}, headers=auth_headers(token, profile.id)
+        )
+        assert response.headers["X-Total-Count"] == "5"
+
     def test_list_contracts_with_filters(
         self, client: TestClient, db: Session,
         supplier_token_and_profile, supplier_company, receiver_company, centers
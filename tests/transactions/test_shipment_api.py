@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from uuid import uuid4
 from fastapi import status
 from sqlalchemy.orm import Session
@@ -26,8 +26,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, creator.id
         )
@@ -77,8 +77,8 @@ class TestShipmentAPI:
         )
         member = setup["profile"]
         user = setup["user"]
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # 출하 생성 요청
         shipment_data = {
@@ -109,8 +109,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
         )
@@ -143,8 +143,8 @@ class TestShipmentAPI:
         setup = TestDataFactory.create_complete_user_setup(db, username="viewer")
         viewer = setup["profile"]
         user = setup["user"]
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # API 호출
         response = client.get(
@@ -170,8 +170,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user1
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user1.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, creator.id
         )
@@ -186,7 +186,7 @@ class TestShipmentAPI:
         shipment = shipment_data["shipment"]
         
         # 다른 회사 사용자가 조회 시도
-        client.app.dependency_overrides[get_current_user] = lambda: user2
+        client.app.dependency_overrides[get_current_user_id] = lambda: user2.id
         response = client.get(
             f"/shipments/{shipment.id}",
             headers={"X-Profile-ID": str(other.id)}
@@ -206,8 +206,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
         )
@@ -224,7 +224,7 @@ class TestShipmentAPI:
         
         # API 호출
         response = client.get(
-            "/shipments/",
+            "/shipments/?include_total=true",
             headers={"X-Profile-ID": str(viewer.id)}
         )
         
@@ -245,8 +245,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
         )
@@ -291,8 +291,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, updater.id
         )
@@ -346,8 +346,8 @@ class TestShipmentAPI:
         setup = TestDataFactory.create_complete_user_setup(db, username="updater")
         updater = setup["profile"]
         user = setup["user"]
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         update_data = {
             "title": "업데이트된 출하",
             "contract_id": str(uuid4()),
@@ -376,8 +376,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, deleter.id
         )
@@ -413,8 +413,8 @@ class TestShipmentAPI:
         setup = TestDataFactory.create_complete_user_setup(db, username="deleter")
         deleter = setup["profile"]
         user = setup["user"]
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # API 호출
         response = client.delete(
@@ -436,8 +436,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 센터 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         departure_center = CenterFactory.create_center(
             db, supplier_company.id, "출발 센터"
         )
@@ -497,8 +497,8 @@ class TestShipmentAPI:
         buyer_company = CompanyFactory.create_company(db, name="구매 회사")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
         )
@@ -515,7 +515,7 @@ class TestShipmentAPI:
         
         # 페이지네이션 테스트 (limit=2, skip=1)
         response = client.get(
-            "/shipments/?limit=2&skip=1",
+            "/shipments/?limit=2&skip=1&include_total=true",
             headers={"X-Profile-ID": str(viewer.id)}
         )
         
@@ -523,4 +523,282 @@ class TestShipmentAPI:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data["shipments"]) == 2
-        assert data["total"] == 5 
\ No newline at end of file
+        assert data["total"] == 5
+
+    def test_shipment_cursor_pagination(self, client, db: Session):
+        """출하 목록 커서(키셋) 페이지네이션 테스트"""
+        setup = TestDataFactory.create_complete_user_setup(db, username="viewer")
+        viewer = setup["profile"]
+        user = setup["user"]
+        supplier_company = setup["company"]
+        buyer_company = CompanyFactory.create_company(db, name="구매 회사")
+
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
+        contract = ContractFactory.create_complete_contract(
+            db, supplier_company.id, buyer_company.id, viewer.id
+        )["contract"]
+
+        # 같은 시각의 출하를 섞어 id로 순서가 구분되는지 확인
+        base = datetime(2025, 3, 1, 9, 0)
+        for i in range(5):
+            ShipmentFactory.create_shipment(
+                db, contract.id, viewer.id,
+                title=f"출하 {i+1}",
+                supplier_company_id=supplier_company.id,
+                receiver_company_id=buyer_company.id,
+                shipment_datetime=base + timedelta(days=i // 2)
+            )
+
+        titles = []
+        cursor = None
+        for _ in range(3):
+            url = "/shipments/?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            response = client.get(url, headers={"X-Profile-ID": str(viewer.id)})
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["total"] is None
+            titles.extend(shipment["title"] for shipment in data["shipments"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert sorted(titles) == [f"출하 {i+1}" for i in range(5)]
+        assert len(set(titles)) == 5
+
+        response = client.get("/shipments/?cursor=invalid", headers={"X-Profile-ID": str(viewer.id)})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_shipment_cursor_pagination_across_company_roles(self, db: Session):
+        """공급/수령 양쪽 출하를 UNION ALL 두 갈래로 읽어도 순서와 중복 없이 페이지가 이어지는지 테스트"""
+        from sqlalchemy import event
+        from app.transactions.shipment.crud import get_shipments
+
+        setup = TestDataFactory.create_complete_user_setup(db, username="keyset")
+        profile = setup["profile"]
+        company = setup["company"]
+        partner_company = CompanyFactory.create_company(db, name="거래 회사")
+        contract = ContractFactory.create_contract(db, company.id, partner_company.id, creator_id=profile.id)
+
+        base = datetime(2025, 3, 1, 9, 0)
+        roles = [
+            (company.id, partner_company.id, base),
+            (partner_company.id, company.id, base),
+            (company.id, company.id, base + timedelta(days=1)),
+            (partner_company.id, company.id, None),
+            (company.id, partner_company.id, base + timedelta(days=2)),
+        ]
+        for i, (supplier_id, receiver_id, shipment_datetime) in enumerate(roles):
+            shipment = ShipmentFactory.create_shipment(
+                db, contract.id, profile.id,
+                title=f"역할 출하 {i+1}",
+                supplier_company_id=supplier_id,
+                receiver_company_id=receiver_id,
+                shipment_datetime=shipment_datetime
+            )
+            # 팩토리는 일시가 없으면 현재 시각을 쓰므로 직접 비움
+            if shipment_datetime is None:
+                shipment.shipment_datetime = None
+                db.commit()
+        # 다른 회사끼리의 출하는 포함되지 않아야 함
+        ShipmentFactory.create_shipment(
+            db, contract.id, profile.id, title="무관한 출하",
+            supplier_company_id=partner_company.id, receiver_company_id=partner_company.id,
+            shipment_datetime=base
+        )
+
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        pages = []
+        cursor = None
+        event.listen(db.get_bind(), "before_cursor_execute", collect)
+        try:
+            for _ in range(4):
+                shipments, total, cursor = get_shipments(
+                    db, limit=2, company_id=company.id, cursor=cursor, include_total=not pages
+                )
+                if not pages:
+                    assert total == 5
+                pages.append(shipments)
+                if cursor is None:
+                    break
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", collect)
+
+        assert cursor is None
+        shipments = [shipment for page in pages for shipment in page]
+        assert len(shipments) == 5
+        assert len({shipment.id for shipment in shipments}) == 5
+        # 일시가 없는 출하가 먼저, 이후 (일시, id) 순
+        assert shipments[0].title == "역할 출하 4"
+        keys = [(shipment.shipment_datetime, str(shipment.id)) for shipment in shipments[1:]]
+        assert keys == sorted(keys)
+        assert any("UNION ALL" in statement for statement in statements)
+
+    def test_list_shipments_loads_items_in_batch(self, client, db: Session, async_bind):
+        """출하 목록 조회가 출하 수와 무관하게 출하/아이템 쿼리 각 1회로 끝나는지 테스트"""
+        from sqlalchemy import event
+
+        setup = TestDataFactory.create_complete_user_setup(db, username="viewer")
+        viewer = setup["profile"]
+        user = setup["user"]
+        supplier_company = setup["company"]
+        buyer_company = CompanyFactory.create_company(db, name="구매 회사")
+
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
+        contract = ContractFactory.create_complete_contract(
+            db, supplier_company.id, buyer_company.id, viewer.id
+        )["contract"]
+        for i in range(5):
+            ShipmentFactory.create_complete_shipment(
+                db, contract.id, viewer.id,
+                title=f"출하 {i+1}",
+                supplier_company_id=supplier_company.id,
+                receiver_company_id=buyer_company.id
+            )
+
+        statements = []
+        engine = async_bind
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            if "shipment" in statement and "count(" not in statement:
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", collect)
+        try:
+            response = client.get(
+                "/shipments/",
+                headers={"X-Profile-ID": str(viewer.id)}
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", collect)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["shipments"]) == 5
+        assert all(len(shipment["items"]) > 0 for shipment in data["shipments"])
+        assert len(statements) == 2
+
+    def test_list_shipments_resolves_profile_on_async_session(self, client, db: Session, async_bind):
+        """비동기 목록 조회는 프로필 인증도 비동기 세션에서 처리하고 동기 커넥션을 쓰지 않는지 테스트"""
+        from sqlalchemy import event
+        from app.core.auth.cache import profile_cache
+
+        setup = TestDataFactory.create_complete_user_setup(db, username="async_viewer")
+        viewer_id = setup["profile"].id
+        user_id = setup["user"].id
+
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user_id
+        profile_cache.clear()
+
+        statements = {"sync": [], "async": []}
+
+        def collector(name):
+            def collect(conn, cursor, statement, parameters, context, executemany):
+                statements[name].append(statement)
+            return collect
+
+        listeners = [(db.get_bind(), collector("sync")), (async_bind, collector("async"))]
+        for engine, listener in listeners:
+            event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = client.get("/shipments/", headers={"X-Profile-ID": str(viewer_id)})
+        finally:
+            for engine, listener in listeners:
+                event.remove(engine, "before_cursor_execute", listener)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert statements["sync"] == []
+        assert any("FROM profiles" in statement for statement in statements["async"])
+
+    def test_shipment_changes_recorded_in_inventory_ledger(self, client, db: Session):
+        """출하 생성/수정/삭제가 재고 원장에 순변동으로 기록되는지 테스트"""
+        from app.company.inventory_snapshot.crud import get_center_inventory_balance
+        from app.company.inventory_snapshot.models import InventoryLedgerEntry
+
+        setup = TestDataFactory.create_complete_user_setup(db, username="ledger")
+        profile = setup["profile"]
+        user = setup["user"]
+        company = setup["company"]
+        center = CenterFactory.create_center(db, company.id, name="원장 센터")
+        supplier_company = CompanyFactory.create_company(db, name="공급 회사")
+
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
+        contract = ContractFactory.create_contract(db, supplier_company.id, company.id, creator_id=profile.id)
+        shipment_datetime = datetime(2025, 3, 10, 9, 0)
+
+        shipment_data = {
+            "title": "입고",
+            "contract_id": str(contract.id),
+            "supplier_company_id": str(supplier_company.id),
+            "receiver_company_id": str(company.id),
+            "arrival_center_id": str(center.id),
+            "shipment_datetime": shipment_datetime.isoformat(),
+            "items": [
+                {"product_name": "쌀", "quality": "A", "quantity": 40, "unit_price": 1000.0, "total_price": 40000.0}
+            ]
+        }
+        response = client.post("/shipments/", json=shipment_data, headers={"X-Profile-ID": str(profile.id)})
+        assert response.status_code == status.HTTP_201_CREATED
+        shipment_id = response.json()["id"]
+
+        balance = get_center_inventory_balance(db, shipment_datetime.date(), company.id, center.id)
+        assert [(row.product_name, row.quantity) for row in balance] == [("쌀", 40)]
+        assert get_center_inventory_balance(db, date(2025, 3, 9), company.id, center.id) == []
+
+        shipment_data["items"][0]["quantity"] = 25
+        response = client.put(f"/shipments/{shipment_id}", json=shipment_data, headers={"X-Profile-ID": str(profile.id)})
+        assert response.status_code == status.HTTP_200_OK
+        balance = get_center_inventory_balance(db, shipment_datetime.date(), company.id, center.id)
+        assert [row.quantity for row in balance] == [25]
+        assert db.query(InventoryLedgerEntry).count() == 2
+
+        response = client.delete(f"/shipments/{shipment_id}", headers={"X-Profile-ID": str(profile.id)})
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        balance = get_center_inventory_balance(db, shipment_datetime.date(), company.id, center.id)
+        assert [row.quantity for row in balance] == [0]
+
+    def test_inventory_balance_price_follows_replay_rule(self, db: Session):
+        """원장 잔고의 단가는 처음 변동한 날의 첫 방향(출하 → 입하) 평균 단가이며, 순서가 같은 행이 있어도 하나로 정해집니다."""
+        from app.company.inventory_snapshot.crud import get_center_inventory_balance, record_inventory_movements
+
+        setup = TestDataFactory.create_complete_user_setup(db, username="ledger_price")
+        company = setup["company"]
+        center = CenterFactory.create_center(db, company.id, name="단가 센터")
+
+        def movement(movement_date, quantity_delta, unit_price):
+            return {
+                'company_id': company.id,
+                'center_id': center.id,
+                'product_name': "쌀",
+                'quality': ProductQuality.A,
+                'movement_date': movement_date,
+                'quantity_delta': quantity_delta,
+                'unit_price': unit_price,
+                'shipment_id': None
+            }
+
+        # 같은 날, 같은 수량의 입고 두 건(단가 100, 200)과 다음 날 다른 단가의 입고
+        for row in (
+            movement(date(2025, 3, 10), 10, 100.0),
+            movement(date(2025, 3, 10), 10, 200.0),
+            movement(date(2025, 3, 11), 5, 900.0),
+        ):
+            record_inventory_movements(db, [row])
+        db.commit()
+
+        balance = get_center_inventory_balance(db, date(2025, 3, 11), company.id, center.id)
+        assert [(row.quantity, row.unit_price) for row in balance] == [(25, 150.0)]
+
+        # 처음 변동한 날에 출하가 있으면 출하 쪽 단가가 먼저
+        record_inventory_movements(db, [movement(date(2025, 3, 10), -3, 50.0)])
+        db.commit()
+        balance = get_center_inventory_balance(db, date(2025, 3, 11), company.id, center.id)
+        assert [(row.quantity, row.unit_price) for row in balance] == [(22, 50.0)]
@@ -35,8 +35,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id,
@@ -96,8 +96,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
@@ -155,8 +155,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id,
@@ -202,8 +202,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id,
@@ -249,8 +249,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
@@ -299,8 +299,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         contract_data = ContractFactory.create_complete_contract(
             db, supplier_company.id, buyer_company.id, viewer.id
@@ -349,8 +349,8 @@ class TestSummaryAPI:
         )
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # 여러 날짜에 걸친 계약 생성
         start_date = date.today() - timedelta(days=2)
@@ -399,8 +399,8 @@ class TestSummaryAPI:
         viewer = setup["profile"]
         user = setup["user"]
         
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # 과거 날짜로 요약 요청 (데이터가 없을 확률이 높음)
         past_date = date.today() - timedelta(days=365)
@@ -432,8 +432,8 @@ class TestSummaryAPI:
         viewer = setup["profile"]
         user = setup["user"]
         
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # 시작일이 종료일보다 늦은 경우
         today = date.today()
@@ -475,8 +475,8 @@ class TestSummaryAPI:
         arrival_center = CenterFactory.create_center(db, buyer_company.id, "도착 센터")
         
         # 계약 생성
-        from app.core.auth.dependencies import get_current_user
-        client.app.dependency_overrides[get_current_user] = lambda: user
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
         
         # 센터 1에서 출발하는 계약
         contract1_data = ContractFactory.create_complete_contract(
@@ -523,4 +523,46 @@ class TestSummaryAPI:
         
         # 여러 센터의 데이터가 포함되어 있는지 확인
         daily_summary = data["daily_summaries"][0]
-        assert len(daily_summary["center_summaries"]) > 0 
\ No newline at end of file
+        assert len(daily_summary["center_summaries"]) > 0 
+    def test_shipment_summary_uses_whole_day_boundaries(self, client, db: Session):
+        """자정 직전/직후 출하는 각자의 날짜에만 집계됩니다."""
+        setup = TestDataFactory.create_complete_user_setup(db, username="viewer")
+        viewer = setup["profile"]
+        user = setup["user"]
+        supplier_company = setup["company"]
+        buyer_company = CompanyFactory.create_company(db, name="구매 회사")
+        departure_center = CenterFactory.create_center(db, supplier_company.id, "출발 센터")
+        arrival_center = CenterFactory.create_center(db, buyer_company.id, "도착 센터")
+
+        from app.core.auth.dependencies import get_current_user_id
+        client.app.dependency_overrides[get_current_user_id] = lambda: user.id
+
+        contract = ContractFactory.create_complete_contract(
+            db, supplier_company.id, buyer_company.id, viewer.id
+        )["contract"]
+        first_day = date(2025, 1, 31)
+        for shipment_datetime, quantity in (
+            (datetime(2025, 1, 31, 23, 59, 59), 7),
+            (datetime(2025, 2, 1, 0, 0, 0), 3),
+        ):
+            ShipmentFactory.create_complete_shipment(
+                db, contract.id, viewer.id,
+                items_data=[{"product_name": "쌀", "quantity": quantity, "quality": "A", "unit_price": 1000.0}],
+                supplier_company_id=supplier_company.id,
+                receiver_company_id=buyer_company.id,
+                departure_center_id=departure_center.id,
+                arrival_center_id=arrival_center.id,
+                shipment_datetime=shipment_datetime
+            )
+
+        response = client.get(
+            f"/summary/shipments/outbound?start_date={first_day.isoformat()}&end_date=2025-02-01",
+            headers={"X-Profile-ID": str(viewer.id)}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        quantities = {
+            summary["date"]: [item["quantity"] for center in summary["center_summaries"] for item in center["items"]]
+            for summary in response.json()["daily_summaries"]
+        }
+        assert quantities == {"2025-01-31": [7], "2025-02-01": [3]}